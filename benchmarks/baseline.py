@@ -0,0 +1,416 @@
+"""
+Implementaciones de referencia que recorren la muestra número por número, sobre listas de Python.
+
+Las pruebas de medias, varianza, Kolmogorov-Smirnov, chi-cuadrado y póker son copias de la versión original del
+programa; las demás, que no existían en ella, cuentan tuplas, rachas, productos, huecos y segmentos con un recorrido
+directo. Sirven como punto de comparación en battery_benchmark.py y como resultado esperado en las pruebas
+automáticas.
+"""
+import math
+import statistics
+from collections import Counter
+
+import numpy as np
+from scipy.stats import chi2, norm
+
+ALPHA = 0.05
+DMAXP = 0.1885
+POKER_PROBABILITIES = {
+    'Todos diferentes': 0.3024,
+    'Un par': 0.5040,
+    'Dos pares': 0.1080,
+    'Tercia': 0.0720,
+    'Full': 0.0090,
+    'Poker': 0.0045,
+    'Quintillas': 0.0001,
+}
+
+
+def truncate(number):
+    """
+    Trunca un número a 5 decimales como MathUtils.truncate.
+
+    Args:
+        number (float): Número a truncar.
+
+    Returns:
+        float: Número con 5 decimales.
+    """
+    return float(f'{number:.5f}')
+
+
+def baseline_mean(numbers):
+    """
+    Prueba de medias de la versión original.
+
+    Args:
+        numbers (list): Números pseudoaleatorios.
+
+    Returns:
+        tuple: Veredicto, media, límite inferior y límite superior.
+    """
+    n = len(numbers)
+    r = statistics.mean(numbers)
+    zeta = norm.ppf(1 - ALPHA / 2)
+    lower_limit = 0.5 - zeta * (1 / math.sqrt(12 * n))
+    higher_limit = 0.5 + zeta * (1 / math.sqrt(12 * n))
+    return lower_limit <= r <= higher_limit, r, lower_limit, higher_limit
+
+
+def baseline_variance(numbers):
+    """
+    Prueba de varianza de la versión original.
+
+    Args:
+        numbers (list): Números pseudoaleatorios.
+
+    Returns:
+        tuple: Veredicto, varianza, menor límite y mayor límite, truncados a 5 decimales.
+    """
+    n = len(numbers) - 1
+    variance = truncate(np.var(numbers))
+    lower_limit = truncate(truncate(chi2.ppf(1 - ALPHA / 2, n)) / (12 * n))
+    upper_limit = truncate(truncate(chi2.ppf(ALPHA / 2, n)) / (12 * n))
+    return upper_limit <= variance <= lower_limit, variance, upper_limit, lower_limit
+
+
+def baseline_ks(numbers, intervals_amount=10):
+    """
+    Prueba de Kolmogorov-Smirnov de la versión original.
+
+    Args:
+        numbers (list): Números pseudoaleatorios.
+        intervals_amount (int): Cantidad de intervalos.
+
+    Returns:
+        tuple: Veredicto, frecuencia de cada intervalo y máxima diferencia.
+    """
+    intervals = []
+    aux = 0
+    for _ in range(intervals_amount):
+        aux += 1 / intervals_amount
+        intervals.append(round(aux, 2))
+    frequencies = [0] * intervals_amount
+    for number in numbers:
+        for i, interval in enumerate(intervals):
+            if number < interval:
+                frequencies[i] += 1
+                break
+    accumulated = 0
+    differences = []
+    for i, frequency in enumerate(frequencies):
+        accumulated += frequency
+        differences.append(round(abs((i + 1) / intervals_amount - accumulated / len(numbers)), 5))
+    max_difference = max(differences)
+    return not max_difference > DMAXP, frequencies, max_difference
+
+
+def baseline_chi(numbers, intervals_amount=10):
+    """
+    Prueba de chi-cuadrado de la versión original, con intervalos entre el mínimo y el máximo.
+
+    Args:
+        numbers (list): Números pseudoaleatorios.
+        intervals_amount (int): Cantidad de intervalos.
+
+    Returns:
+        tuple: Veredicto, frecuencia de cada intervalo y estadístico.
+    """
+    min_value = min(numbers)
+    interval_size = (max(numbers) - min_value) / intervals_amount
+    frequencies = [0] * intervals_amount
+    for number in numbers:
+        frequencies[min(int((number - min_value) // interval_size), intervals_amount - 1)] += 1
+    expected = len(numbers) / intervals_amount
+    total_error = sum((frequency - expected) ** 2 / expected for frequency in frequencies)
+    return total_error < chi2.isf(ALPHA, intervals_amount - 1), frequencies, total_error
+
+
+def classify_hand(digits):
+    """
+    Clasifica una mano de 5 dígitos como la versión original.
+
+    Args:
+        digits (str): Dígitos de la mano.
+
+    Returns:
+        str: Categoría de la mano.
+    """
+    counts = Counter(digits).values()
+    if len(counts) == 5:
+        return 'Todos diferentes'
+    if len(counts) == 4:
+        return 'Un par'
+    if len(counts) == 3:
+        return 'Tercia' if 3 in counts else 'Dos pares'
+    if len(counts) == 2:
+        return 'Poker' if 4 in counts else 'Full'
+    return 'Quintillas'
+
+
+def baseline_poker(numbers):
+    """
+    Prueba de póker de la versión original, que lee los 5 primeros decimales del texto de cada número.
+
+    Args:
+        numbers (list): Números pseudoaleatorios.
+
+    Returns:
+        tuple: Veredicto, cantidad de manos de cada categoría y estadístico.
+    """
+    hands = [str(number % 1)[2:7].ljust(5, '0') for number in numbers]
+    category_counts = Counter(map(classify_hand, hands))
+    category_counts = {category: category_counts[category] for category in POKER_PROBABILITIES}
+    chi_squared = 0
+    for category, probability in POKER_PROBABILITIES.items():
+        expected = probability * len(hands)
+        chi_squared += (category_counts[category] - expected) ** 2 / expected
+    return chi_squared < chi2.isf(ALPHA, 6), category_counts, chi_squared
+
+
+def interval(number, bins):
+    """
+    Obtiene el intervalo de [0, 1) de un número comparándolo con los límites j / bins.
+
+    Args:
+        number (float): Número.
+        bins (int): Cantidad de intervalos.
+
+    Returns:
+        int: Intervalo, entre 0 y bins - 1.
+    """
+    return sum(number >= j / bins for j in range(1, bins))
+
+
+def chi_squared_statistic(observed, expected):
+    """
+    Calcula el estadístico chi-cuadrado de frecuencias observadas y esperadas.
+
+    Args:
+        observed (list): Frecuencias observadas.
+        expected (list): Frecuencias esperadas.
+
+    Returns:
+        float: Suma de (O - E) ** 2 / E.
+    """
+    return sum((o - e) ** 2 / e for o, e in zip(observed, expected))
+
+
+def tuple_counts(numbers, bins, order, step):
+    """
+    Cuenta las tuplas de order números consecutivos en cada celda de la cuadrícula.
+
+    Args:
+        numbers (list): Números pseudoaleatorios.
+        bins (int): Intervalos por dimensión.
+        order (int): Números por tupla.
+        step (int): Distancia entre el inicio de dos tuplas; 1 para tuplas solapadas.
+
+    Returns:
+        dict: Frecuencia de cada celda ocupada, indexada por la tupla de intervalos.
+    """
+    counts = {}
+    for start in range(0, len(numbers) - order + 1, step):
+        cell = tuple(interval(number, bins) for number in numbers[start:start + order])
+        counts[cell] = counts.get(cell, 0) + 1
+    return counts
+
+
+def uniform_psi_squared(counts, cells):
+    """
+    Calcula el chi-cuadrado de las frecuencias de una cuadrícula cuyas celdas son igual de probables.
+
+    Args:
+        counts (dict): Frecuencia de cada celda ocupada.
+        cells (int): Cantidad de celdas de la cuadrícula.
+
+    Returns:
+        float: Estadístico chi-cuadrado.
+    """
+    total = sum(counts.values())
+    return chi_squared_statistic(list(counts.values()) + [0] * (cells - len(counts)), [total / cells] * cells)
+
+
+def reference_serial(numbers, bins=10, dimensions=2, overlapping=False):
+    """
+    Prueba serial contando cada tupla; con overlapping, resta el estadístico de las tuplas de dimensions - 1.
+
+    Args:
+        numbers (list): Números pseudoaleatorios.
+        bins (int): Intervalos por dimensión.
+        dimensions (int): Números por tupla.
+        overlapping (bool): True para una tupla por número.
+
+    Returns:
+        tuple: Veredicto, frecuencia de cada celda ocupada, estadístico y grados de libertad.
+    """
+    counts = tuple_counts(numbers, bins, dimensions, 1 if overlapping else dimensions)
+    statistic = uniform_psi_squared(counts, bins ** dimensions)
+    degrees_of_freedom = bins ** dimensions - 1
+    if overlapping:
+        statistic -= uniform_psi_squared(tuple_counts(numbers, bins, dimensions - 1, 1), bins ** (dimensions - 1))
+        degrees_of_freedom -= bins ** (dimensions - 1) - 1
+    return statistic < chi2.isf(ALPHA, degrees_of_freedom), counts, statistic, degrees_of_freedom
+
+
+def count_runs(labels):
+    """
+    Cuenta las rachas de etiquetas iguales consecutivas.
+
+    Args:
+        labels (list): Etiqueta de cada elemento.
+
+    Returns:
+        int: Cantidad de rachas.
+    """
+    return 1 + sum(current != following for current, following in zip(labels, labels[1:]))
+
+
+def reference_runs_up_down(numbers):
+    """
+    Prueba de rachas ascendentes y descendentes contando cada racha.
+
+    Args:
+        numbers (list): Números pseudoaleatorios.
+
+    Returns:
+        tuple: Veredicto, cantidad de rachas y estadístico z.
+    """
+    n = len(numbers)
+    runs = count_runs([following > current for current, following in zip(numbers, numbers[1:])])
+    z = (runs - (2 * n - 1) / 3) / math.sqrt((16 * n - 29) / 90)
+    return abs(z) <= norm.ppf(1 - ALPHA / 2), runs, z
+
+
+def reference_runs_above_below(numbers):
+    """
+    Prueba de rachas por encima y por debajo de la media contando cada racha.
+
+    Args:
+        numbers (list): Números pseudoaleatorios.
+
+    Returns:
+        tuple: Veredicto, números no menores que 0.5, cantidad de rachas y estadístico z.
+    """
+    n = len(numbers)
+    above = sum(number >= 0.5 for number in numbers)
+    below = n - above
+    runs = count_runs([number >= 0.5 for number in numbers])
+    expected_runs = 2 * above * below / n + 0.5
+    variance = 2 * above * below * (2 * above * below - n) / (n ** 2 * (n - 1))
+    z = (runs - expected_runs) / math.sqrt(variance)
+    return abs(z) <= norm.ppf(1 - ALPHA / 2), above, runs, z
+
+
+def reference_autocorrelation(numbers, max_lag=10):
+    """
+    Prueba de autocorrelación sumando el producto de cada par de números a distancia 1 a max_lag.
+
+    Args:
+        numbers (list): Números pseudoaleatorios.
+        max_lag (int): Mayor distancia.
+
+    Returns:
+        tuple: Veredicto, correlación con cada distancia y estadístico chi-cuadrado.
+    """
+    centered = [number - 0.5 for number in numbers]
+    correlations = []
+    statistic = 0.0
+    for lag in range(1, max_lag + 1):
+        pairs = len(numbers) - lag
+        correlations.append(12 * math.fsum(centered[i] * centered[i + lag] for i in range(pairs)) / pairs)
+        statistic += correlations[-1] ** 2 * pairs
+    return statistic < chi2.isf(ALPHA, max_lag), correlations, statistic
+
+
+def reference_gap(numbers, lower=0.0, upper=0.5, max_gap=5):
+    """
+    Prueba de huecos midiendo cada hueco entre dos números de [lower, upper).
+
+    Args:
+        numbers (list): Números pseudoaleatorios.
+        lower (float): Límite inferior del intervalo.
+        upper (float): Límite superior del intervalo, excluido.
+        max_gap (int): Longitud desde la que los huecos se cuentan juntos.
+
+    Returns:
+        tuple: Veredicto, huecos de cada longitud, huecos esperados y estadístico chi-cuadrado.
+    """
+    observed = [0] * (max_gap + 1)
+    gap = None
+    for number in numbers:
+        if lower <= number < upper:
+            if gap is not None:
+                observed[min(gap, max_gap)] += 1
+            gap = 0
+        elif gap is not None:
+            gap += 1
+    p = upper - lower
+    probabilities = [p * (1 - p) ** length for length in range(max_gap)] + [(1 - p) ** max_gap]
+    expected = [probability * sum(observed) for probability in probabilities]
+    statistic = chi_squared_statistic(observed, expected)
+    return statistic < chi2.isf(ALPHA, max_gap), observed, expected, statistic
+
+
+def stirling(n, k):
+    """
+    Calcula el número de Stirling de segunda especie: las formas de repartir n elementos en k grupos no vacíos.
+
+    Args:
+        n (int): Elementos.
+        k (int): Grupos.
+
+    Returns:
+        int: Número de Stirling.
+    """
+    table = [[1] + [0] * k] + [[0] * (k + 1) for _ in range(n)]
+    for i in range(1, n + 1):
+        for j in range(1, k + 1):
+            table[i][j] = j * table[i - 1][j] + table[i - 1][j - 1]
+    return table[n][k]
+
+
+def reference_coupon(numbers, coupons=5, max_length=20):
+    """
+    Prueba del coleccionista de cupones midiendo cada segmento hasta ver los coupons valores.
+
+    Args:
+        numbers (list): Números pseudoaleatorios.
+        coupons (int): Cantidad de valores.
+        max_length (int): Longitud desde la que los segmentos se cuentan juntos.
+
+    Returns:
+        tuple: Veredicto, segmentos de cada longitud, segmentos esperados y estadístico chi-cuadrado.
+    """
+    observed = [0] * (max_length - coupons + 1)
+    seen, length = set(), 0
+    for number in numbers:
+        seen.add(interval(number, coupons))
+        length += 1
+        if len(seen) == coupons:
+            observed[min(length, max_length) - coupons] += 1
+            seen, length = set(), 0
+    # Un segmento mide r números si los r - 1 primeros muestran exactamente coupons - 1 valores y el último, el que
+    # faltaba
+    probabilities = [math.factorial(coupons) * stirling(r - 1, coupons - 1) / coupons ** r
+                     for r in range(coupons, max_length)]
+    probabilities.append(1 - math.fsum(probabilities))
+    expected = [probability * sum(observed) for probability in probabilities]
+    statistic = chi_squared_statistic(observed, expected)
+    return statistic < chi2.isf(ALPHA, max_length - coupons), observed, expected, statistic
+
+
+# Implementación de referencia de cada prueba de Tests.TEST_NAMES, con sus parámetros por defecto
+REFERENCES = {
+    'mean': baseline_mean,
+    'variance': baseline_variance,
+    'ks': baseline_ks,
+    'chi': baseline_chi,
+    'poker': baseline_poker,
+    'serial': reference_serial,
+    'runs_up_down': reference_runs_up_down,
+    'runs_above_below': reference_runs_above_below,
+    'autocorrelation': reference_autocorrelation,
+    'gap': reference_gap,
+    'coupon': reference_coupon,
+}
@@ -0,0 +1,348 @@
+import argparse
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np  # noqa: E402
+
+from benchmarks.baseline import REFERENCES  # noqa: E402
+from model.AutocorrelationTest import AutocorrelationTest  # noqa: E402
+from model.ChiTest import ChiTest  # noqa: E402
+from model.CouponTest import CouponTest  # noqa: E402
+from model.GapTest import GapTest  # noqa: E402
+from model.KsTest import KsTest  # noqa: E402
+from model.MeanTest import MeanTest  # noqa: E402
+from model.PokerTest import PokerTest  # noqa: E402
+from model.RunsAboveBelowTest import RunsAboveBelowTest  # noqa: E402
+from model.RunsUpDownTest import RunsUpDownTest  # noqa: E402
+from model.SerialTest import SerialTest  # noqa: E402
+from model.Tests import Tests  # noqa: E402
+from model.VarianceTest import VarianceTest  # noqa: E402
+from model.util.DataLoader import DataLoader  # noqa: E402
+
+SIZES = tuple(10 ** exponent for exponent in range(3, 9))
+WARM_UP_SIZE = 1000
+# Las implementaciones de referencia recorren la batería a unos 100 000 números por segundo; por encima de este tamaño
+# cada caso 'list' tardaría varios minutos
+LIST_LIMIT = 10 ** 6
+
+
+def prepare_test(name, test_class, method, *arguments):
+    """
+    Crea la función que prepara la medición de una prueba individual.
+
+    Args:
+        name (str): Nombre de la prueba en benchmarks.baseline.REFERENCES.
+        test_class (type): Clase de la prueba.
+        method (str): Método que la ejecuta.
+        *arguments: Argumentos del constructor.
+
+    Returns:
+        callable: Función que recibe la muestra y devuelve la operación a medir. Con 'list' mide la implementación
+        de referencia, que recorre la lista número por número; con 'array', la clase de la prueba, incluida la
+        conversión de la muestra.
+    """
+    def prepare(sample, variant):
+        if variant == 'list':
+            return lambda: REFERENCES[name](sample)
+        test = test_class(*arguments)
+        return lambda: (test.set_pseudo_random_numbers(sample), getattr(test, method)())
+    return prepare
+
+
+def prepare_battery(sample, variant):
+    """
+    Prepara la medición de la batería completa con una instancia nueva de Tests en cada repetición.
+
+    Args:
+        sample (list | numpy.ndarray): Muestra.
+        variant (str): 'list' ejecuta una tras otra las implementaciones de referencia; 'parallel' reparte el resumen
+            entre todos los núcleos aunque la muestra sea pequeña.
+
+    Returns:
+        callable: Operación a medir.
+    """
+    if variant == 'list':
+        return lambda: [REFERENCES[name](sample) for name in Tests.TEST_NAMES]
+    workers = (os.cpu_count() or 1) if variant == 'parallel' else 1
+
+    def run():
+        tests = Tests(workers=workers)
+        if workers > 1:
+            tests.PARALLEL_THRESHOLD = 0
+        tests.set_pseudo_random_numbers(sample)
+        for name in Tests.TEST_NAMES:
+            getattr(tests, f'execute_{name}_test')()
+    return run
+
+
+def prepare_load(sample, variant):
+    """
+    Escribe la muestra en un archivo JSON temporal y prepara la medición de su carga.
+
+    Args:
+        sample (list | numpy.ndarray): Muestra.
+        variant (str): 'list' carga con json.load como el código original; 'array' usa DataLoader.
+
+    Returns:
+        callable: Operación a medir.
+    """
+    values = np.asarray(sample)
+    file_path = os.path.join(tempfile.mkdtemp(), 'numbers.json')
+    with open(file_path, 'w') as file:
+        # La misma estructura {"numbers": [...]} que describe el README
+        file.write('{"numbers": [')
+        for start in range(0, len(values), 1 << 20):
+            if start:
+                file.write(', ')
+            file.write(', '.join(map(repr, values[start:start + (1 << 20)].tolist())))
+        file.write(']}')
+
+    def load():
+        if variant == 'list':
+            with open(file_path, 'r') as file:
+                return json.load(file)['numbers']
+        return DataLoader.load(file_path)[0]
+    return load
+
+
+# Cada caso indica cómo preparar la operación a medir y las formas en que recibe la muestra. 'list' mide las
+# implementaciones de benchmarks/baseline.py, que recorren una lista de Python número por número: la versión original
+# de las cinco primeras pruebas y un recorrido directo de las demás, y carga con json.load. 'array' mide las clases
+# de model/ con arreglos float64 y DataLoader, y 'parallel' reparte la batería entre procesos.
+BENCHMARKS = {
+    'mean': (prepare_test('mean', MeanTest, 'execute_test'), ('list', 'array')),
+    'variance': (prepare_test('variance', VarianceTest, 'execute_test'), ('list', 'array')),
+    'ks': (prepare_test('ks', KsTest, 'execute_test', 10), ('list', 'array')),
+    'chi': (prepare_test('chi', ChiTest, 'execute_chi_test', 10), ('list', 'array')),
+    'poker': (prepare_test('poker', PokerTest, 'execute_poker_test'), ('list', 'array')),
+    'serial': (prepare_test('serial', SerialTest, 'execute_test'), ('list', 'array')),
+    'runs_up_down': (prepare_test('runs_up_down', RunsUpDownTest, 'execute_test'), ('list', 'array')),
+    'runs_above_below': (prepare_test('runs_above_below', RunsAboveBelowTest, 'execute_test'), ('list', 'array')),
+    'autocorrelation': (prepare_test('autocorrelation', AutocorrelationTest, 'execute_test'), ('list', 'array')),
+    'gap': (prepare_test('gap', GapTest, 'execute_test'), ('list', 'array')),
+    'coupon': (prepare_test('coupon', CouponTest, 'execute_test'), ('list', 'array')),
+    'load_data': (prepare_load, ('list', 'array')),
+    'battery': (prepare_battery, ('list', 'array', 'parallel')),
+}
+
+
+def make_sample(variant, size):
+    """
+    Genera la muestra sintética de un caso, siempre con la misma semilla.
+
+    Args:
+        variant (str): Forma de la muestra; 'list' la entrega como lista de Python.
+        size (int): Cantidad de números.
+
+    Returns:
+        list | numpy.ndarray: Números uniformes en [0, 1).
+    """
+    sample = np.random.default_rng(0).random(size)
+    return sample.tolist() if variant == 'list' else sample
+
+
+def peak_rss():
+    """
+    Obtiene la memoria residente máxima del proceso actual.
+
+    Returns:
+        int: Bytes.
+    """
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def measure_case(benchmark, variant, size, repeat):
+    """
+    Mide un caso en el proceso actual: tiempo de varias repeticiones, memoria residente y asignaciones.
+
+    Antes de medir se ejecuta el caso con una muestra pequeña para que las importaciones diferidas y las cachés
+    de valores críticos no cuenten en la primera repetición. Las asignaciones se miden en una ejecución aparte con
+    tracemalloc, porque el rastreo hace más lenta la operación.
+
+    Args:
+        benchmark (str): Nombre del caso.
+        variant (str): Variante del caso.
+        size (int): Cantidad de números.
+        repeat (int): Repeticiones cronometradas.
+
+    Returns:
+        dict: Tiempos, rendimiento en números por segundo y memoria del caso.
+    """
+    prepare = BENCHMARKS[benchmark][0]
+    prepare(make_sample(variant, WARM_UP_SIZE), variant)()
+
+    operation = prepare(make_sample(variant, size), variant)
+    rss_before = peak_rss()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        operation()
+        samples.append(time.perf_counter() - start)
+    rss_after = peak_rss()
+
+    tracemalloc.start()
+    operation()
+    allocated = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    best = min(samples)
+    return {
+        'benchmark': benchmark,
+        'variant': variant,
+        'size': size,
+        'seconds_min': best,
+        'seconds_median': statistics.median(samples),
+        'numbers_per_second': size / best if best > 0 else None,
+        'peak_rss_bytes': rss_after,
+        'rss_growth_bytes': rss_after - rss_before,
+        'peak_allocated_bytes': allocated,
+    }
+
+
+def run_case(benchmark, variant, size, repeat):
+    """
+    Mide un caso en un intérprete nuevo para que la memoria y las cachés de un caso no afecten a los demás.
+
+    Args:
+        benchmark (str): Nombre del caso.
+        variant (str): Variante del caso.
+        size (int): Cantidad de números.
+        repeat (int): Repeticiones cronometradas.
+
+    Returns:
+        dict: Resultado de measure_case, o el caso con un mensaje de error si el proceso falló.
+    """
+    process = subprocess.run([sys.executable, os.path.abspath(__file__), '--case', benchmark, variant, str(size),
+                              '--repeat', str(repeat)], cwd=ROOT, capture_output=True, text=True)
+    if process.returncode != 0:
+        error = process.stderr.strip().splitlines()
+        return {'benchmark': benchmark, 'variant': variant, 'size': size,
+                'error': error[-1] if error else f"exit status {process.returncode}"}
+    return json.loads(process.stdout.splitlines()[-1])
+
+
+def describe_environment():
+    """
+    Describe la versión del código y del entorno para poder comparar resultados entre versiones.
+
+    Returns:
+        dict: Commit de git, versiones de Python, numpy y scipy, plataforma y cantidad de núcleos.
+    """
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                                text=True).stdout.strip() or None
+    except OSError:
+        commit = None
+    try:
+        import scipy
+        scipy_version = scipy.__version__
+    except ImportError:
+        scipy_version = None
+    return {
+        'commit': commit,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'scipy': scipy_version,
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+
+
+def compare(previous, current, tolerance):
+    """
+    Compara dos ejecuciones caso por caso.
+
+    Args:
+        previous (dict): Resultados de la versión de referencia.
+        current (dict): Resultados de la versión nueva.
+        tolerance (float): Fracción de pérdida de rendimiento a partir de la cual un caso se marca como regresión.
+
+    Returns:
+        list: Por cada caso presente en ambas, su clave, la razón entre rendimientos y si es una regresión.
+    """
+    def index(results):
+        return {(result['benchmark'], result['variant'], result['size']): result for result in results['results']
+                if result.get('numbers_per_second')}
+
+    before, after = index(previous), index(current)
+    rows = []
+    for key in sorted(before.keys() & after.keys()):
+        ratio = after[key]['numbers_per_second'] / before[key]['numbers_per_second']
+        rows.append({'case': key, 'ratio': ratio, 'regression': ratio < 1 - tolerance})
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Measure throughput and memory of each test and the full battery across sample sizes.")
+    parser.add_argument('-b', '--benchmark', action='append', choices=sorted(BENCHMARKS),
+                        help="benchmark to run; may be repeated (default: all)")
+    parser.add_argument('--variant', action='append', choices=('list', 'array', 'parallel'),
+                        help="input path to run; may be repeated (default: all)")
+    parser.add_argument('--max-size', type=float, default=SIZES[-1], help="largest sample size (default: 1e8)")
+    parser.add_argument('--list-limit', type=float, default=LIST_LIMIT,
+                        help="largest sample size for the list path (default: 1e6)")
+    parser.add_argument('-n', '--repeat', type=int, default=3, help="timed runs per case")
+    parser.add_argument('-o', '--output', help="write the results as JSON to this file")
+    parser.add_argument('--compare', metavar='PREVIOUS_JSON',
+                        help="compare against earlier results and exit with status 1 on regressions")
+    parser.add_argument('--tolerance', type=float, default=0.1,
+                        help="throughput loss counted as a regression (default: 0.1)")
+    parser.add_argument('--case', nargs=3, metavar=('BENCHMARK', 'VARIANT', 'SIZE'), help=argparse.SUPPRESS)
+    arguments = parser.parse_args(argv)
+
+    if arguments.case:
+        benchmark, variant, size = arguments.case
+        print(json.dumps(measure_case(benchmark, variant, int(size), arguments.repeat)))
+        return 0
+
+    results = {'environment': describe_environment(), 'results': []}
+    for benchmark in arguments.benchmark or list(BENCHMARKS):
+        for variant in BENCHMARKS[benchmark][1]:
+            if arguments.variant and variant not in arguments.variant:
+                continue
+            limit = min(arguments.list_limit, arguments.max_size) if variant == 'list' else arguments.max_size
+            for size in (size for size in SIZES if size <= limit):
+                result = run_case(benchmark, variant, size, arguments.repeat)
+                results['results'].append(result)
+                if 'error' in result:
+                    print(f"{benchmark:>9} {variant:>8} {size:>11,}: error: {result['error']}", file=sys.stderr)
+                else:
+                    print(f"{benchmark:>9} {variant:>8} {size:>11,}: {result['seconds_min'] * 1000:10.1f} ms, "
+                          f"{result['numbers_per_second'] / 1e6:8.2f} M numbers/s, "
+                          f"peak RSS {result['peak_rss_bytes'] / 2 ** 20:8.1f} MB, "
+                          f"allocated {result['peak_allocated_bytes'] / 2 ** 20:8.1f} MB", file=sys.stderr)
+
+    if arguments.output:
+        with open(arguments.output, 'w') as file:
+            json.dump(results, file, indent=2)
+            file.write('\n')
+    else:
+        print(json.dumps(results, indent=2))
+
+    if arguments.compare:
+        with open(arguments.compare, 'r') as file:
+            rows = compare(json.load(file), results, arguments.tolerance)
+        for row in rows:
+            benchmark, variant, size = row['case']
+            mark = '  REGRESSION' if row['regression'] else ''
+            print(f"{benchmark:>9} {variant:>8} {size:>11,}: {row['ratio']:6.2f}x{mark}", file=sys.stderr)
+        return 1 if any(row['regression'] for row in rows) else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,109 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Cada escenario se ejecuta en un intérprete nuevo e imprime el instante en que alcanza su objetivo
+SCENARIOS = {
+    'import_model': """
+import time
+from model.Tests import Tests
+print(time.time())
+""",
+    'first_result': """
+import time
+import numpy as np
+from model.Tests import Tests
+tests = Tests()
+tests.set_pseudo_random_numbers(np.random.default_rng(0).random(10000))
+for test_name in Tests.TEST_NAMES:
+    getattr(tests, f'execute_{test_name}_test')()
+print(time.time())
+""",
+    'first_window': """
+import sys
+import time
+try:
+    from PyQt6.QtWidgets import QApplication
+except ImportError:
+    sys.exit(3)
+from model.Tests import Tests
+from presenter.Presenter import Presenter
+from view.MainFrame import MainFrame
+app = QApplication(sys.argv)
+presenter = Presenter(MainFrame(), Tests())
+presenter.run()
+app.processEvents()
+print(time.time())
+""",
+}
+SKIPPED = 3
+
+
+def measure(code):
+    """
+    Ejecuta un escenario en un proceso nuevo y mide cuánto tarda en alcanzar su objetivo.
+
+    Args:
+        code (str): Código del escenario.
+
+    Returns:
+        float | None: Segundos desde que se lanzó el proceso, o None si el escenario no puede ejecutarse aquí.
+    """
+    environment = dict(os.environ, QT_QPA_PLATFORM=os.environ.get('QT_QPA_PLATFORM', 'offscreen'))
+    start = time.time()
+    process = subprocess.run([sys.executable, '-c', code], cwd=ROOT, env=environment, capture_output=True, text=True)
+    if process.returncode == SKIPPED:
+        return None
+    if process.returncode != 0:
+        raise RuntimeError(process.stderr.strip())
+    return float(process.stdout.split()[-1]) - start
+
+
+def run(scenarios, repeat):
+    """
+    Mide cada escenario varias veces.
+
+    Args:
+        scenarios (list): Nombres de los escenarios.
+        repeat (int): Repeticiones por escenario.
+
+    Returns:
+        dict: Mínimo, mediana y muestras en segundos de cada escenario, o None si se omitió.
+    """
+    results = {}
+    for name in scenarios:
+        samples = [measure(SCENARIOS[name]) for _ in range(repeat)]
+        if None in samples:
+            results[name] = None
+        else:
+            results[name] = {'min': min(samples), 'median': statistics.median(samples), 'samples': samples}
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure cold-start time to first window and first result.")
+    parser.add_argument('-n', '--repeat', type=int, default=5, help="runs per scenario")
+    parser.add_argument('-s', '--scenario', action='append', choices=sorted(SCENARIOS),
+                        help="scenario to run; may be repeated (default: all)")
+    parser.add_argument('--json', action='store_true', help="print the results as JSON")
+    arguments = parser.parse_args(argv)
+
+    results = run(arguments.scenario or list(SCENARIOS), arguments.repeat)
+    if arguments.json:
+        print(json.dumps(results, indent=2))
+        return
+    for name, result in results.items():
+        if result is None:
+            print(f"{name:>14}: skipped (PyQt6 is not installed)")
+        else:
+            print(f"{name:>14}: median {result['median'] * 1000:7.1f} ms, min {result['min'] * 1000:7.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,306 @@
+import argparse
+import asyncio
+import contextlib
+import csv
+import json
+import os
+import sys
+
+from model.BatchRunner import BatchRunner, run_file
+from model.Constants import Constants
+from model.StreamIngestor import StreamIngestor
+from model.Tests import Tests
+from model.util.ChunkedSample import ChunkedSample
+from model.util.DataLoader import DataLoader
+from model.util.Instrumentation import Instrumentation
+
+TEST_NAMES = ('mean', 'variance', 'ks', 'ks_exact', 'chi', 'poker', 'serial', 'runs_up_down', 'runs_above_below',
+              'autocorrelation', 'gap', 'coupon')
+CSV_FIELDS = ('file', 'count', 'load_seconds', 'summary_seconds', 'test', 'passed', 'seconds', 'statistic',
+              'lower_limit', 'upper_limit', 'p_value', 'error')
+
+
+def write_windows(file_path, window_size, stride, chunk_size, output):
+    """
+    Evalúa las pruebas sobre ventanas deslizantes de un archivo y escribe una línea JSON por ventana a medida que
+    se completan.
+
+    Args:
+        file_path (str): Ruta del archivo con los números.
+        window_size (int): Cantidad de números por ventana.
+        stride (int): Cantidad de números que avanza la ventana.
+        chunk_size (int, opcional): Si se indica, el archivo se lee por bloques de este tamaño sin cargarlo completo.
+        output (io.TextIOBase): Archivo de salida.
+
+    Returns:
+        bool: True si todas las pruebas de todas las ventanas pasaron.
+    """
+    all_passed = True
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            numbers = ChunkedSample(file_path, chunk_size) if chunk_size else DataLoader.load(file_path)[0]
+            for result in Tests().iter_windows(numbers, window_size, stride):
+                all_passed = all_passed and all(test['passed'] for test in result['tests'].values())
+                output.write(json.dumps({'file': file_path, **result}) + '\n')
+                output.flush()
+    except Exception as e:
+        print(f"Error al procesar el archivo {file_path}: {e}", file=sys.stderr)
+        return False
+    return all_passed
+
+
+def write_stream(source, dtype, report_interval, output):
+    """
+    Lee números de una fuente continua y escribe una línea JSON con las estadísticas acumuladas cada
+    report_interval segundos y otra al terminar. Ctrl+C deja de leer y escribe el resultado final.
+
+    Args:
+        source (str): 'stdin', 'tcp://host:puerto', 'unix://ruta', 'tail://ruta' o la ruta de un archivo.
+        dtype (str, opcional): Tipo de los datos binarios, por ejemplo '<f8'; None para texto.
+        report_interval (float): Segundos entre líneas intermedias.
+        output (io.TextIOBase): Archivo de salida.
+
+    Returns:
+        bool: True si todas las pruebas del resultado final pasaron.
+    """
+    ingestor = StreamIngestor(Tests(), dtype)
+
+    def report():
+        snapshot = ingestor.snapshot()
+        output.write(json.dumps({'source': source, **snapshot}) + '\n')
+        output.flush()
+        return snapshot
+
+    async def report_periodically():
+        while True:
+            await asyncio.sleep(report_interval)
+            report()
+
+    async def run():
+        reporter = asyncio.create_task(report_periodically())
+        try:
+            await ingestor.run(source)
+        finally:
+            reporter.cancel()
+
+    with contextlib.redirect_stdout(sys.stderr):
+        try:
+            asyncio.run(run())
+        except KeyboardInterrupt:
+            pass
+        except Exception as e:
+            print(f"Error al leer la fuente {source}: {e}", file=sys.stderr)
+            report()
+            return False
+        snapshot = report()
+    return 'tests' in snapshot and all(test['passed'] for test in snapshot['tests'].values())
+
+
+def run_batch(arguments):
+    """
+    Ejecuta las pruebas sobre todos los archivos de los directorios o patrones indicados y escribe el informe.
+
+    Args:
+        arguments (argparse.Namespace): Argumentos interpretados.
+
+    Returns:
+        int: Código de salida del proceso.
+    """
+    files = BatchRunner.collect_files(arguments.files)
+    runner = BatchRunner(arguments.tests, arguments.workers, alphas=arguments.alpha)
+    if arguments.chunk_size:
+        runner.chunk_size = arguments.chunk_size
+        runner.large_file_size = 0
+
+    def progress(row, finished, total):
+        status = 'error' if row['error'] else 'ok' if row['passed'] else f"falló {row['failed_tests']}"
+        print(f"[{finished}/{total}] {row['file']}: {status}", file=sys.stderr)
+
+    try:
+        report = runner.run(files, arguments.batch, arguments.resume, progress)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        print(f"Interrumpido; las filas terminadas quedaron en {arguments.batch}, use --resume para continuar",
+              file=sys.stderr)
+        return 130
+    if arguments.report:
+        BatchRunner.write_report(report, arguments.report)
+    else:
+        json.dump(report, sys.stderr, indent=2)
+        sys.stderr.write('\n')
+    return 0 if report['passed'] == report['files'] or not arguments.strict else 1
+
+
+def write_profile_report(report, output):
+    """
+    Escribe las funciones con más tiempo acumulado, el pico de memoria y las líneas con más memoria asignada al
+    terminar.
+
+    Args:
+        report (dict): Informe devuelto por Instrumentation.profile.
+        output (io.TextIOBase): Archivo de salida.
+    """
+    output.write(report['functions'])
+    if report['peak_bytes'] is not None:
+        output.write(f"Peak traced memory: {report['peak_bytes'] / 2 ** 20:.2f} MB\n")
+    for allocation in report['allocations']:
+        output.write(f"{allocation['bytes'] / 2 ** 20:10.2f} MB {allocation['blocks']:8d} blocks  "
+                     f"{allocation['file']}:{allocation['line']}\n")
+
+
+def write_json(records, output):
+    """
+    Escribe los resultados en formato JSON.
+
+    Args:
+        records (list): Resultados devueltos por run_file.
+        output (io.TextIOBase): Archivo de salida.
+    """
+    json.dump(records, output, indent=2)
+    output.write('\n')
+
+
+def write_csv(records, output):
+    """
+    Escribe los resultados en formato CSV, con una fila por archivo y prueba.
+
+    Args:
+        records (list): Resultados devueltos por run_file.
+        output (io.TextIOBase): Archivo de salida.
+    """
+    writer = csv.DictWriter(output, fieldnames=CSV_FIELDS, extrasaction='ignore')
+    writer.writeheader()
+    for record in records:
+        file_fields = {field: record.get(field) for field in CSV_FIELDS[:4]}
+        if not record['tests']:
+            writer.writerow({**file_fields, 'error': record.get('error')})
+        for test in record['tests']:
+            writer.writerow({**file_fields, **test})
+
+
+def parse_arguments(argv=None):
+    """
+    Interpreta los argumentos de la línea de comandos.
+
+    Args:
+        argv (list, opcional): Argumentos; por defecto, los del proceso.
+
+    Returns:
+        argparse.Namespace: Argumentos interpretados.
+    """
+    parser = argparse.ArgumentParser(description="Run the pseudo-random number tests without the graphical interface.")
+    parser.add_argument('files', nargs='*', help="files with the numbers, in any format supported by the GUI")
+    parser.add_argument('-t', '--tests', default=','.join(TEST_NAMES),
+                        help=f"comma-separated tests to run (default: {','.join(TEST_NAMES)})")
+    parser.add_argument('-f', '--format', choices=('json', 'csv'), default='json', help="output format")
+    parser.add_argument('-o', '--output', help="output file (default: standard output)")
+    parser.add_argument('-w', '--workers', type=int, default=os.cpu_count() or 1,
+                        help="processes used to summarize large samples")
+    parser.add_argument('--alpha', default=','.join(str(alpha) for alpha in Constants.ALPHAS),
+                        help="comma-separated significance levels; each test's statistic is computed once and judged "
+                             "at every level, and the first one decides the verdict "
+                             f"(default: {','.join(str(alpha) for alpha in Constants.ALPHAS)})")
+    parser.add_argument('--chunk-size', type=int,
+                        help="read each file in blocks of this many numbers instead of loading it")
+    parser.add_argument('--window', type=int,
+                        help="evaluate the tests on sliding windows of this many numbers and write JSON lines; "
+                             "overlapping windows leave out the gap and coupon tests")
+    parser.add_argument('--stride', type=int, help="numbers each window advances (default: the window size)")
+    parser.add_argument('--stream', metavar='SOURCE',
+                        help="read numbers continuously from stdin, tcp://HOST:PORT, unix://PATH or tail://PATH and "
+                             "write JSON lines with the running statistics")
+    parser.add_argument('--raw-dtype', help="numpy dtype of binary stream data, e.g. '<f8' or '<u4' (default: text)")
+    parser.add_argument('--report-interval', type=float, default=1.0,
+                        help="seconds between running statistics lines in stream mode")
+    parser.add_argument('--batch', metavar='ROWS_CSV',
+                        help="treat the arguments as directories or glob patterns, test every file in a process pool "
+                             "and append one summary row per file to this CSV")
+    parser.add_argument('--resume', action='store_true',
+                        help="in batch mode, keep the existing rows and skip the files they cover")
+    parser.add_argument('--report', help="in batch mode, write the aggregate JSON report here (default: stderr)")
+    parser.add_argument('--trace', help="write a Chrome trace (also opened by Perfetto and speedscope) with the "
+                                       "wall time, CPU time and memory of each phase")
+    parser.add_argument('--profile', metavar='STATS_FILE',
+                        help="run under cProfile and tracemalloc, save the cProfile stats here and print the top "
+                             "functions and allocations to stderr")
+    parser.add_argument('--strict', action='store_true',
+                        help="exit with status 1 if any test fails or cannot run")
+    arguments = parser.parse_args(argv)
+    if not arguments.files and not arguments.stream:
+        parser.error("give at least one file or a --stream source")
+    arguments.tests = [name.strip() for name in arguments.tests.split(',') if name.strip()]
+    unknown = [name for name in arguments.tests if name not in TEST_NAMES]
+    if unknown or not arguments.tests:
+        parser.error(f"unknown tests: {', '.join(unknown)}; choose from {', '.join(TEST_NAMES)}")
+    try:
+        arguments.alpha = [float(alpha) for alpha in arguments.alpha.split(',') if alpha.strip()]
+    except ValueError:
+        parser.error(f"invalid significance levels: {arguments.alpha}")
+    if not arguments.alpha or not all(0 < alpha < 1 for alpha in arguments.alpha):
+        parser.error("significance levels must be between 0 and 1")
+    return arguments
+
+
+def main(argv=None):
+    """
+    Ejecuta las pruebas sobre cada archivo y escribe los resultados.
+
+    Args:
+        argv (list, opcional): Argumentos de la línea de comandos.
+
+    Returns:
+        int: Código de salida del proceso.
+    """
+    arguments = parse_arguments(argv)
+    if arguments.batch:
+        return run_batch(arguments)
+
+    if arguments.stream:
+        output = open(arguments.output, 'w') if arguments.output else sys.stdout
+        try:
+            all_passed = write_stream(arguments.stream, arguments.raw_dtype, arguments.report_interval, output)
+        finally:
+            if arguments.output:
+                output.close()
+        return 0 if all_passed or not arguments.strict else 1
+
+    if arguments.window:
+        output = open(arguments.output, 'w') if arguments.output else sys.stdout
+        try:
+            all_passed = all([write_windows(file_path, arguments.window, arguments.stride, arguments.chunk_size, output)
+                              for file_path in arguments.files])
+        finally:
+            if arguments.output:
+                output.close()
+        return 0 if all_passed or not arguments.strict else 1
+
+    instrumentation = Instrumentation() if arguments.trace else None
+
+    def run_files():
+        return [run_file(file_path, arguments.tests, arguments.workers, arguments.chunk_size, instrumentation,
+                         arguments.alpha)
+                for file_path in arguments.files]
+
+    if arguments.profile:
+        records, report = Instrumentation.profile(run_files, arguments.profile)
+        write_profile_report(report, sys.stderr)
+    else:
+        records = run_files()
+    if instrumentation is not None:
+        instrumentation.export_chrome_trace(arguments.trace)
+
+    writer = write_json if arguments.format == 'json' else write_csv
+    if arguments.output:
+        with open(arguments.output, 'w', newline='') as output:
+            writer(records, output)
+    else:
+        writer(records, sys.stdout)
+
+    all_passed = all('error' not in record and all(test['passed'] for test in record['tests']) for record in records)
+    return 0 if all_passed or not arguments.strict else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
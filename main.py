@@ -1,3 +1,4 @@
+import os
 import sys
 from PyQt6.QtWidgets import QApplication
 
@@ -9,7 +10,7 @@ from view.MainFrame import MainFrame
 def main():
     app = QApplication(sys.argv)
     view = MainFrame()
-    model = Tests()
+    model = Tests(workers=os.cpu_count() or 1)
     presenter = Presenter(view, model)
     presenter.run()
     sys.exit(app.exec())
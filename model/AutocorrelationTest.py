@@ -0,0 +1,148 @@
+import numpy as np
+
+from model.Constants import Constants
+from model.accumulators.AutocorrelationAccumulator import AutocorrelationAccumulator
+from model.accumulators.TestAccumulator import TestAccumulator
+from model.util.CriticalValues import CriticalValues
+from model.util.MathUtils import MathUtils
+
+
+class AutocorrelationTest:
+    """
+    Clase para realizar la prueba de autocorrelación en una lista de números pseudoaleatorios.
+
+    Para cada desfase k entre 1 y max_lag estima la correlación entre los números separados por k posiciones. Como
+    la media (0.5) y la varianza (1/12) de la distribución uniforme son conocidas, la suma S_k de los productos
+    (x[i] - 0.5) * (x[i + k] - 0.5) de los N_k pares tiene varianza N_k / 144, así que Z_k = 12 S_k / sqrt(N_k) es
+    aproximadamente normal estándar, y las Z_k de distintos desfases son independientes. El estadístico es la suma de
+    sus cuadrados, que sigue una chi-cuadrado con max_lag grados de libertad.
+
+    Atributos:
+        pseudo_random_numbers (numpy.ndarray): Arreglo float64 de números pseudoaleatorios a analizar.
+        max_lag (int): Mayor desfase evaluado.
+        correlations (numpy.ndarray): Correlación estimada de cada desfase, de 1 a max_lag.
+        z_values (numpy.ndarray): Estadístico normal de cada desfase.
+        chi_squared (float): Suma de los cuadrados de z_values.
+        chi_invert (float): Valor crítico de chi-cuadrado para el nivel de significancia.
+        alpha (float): Nivel de significancia con el que se evaluó la prueba.
+        summary (SampleSummary): Resumen de la muestra que puede traer las sumas ya acumuladas.
+    """
+    CHUNK_SIZE = 1 << 20
+
+    def __init__(self, max_lag=10):
+        """
+        Inicializa una instancia de la clase AutocorrelationTest.
+
+        Parámetros:
+            max_lag (int): Mayor desfase evaluado.
+
+        Raises:
+            ValueError: Si el desfase máximo no es positivo.
+        """
+        if max_lag < 1:
+            raise ValueError("La prueba de autocorrelación necesita al menos un desfase")
+        self.pseudo_random_numbers = np.empty(0, dtype=np.float64)
+        self.max_lag = max_lag
+        self.correlations = np.zeros(max_lag)
+        self.z_values = np.zeros(max_lag)
+        self.chi_squared = 0
+        self.chi_invert = 0
+        self.alpha = Constants.ALPHA
+        self.summary = None
+
+    def create_lag_counter(self):
+        """
+        Crea un acumulador vacío que suma los productos de cada desfase por bloques.
+
+        Retorna:
+            AutocorrelationAccumulator: Acumulador vacío.
+        """
+        return AutocorrelationAccumulator(self.max_lag)
+
+    def create_accumulator(self):
+        """
+        Crea un acumulador de la prueba que puede alimentarse por bloques y unirse con otros.
+
+        Retorna:
+            TestAccumulator: Acumulador vacío de la prueba.
+        """
+        return TestAccumulator(self, 'execute_test', {'autocorrelation': self.create_lag_counter()})
+
+    def execute_test(self):
+        """
+        Ejecuta la prueba de autocorrelación.
+
+        Retorna:
+            bool: True si los números pseudoaleatorios pasan la prueba, False de lo contrario.
+
+        Raises:
+            ValueError: Si la muestra no tiene más números que el desfase máximo.
+        """
+        # Usa las sumas acumuladas al resumir la muestra si tienen el mismo desfase máximo
+        accumulator = self.summary.accumulators.get('autocorrelation') if self.summary is not None else None
+        if accumulator is None or accumulator.max_lag != self.max_lag:
+            accumulator = self.create_lag_counter()
+            for chunk in MathUtils.iter_chunks(self.pseudo_random_numbers, self.CHUNK_SIZE):
+                accumulator.update(chunk)
+        if accumulator.pairs[-1] < 1:
+            raise ValueError("La muestra debe tener más números que el desfase máximo")
+
+        self.correlations = 12 * accumulator.sums / accumulator.pairs
+        self.z_values = self.correlations * np.sqrt(accumulator.pairs)
+        self.chi_squared = float(np.dot(self.z_values, self.z_values))
+        return self.evaluate(self.alpha)
+
+    def evaluate(self, alpha):
+        """
+        Evalúa la prueba con un nivel de significancia a partir del estadístico ya calculado, sin recorrer la muestra.
+
+        Parámetros:
+            alpha (float): Nivel de significancia.
+
+        Retorna:
+            bool: True si los números pseudoaleatorios pasan la prueba, False de lo contrario.
+        """
+        self.alpha = alpha
+        self.chi_invert = CriticalValues.chi2_isf(alpha, self.max_lag)
+        return self.chi_squared < self.chi_invert
+
+    @property
+    def p_value(self):
+        """
+        Obtiene la probabilidad de observar un estadístico igual o mayor si la muestra es uniforme.
+
+        Retorna:
+            float: Valor p del estadístico.
+        """
+        return CriticalValues.chi2_sf(self.chi_squared, self.max_lag)
+
+    def set_pseudo_random_numbers(self, pseudo_random_numbers, summary=None):
+        """
+        Establece la lista de números pseudoaleatorios para la prueba de autocorrelación.
+
+        Parámetros:
+            pseudo_random_numbers (list | numpy.ndarray): Números pseudoaleatorios.
+            summary (SampleSummary, opcional): Resumen de la misma muestra con el acumulador 'autocorrelation'.
+        """
+        self.pseudo_random_numbers = MathUtils.to_float_array(pseudo_random_numbers)
+        self.summary = summary
+
+    @property
+    def get_chi_squared(self):
+        """
+        Obtiene el estadístico calculado de la prueba de autocorrelación.
+
+        Retorna:
+            float: Suma de los cuadrados de los estadísticos de cada desfase.
+        """
+        return self.chi_squared
+
+    @property
+    def get_chi_invert(self):
+        """
+        Obtiene el valor crítico de chi-cuadrado calculado.
+
+        Retorna:
+            float: Valor crítico de chi-cuadrado.
+        """
+        return self.chi_invert
@@ -0,0 +1,369 @@
+import contextlib
+import csv
+import glob
+import io
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from model.Constants import Constants
+from model.Tests import Tests
+from model.util.CriticalValues import CriticalValues
+from model.util.DataLoader import DataLoader
+from model.util.HandTable import HandTable
+
+
+def as_number(value):
+    """
+    Convierte un escalar de numpy a un número de Python para serializarlo.
+
+    Parámetros:
+        value: Número o None.
+
+    Retorna:
+        float | None: Valor convertido.
+    """
+    return None if value is None else float(value)
+
+
+def run_file(file_path, test_names, workers=1, chunk_size=None, instrumentation=None, alphas=None):
+    """
+    Carga un archivo, ejecuta las pruebas pedidas con una batería nueva y mide el tiempo de cada fase.
+
+    Cada estadístico se calcula una sola vez: el veredicto usa el primer nivel de significancia y los demás solo
+    vuelven a evaluar el umbral.
+
+    Los mensajes de error que imprimen las pruebas se envían a stderr para no mezclarlos con los resultados.
+
+    Parámetros:
+        file_path (str): Ruta del archivo con los números.
+        test_names (list): Nombres de las pruebas a ejecutar, en orden.
+        workers (int): Cantidad de procesos para resumir muestras grandes.
+        chunk_size (int, opcional): Si se indica, el archivo se lee por bloques de este tamaño sin cargarlo completo.
+        instrumentation (Instrumentation, opcional): Registro donde se miden la carga y cada fase de las pruebas.
+        alphas (list, opcional): Niveles de significancia; por defecto, Constants.ALPHAS.
+
+    Retorna:
+        dict: Resultado del archivo con la cantidad de números, los tiempos de carga y resumen y una entrada por prueba.
+    """
+    alphas = list(alphas or Constants.ALPHAS)
+    record = {'file': file_path, 'count': None, 'load_seconds': None, 'summary_seconds': None, 'tests': []}
+    tests = Tests(workers=workers)
+    tests.set_instrumentation(instrumentation)
+    tests.set_alpha(alphas[0])
+    try:
+        with contextlib.redirect_stdout(sys.stderr), \
+                instrumentation.activate() if instrumentation is not None else contextlib.nullcontext():
+            if chunk_size:
+                start = time.perf_counter()
+                tests.set_chunked_file(file_path, chunk_size)
+                record['summary_seconds'] = time.perf_counter() - start
+            else:
+                numbers, load_stats = DataLoader.load(file_path)
+                record['load_seconds'] = load_stats['seconds']
+                print(f"{file_path}: {DataLoader.describe_throughput(load_stats)}")
+                start = time.perf_counter()
+                tests.set_pseudo_random_numbers(numbers)
+                record['summary_seconds'] = time.perf_counter() - start
+            record['count'] = tests.summary.count
+
+            for test_name in test_names:
+                start = time.perf_counter()
+                passed = getattr(tests, f'execute_{test_name}_test')()
+                seconds = time.perf_counter() - start
+                statistic, lower_limit, upper_limit = tests.describe_test(test_name) if passed is not None \
+                    else (None, None, None)
+                record['tests'].append({
+                    'test': test_name,
+                    'passed': None if passed is None else bool(passed),
+                    'seconds': seconds,
+                    'statistic': as_number(statistic),
+                    'lower_limit': as_number(lower_limit),
+                    'upper_limit': as_number(upper_limit),
+                    'p_value': tests.p_value(test_name) if passed is not None else None,
+                    'levels': tests.evaluate_levels(test_name, alphas) if passed is not None else [],
+                })
+    except Exception as e:
+        print(f"Error al procesar el archivo {file_path}: {e}", file=sys.stderr)
+        record['error'] = str(e)
+    return record
+
+
+def warm_up_worker():
+    """
+    Carga la tabla de valores críticos y la de manos de póker al iniciar cada proceso del grupo.
+
+    Los procesos atienden muchos archivos seguidos, así que las tablas y la caché LRU de CriticalValues se
+    comparten entre todos los archivos que pasan por el mismo proceso.
+    """
+    CriticalValues.load_table()
+    HandTable.table(Tests().poker_test.digit_length)
+
+
+class BatchRunner:
+    """
+    Ejecuta la batería de pruebas sobre muchos archivos repartiéndolos entre un grupo de procesos.
+
+    Cada archivo se analiza con una instancia nueva de Tests en un proceso del grupo. Solo hay unos pocos archivos
+    enviados por proceso a la vez, de modo que la memoria no crece con la cantidad de archivos; los archivos de más
+    de LARGE_FILE_SIZE bytes se leen por bloques en lugar de cargarse completos.
+
+    Cada resultado se agrega como una fila al archivo de filas apenas termina. Si la ejecución se interrumpe, al
+    reanudarla se omiten los archivos que ya tienen una fila completa. Al final se escribe un informe con el total de
+    archivos, números, aprobaciones y fallos de cada prueba.
+
+    Atributos:
+        test_names (list): Nombres de las pruebas a ejecutar.
+        workers (int): Cantidad de procesos.
+        chunk_size (int): Cantidad de números por bloque para los archivos que se leen por bloques.
+        large_file_size (int): Tamaño en bytes a partir del cual un archivo se lee por bloques.
+        alphas (list): Niveles de significancia; el veredicto de cada prueba usa el primero.
+    """
+    LARGE_FILE_SIZE = 1 << 28
+    CHUNK_SIZE = 1 << 20
+    TASKS_PER_WORKER = 2
+
+    def __init__(self, test_names, workers=None, chunk_size=CHUNK_SIZE, large_file_size=LARGE_FILE_SIZE,
+                 alphas=Constants.ALPHAS):
+        """
+        Inicializa una instancia de BatchRunner.
+
+        Parámetros:
+            test_names (list): Nombres de las pruebas a ejecutar, en orden.
+            workers (int, opcional): Cantidad de procesos; por defecto, la cantidad de núcleos.
+            chunk_size (int): Cantidad de números por bloque para los archivos que se leen por bloques.
+            large_file_size (int): Tamaño en bytes a partir del cual un archivo se lee por bloques; 0 para leer
+                todos por bloques.
+            alphas (list): Niveles de significancia; el veredicto de cada prueba usa el primero.
+        """
+        self.test_names = list(test_names)
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.large_file_size = large_file_size
+        self.alphas = list(alphas)
+
+    @staticmethod
+    def collect_files(patterns):
+        """
+        Obtiene los archivos de números que corresponden a directorios, patrones glob o rutas.
+
+        Parámetros:
+            patterns (list): Directorios, que se recorren completos, patrones glob o rutas de archivos.
+
+        Retorna:
+            list: Rutas sin repetir y ordenadas; de los directorios solo se toman las extensiones que DataLoader
+            admite.
+        """
+        files = set()
+        for pattern in patterns:
+            if os.path.isdir(pattern):
+                for directory, _, names in os.walk(pattern):
+                    files.update(os.path.join(directory, name) for name in names
+                                 if os.path.splitext(name)[1].lower() in DataLoader.SUPPORTED_EXTENSIONS)
+            elif glob.has_magic(pattern):
+                files.update(path for path in glob.glob(pattern, recursive=True) if os.path.isfile(path))
+            else:
+                files.add(pattern)
+        return sorted(files)
+
+    def row_fields(self):
+        """
+        Obtiene las columnas del archivo de filas.
+
+        Retorna:
+            list: Columnas del archivo y, por cada prueba, su veredicto, su estadístico y su valor p.
+        """
+        fields = ['file', 'count', 'seconds', 'passed', 'failed_tests', 'error']
+        for test_name in self.test_names:
+            fields += [f'{test_name}_passed', f'{test_name}_statistic', f'{test_name}_p_value']
+        return fields
+
+    @staticmethod
+    def to_row(record):
+        """
+        Resume el resultado de un archivo en una fila.
+
+        Parámetros:
+            record (dict): Resultado devuelto por run_file.
+
+        Retorna:
+            dict: Fila con el veredicto general, las pruebas que fallaron y el estadístico y el valor p de cada una.
+        """
+        failed = [test['test'] for test in record['tests'] if not test['passed']]
+        seconds = (record.get('load_seconds') or 0) + (record.get('summary_seconds') or 0) + \
+            sum(test['seconds'] for test in record['tests'])
+        row = {
+            'file': record['file'],
+            'count': record['count'],
+            'seconds': round(seconds, 6),
+            'passed': 'error' not in record and not failed,
+            'failed_tests': ' '.join(failed),
+            'error': record.get('error', ''),
+        }
+        for test in record['tests']:
+            row[f"{test['test']}_passed"] = test['passed']
+            row[f"{test['test']}_statistic"] = test['statistic']
+            row[f"{test['test']}_p_value"] = test['p_value']
+        return row
+
+    @staticmethod
+    def read_rows(rows_path):
+        """
+        Lee las filas completas escritas por una ejecución anterior.
+
+        Si la ejecución se interrumpió mientras escribía una fila, el archivo termina sin el salto de línea final o
+        la fila tiene menos columnas; esa fila se descarta para que su archivo vuelva a analizarse.
+
+        Parámetros:
+            rows_path (str): Ruta del archivo de filas.
+
+        Retorna:
+            list: Filas como diccionarios de texto; vacía si el archivo no existe.
+        """
+        if not os.path.exists(rows_path):
+            return []
+        with open(rows_path, 'r', newline='') as file:
+            content = file.read()
+        rows = list(csv.DictReader(io.StringIO(content)))
+        if rows and not content.endswith('\n'):
+            rows.pop()
+        return [row for row in rows if None not in row and None not in row.values()]
+
+    def run(self, files, rows_path, resume=False, progress=None):
+        """
+        Analiza los archivos en el grupo de procesos y agrega una fila por archivo a medida que terminan.
+
+        Parámetros:
+            files (list): Rutas de los archivos.
+            rows_path (str): Ruta del archivo CSV de filas.
+            resume (bool): True para conservar las filas completas existentes y omitir sus archivos; False para
+                empezar de cero.
+            progress (callable, opcional): Función que recibe cada fila, los archivos terminados y el total.
+
+        Retorna:
+            dict: Informe de todas las filas del archivo, incluidas las de ejecuciones anteriores; ver build_report.
+
+        Raises:
+            ValueError: Si se reanuda un archivo de filas escrito con otras pruebas.
+        """
+        fields = self.row_fields()
+        previous = self.read_rows(rows_path) if resume else []
+        if previous and list(previous[0]) != fields:
+            raise ValueError(f"El archivo {rows_path} se escribió con otras pruebas y no puede reanudarse")
+        done = {row['file'] for row in previous}
+        pending = [file_path for file_path in files if file_path not in done]
+        total = len(pending)
+        # Las filas anteriores se reescriben sin la que haya quedado incompleta, que si no se uniría a la siguiente;
+        # el archivo se reemplaza de una vez para no perderlas si la ejecución se vuelve a interrumpir
+        temporary_path = f'{rows_path}.tmp'
+        with open(temporary_path, 'w', newline='') as rows_file:
+            writer = csv.DictWriter(rows_file, fieldnames=fields, extrasaction='ignore')
+            writer.writeheader()
+            writer.writerows(previous)
+        os.replace(temporary_path, rows_path)
+
+        with open(rows_path, 'a', newline='') as rows_file:
+            writer = csv.DictWriter(rows_file, fieldnames=fields, extrasaction='ignore')
+            context = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(max_workers=self.workers, mp_context=context,
+                                     initializer=warm_up_worker) as pool:
+                queue = iter(pending)
+                running = {}
+                finished = 0
+                try:
+                    while True:
+                        while len(running) < self.workers * self.TASKS_PER_WORKER:
+                            file_path = next(queue, None)
+                            if file_path is None:
+                                break
+                            running[pool.submit(run_file, file_path, self.test_names, 1,
+                                                self.chunk_size_for(file_path), None, self.alphas)] = file_path
+                        if not running:
+                            break
+                        completed, _ = wait(running, return_when=FIRST_COMPLETED)
+                        for future in completed:
+                            file_path = running.pop(future)
+                            try:
+                                record = future.result()
+                            except Exception as e:
+                                # El proceso que analizaba el archivo terminó de forma inesperada
+                                record = {'file': file_path, 'count': None, 'tests': [], 'error': str(e) or repr(e)}
+                            row = self.to_row(record)
+                            writer.writerow(row)
+                            rows_file.flush()
+                            finished += 1
+                            if progress is not None:
+                                progress(row, finished, total)
+                except BaseException:
+                    for future in running:
+                        future.cancel()
+                    raise
+        return self.build_report(self.read_rows(rows_path))
+
+    def chunk_size_for(self, file_path):
+        """
+        Decide si un archivo se carga completo o se lee por bloques.
+
+        Parámetros:
+            file_path (str): Ruta del archivo.
+
+        Retorna:
+            int | None: Tamaño de bloque, o None para cargar el archivo completo.
+        """
+        try:
+            size = os.path.getsize(file_path)
+        except OSError:
+            # run_file informa el error al intentar abrirlo
+            return None
+        return self.chunk_size if size >= self.large_file_size else None
+
+    def build_report(self, rows):
+        """
+        Calcula el informe agregado de un conjunto de filas.
+
+        Parámetros:
+            rows (list): Filas leídas del archivo CSV.
+
+        Retorna:
+            dict: Cantidad de archivos, de archivos aprobados, fallidos y con error, de números y de segundos, y por
+            cada prueba la cantidad de aprobaciones, fallos y la proporción de aprobación.
+        """
+        report = {'files': len(rows), 'passed': 0, 'failed': 0, 'errors': 0, 'numbers': 0, 'seconds': 0.0,
+                  'tests': {}}
+        for test_name in self.test_names:
+            report['tests'][test_name] = {'passed': 0, 'failed': 0, 'pass_rate': None}
+        for row in rows:
+            report['numbers'] += int(row['count'] or 0)
+            report['seconds'] += float(row['seconds'] or 0)
+            if row['error']:
+                report['errors'] += 1
+            elif row['passed'] == 'True':
+                report['passed'] += 1
+            else:
+                report['failed'] += 1
+            for test_name, counts in report['tests'].items():
+                verdict = row.get(f'{test_name}_passed')
+                if verdict == 'True':
+                    counts['passed'] += 1
+                elif verdict == 'False':
+                    counts['failed'] += 1
+        for counts in report['tests'].values():
+            evaluated = counts['passed'] + counts['failed']
+            counts['pass_rate'] = counts['passed'] / evaluated if evaluated else None
+        return report
+
+    @staticmethod
+    def write_report(report, report_path):
+        """
+        Guarda el informe agregado en formato JSON.
+
+        Parámetros:
+            report (dict): Informe devuelto por run.
+            report_path (str): Ruta del archivo.
+        """
+        with open(report_path, 'w') as file:
+            json.dump(report, file, indent=2)
+            file.write('\n')
@@ -1,6 +1,13 @@
-from scipy.stats import chi2
+import numpy as np
 
 from model.Constants import Constants
+from model.SampleSummary import SampleSummary
+from model.accumulators.HistogramAccumulator import HistogramAccumulator
+from model.accumulators.MomentsAccumulator import MomentsAccumulator
+from model.accumulators.TestAccumulator import TestAccumulator
+from model.util.CriticalValues import CriticalValues
+from model.util.Instrumentation import Instrumentation
+from model.util.MathUtils import MathUtils
 
 
 class ChiTest:
@@ -8,7 +15,7 @@ class ChiTest:
     Clase para realizar la prueba de Kolmogorov-Smirnov en una lista de números pseudoaleatorios.
 
     Atributos:
-        pseudo_random_numbers (list): Lista de números pseudoaleatorios.
+        pseudo_random_numbers (numpy.ndarray): Arreglo float64 de números pseudoaleatorios.
         intervals_amount (int): Cantidad de intervalos para la prueba de Kolmogorov-Smirnov.
         intervals (list): Lista de los límites superiores de los intervalos.
         frequencies (list): Lista de frecuencias de números pseudoaleatorios en cada intervalo.
@@ -18,21 +25,32 @@ class ChiTest:
         probability_expected (list): Lista de probabilidades acumuladas esperadas.
         difference (list): Lista de diferencias absolutas entre las probabilidades acumuladas obtenidas y esperadas.
         max_difference (float): Máxima diferencia entre las probabilidades acumuladas obtenidas y esperadas.
+        summary (SampleSummary): Resumen estadístico de la muestra.
+        domain (tuple): Límites (mínimo, máximo) fijos de los intervalos, o None para usar los de la muestra.
+        alpha (float): Nivel de significancia con el que se evaluó la prueba.
     """
-    def __init__(self, intervals_amount):
+    # Con este dominio los intervalos son los mismos de la prueba de Kolmogorov-Smirnov y se cuentan igual
+    FIXED_DOMAIN = (0.0, 1.0)
+
+    def __init__(self, intervals_amount, domain=None):
         """
         Inicializa una instancia de la clase ChiTest.
 
         Parámetros:
             intervals_amount (int): Cantidad de intervalos para la prueba de chi-cuadrado.
+            domain (tuple, opcional): Límites fijos de los intervalos, por ejemplo FIXED_DOMAIN; por defecto, el
+                mínimo y el máximo de la muestra.
         """
-        self.pseudo_random_numbers = []
+        self.pseudo_random_numbers = np.empty(0, dtype=np.float64)
         self.intervals_amount = intervals_amount
         self.intervals = []
-        self.frequencies = [0] * intervals_amount
-        self.errors = [0] * self.intervals_amount
+        self.frequencies = np.zeros(intervals_amount, dtype=np.int64)
+        self.errors = np.zeros(intervals_amount)
         self.total_error = 0
         self.chi_invert = 0
+        self.alpha = Constants.ALPHA
+        self.summary = None
+        self.domain = domain
 
     def execute_chi_test(self):
         """
@@ -44,64 +62,173 @@ class ChiTest:
         self.calculate_intervals()
         self.calculate_frequencies()
         self.calculate_chi()
+        return self.evaluate(self.alpha)
+
+    def evaluate(self, alpha):
+        """
+        Evalúa la prueba con un nivel de significancia a partir del estadístico ya calculado, sin recorrer la muestra.
+
+        Parámetros:
+            alpha (float): Nivel de significancia.
+
+        Retorna:
+            bool: True si los números pasan la prueba, False de lo contrario.
+        """
+        self.alpha = alpha
         self.chi_invert_test()
         return self.total_error < self.chi_invert
 
+    @property
+    def p_value(self):
+        """
+        Obtiene la probabilidad de observar un estadístico igual o mayor si la muestra es uniforme.
+
+        Retorna:
+            float: Valor p del estadístico.
+        """
+        return CriticalValues.chi2_sf(self.total_error, len(self.intervals) - 1)
+
     def calculate_intervals(self):
         """
         Calcula los intervalos para la prueba de chi-cuadrado.
         """
-        min_value = min(self.pseudo_random_numbers)
-        max_value = max(self.pseudo_random_numbers)
+        summary = self.sample_summary()
+        if not summary.count:
+            raise ValueError("ni_values is empty")
+        self.intervals = self.interval_limits(*self.interval_range(summary))
+
+    def interval_range(self, summary):
+        """
+        Obtiene el rango que se divide en intervalos.
+
+        Parámetros:
+            summary (SampleSummary): Resumen de la muestra.
+
+        Retorna:
+            tuple: El dominio fijo si se estableció uno, o el mínimo y el máximo de la muestra.
+        """
+        return self.domain if self.domain is not None else (summary.minimum, summary.maximum)
+
+    def interval_limits(self, min_value, max_value):
+        """
+        Calcula los límites superiores de los intervalos entre el mínimo y el máximo de la muestra.
+
+        Parámetros:
+            min_value (float): Menor número de la muestra.
+            max_value (float): Mayor número de la muestra.
+
+        Retorna:
+            list: Límite superior de cada intervalo.
+        """
         interval_width = (max_value - min_value) / self.intervals_amount
-        self.intervals = [(min_value + interval_width) + interval_width * i for i in range(self.intervals_amount)]
+        return [(min_value + interval_width) + interval_width * i for i in range(self.intervals_amount)]
+
+    def create_histogram(self, min_value, max_value):
+        """
+        Crea el acumulador de frecuencias de la prueba para una muestra con el mínimo y el máximo dados.
+
+        En FIXED_DOMAIN el acumulador es el de intervalos uniformes, que calcula el intervalo de cada número sin
+        errores de redondeo en los límites y coincide con el de la prueba de Kolmogorov-Smirnov si ambas usan la
+        misma cantidad de intervalos; así un solo conteo sirve para las dos. Ese acumulador no cuenta los números
+        que no son menores que 1, que calculate_frequencies suma al último intervalo.
+
+        Parámetros:
+            min_value (float): Menor número de la muestra completa.
+            max_value (float): Mayor número de la muestra completa.
+
+        Retorna:
+            HistogramAccumulator: Acumulador vacío con los intervalos de la prueba.
+
+        Raises:
+            ValueError: Si hay menos de dos intervalos o si el mínimo y el máximo coinciden.
+        """
+        if self.intervals_amount < 2:
+            raise ValueError("La prueba de chi-cuadrado necesita al menos dos intervalos")
+        if (min_value, max_value) == self.FIXED_DOMAIN:
+            return HistogramAccumulator.uniform(self.intervals_amount)
+        interval_size = (max_value - min_value) / self.intervals_amount
+        if interval_size <= 0:
+            raise ValueError("Todos los números pseudoaleatorios son iguales")
+        return HistogramAccumulator.linear(min_value, interval_size, self.intervals_amount)
+
+    def create_accumulator(self, min_value, max_value):
+        """
+        Crea un acumulador de la prueba que puede alimentarse por bloques y unirse con otros.
+
+        Los intervalos dependen del mínimo y el máximo de toda la muestra, así que deben conocerse antes, por
+        ejemplo uniendo primero los MomentsAccumulator de todas las partes.
+
+        Parámetros:
+            min_value (float): Menor número de la muestra completa.
+            max_value (float): Mayor número de la muestra completa.
+
+        Retorna:
+            TestAccumulator: Acumulador vacío de la prueba.
+        """
+        return TestAccumulator(self, 'execute_chi_test', {
+            'moments': MomentsAccumulator(),
+            'chi': self.create_histogram(min_value, max_value),
+        })
 
     def calculate_frequencies(self):
         """
         Calcula las frecuencias de los números pseudoaleatorios en cada intervalo.
         """
-        if not self.pseudo_random_numbers:
+        summary = self.sample_summary()
+        if not summary.count:
             raise ValueError("ni_values is empty")
 
-        # Reinicia las frecuencias a cero
-        self.frequencies = [0] * self.intervals_amount
-
-        min_value = min(self.pseudo_random_numbers)
-        interval_size = self.intervals[1] - self.intervals[0] if len(self.intervals) > 1 else 1
-
-        for number in self.pseudo_random_numbers:
-            interval_index = min(int((number - min_value) // interval_size), self.intervals_amount - 1)
-            self.frequencies[interval_index] += 1
+        # Con los límites de la muestra, el mínimo y el máximo solo se conocen tras recorrerla, así que este
+        # histograma se pide aparte; con un dominio fijo puede haberse contado en el primer recorrido
+        with Instrumentation.phase('calculate_frequencies', 'chi'):
+            histogram = self.create_histogram(*self.interval_range(summary))
+            frequencies = summary.histogram(histogram)
+            if histogram.key[0] == 'uniform':
+                frequencies = frequencies.copy()
+                frequencies[-1] += summary.count - frequencies.sum()
+            self.frequencies = frequencies
 
     def calculate_chi(self):
         """
         Calcula el valor chi-cuadrado total a partir de las frecuencias observadas y esperadas.
         """
         self.calculate_error()
-        self.total_error = sum(self.errors)
+        self.total_error = float(self.errors.sum())
 
     def calculate_error(self):
         """
         Calcula el error cuadrado para cada intervalo y lo almacena en la lista de errores.
         """
-        expected_freq = len(self.pseudo_random_numbers) / self.intervals_amount
-        for i in range(len(self.errors)):
-            self.errors[i] = (self.frequencies[i] - expected_freq) ** 2 / expected_freq
+        expected_freq = self.sample_summary().count / self.intervals_amount
+        self.errors = (self.frequencies - expected_freq) ** 2 / expected_freq
 
     def chi_invert_test(self):
         """
         Calcula el valor crítico de chi-cuadrado invertido con un nivel de significancia alpha.
         """
-        self.chi_invert = chi2.isf(Constants.ALPHA, len(self.intervals) - 1)
+        self.chi_invert = CriticalValues.chi2_isf(self.alpha, len(self.intervals) - 1)
 
-    def set_pseudo_random_numbers(self, pseudo_random_numbers):
+    def set_pseudo_random_numbers(self, pseudo_random_numbers, summary=None):
         """
         Establece la lista de números pseudoaleatorios para la prueba de chi-cuadrado.
 
         Parámetros:
-            pseudo_random_numbers (list): Lista de números pseudoaleatorios.
+            pseudo_random_numbers (list | numpy.ndarray): Números pseudoaleatorios.
+            summary (SampleSummary, opcional): Resumen ya calculado de la misma muestra.
+        """
+        self.pseudo_random_numbers = MathUtils.to_float_array(pseudo_random_numbers)
+        self.summary = summary
+
+    def sample_summary(self):
+        """
+        Obtiene el resumen estadístico de la muestra, calculándolo si ninguna otra prueba lo compartió.
+
+        Retorna:
+            SampleSummary: Resumen de la muestra actual.
         """
-        self.pseudo_random_numbers = pseudo_random_numbers
+        if self.summary is None:
+            self.summary = SampleSummary(self.pseudo_random_numbers)
+        return self.summary
 
     @property
     def get_total_error(self):
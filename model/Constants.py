@@ -1,5 +1,7 @@
 class Constants:
     ALPHA = 0.05
+    ALPHAS = (0.05, 0.01, 0.001)
     ACCEPTABILITY = 0.95
     DMAXP = 0.1885
+    DMAXP_SIZE = 50
 
@@ -0,0 +1,200 @@
+import functools
+import math
+
+import numpy as np
+
+from model.Constants import Constants
+from model.accumulators.CouponAccumulator import CouponAccumulator
+from model.accumulators.TestAccumulator import TestAccumulator
+from model.util.CriticalValues import CriticalValues
+from model.util.MathUtils import MathUtils
+
+
+class CouponTest:
+    """
+    Clase para realizar la prueba del coleccionista de cupones en una lista de números pseudoaleatorios.
+
+    Cada número se convierte en uno de coupons valores dividiendo [0, 1) en intervalos iguales, y la secuencia se
+    corta en segmentos que terminan en cuanto aparecieron todos los valores. Con números independientes un segmento
+    mide r números con probabilidad coupons! / coupons ** r * S(r - 1, coupons - 1), donde S son los números de
+    Stirling de segunda especie. Los segmentos de max_length o más números se agrupan, y el estadístico es el
+    chi-cuadrado de las frecuencias observadas, con max_length - coupons grados de libertad.
+
+    Atributos:
+        pseudo_random_numbers (numpy.ndarray): Arreglo float64 de números pseudoaleatorios a analizar.
+        coupons (int): Cantidad de valores distintos.
+        max_length (int): Longitud a partir de la cual los segmentos se cuentan juntos.
+        segments (int): Cantidad de segmentos completos.
+        observed_counts (numpy.ndarray): Frecuencia de cada longitud de coupons a max_length - 1, y de max_length o
+            más.
+        expected_counts (numpy.ndarray): Frecuencia esperada de las mismas longitudes.
+        chi_squared (float): Estadístico de la prueba.
+        chi_invert (float): Valor crítico de chi-cuadrado para el nivel de significancia.
+        alpha (float): Nivel de significancia con el que se evaluó la prueba.
+        summary (SampleSummary): Resumen de la muestra que puede traer el conteo de segmentos ya hecho.
+    """
+    MIN_COUPONS = 2
+    MAX_COUPONS = 16
+    CHUNK_SIZE = 1 << 20
+
+    def __init__(self, coupons=5, max_length=20):
+        """
+        Inicializa una instancia de la clase CouponTest.
+
+        Parámetros:
+            coupons (int): Cantidad de valores distintos.
+            max_length (int): Longitud a partir de la cual los segmentos se cuentan juntos.
+
+        Raises:
+            ValueError: Si la cantidad de valores está fuera de los límites o max_length no la supera.
+        """
+        if not self.MIN_COUPONS <= coupons <= self.MAX_COUPONS:
+            raise ValueError(f"La prueba del coleccionista de cupones necesita entre {self.MIN_COUPONS} y "
+                             f"{self.MAX_COUPONS} valores, no {coupons}")
+        if max_length <= coupons:
+            raise ValueError("La longitud máxima de los segmentos debe superar la cantidad de valores")
+        self.pseudo_random_numbers = np.empty(0, dtype=np.float64)
+        self.coupons = coupons
+        self.max_length = max_length
+        self.segments = 0
+        self.observed_counts = np.zeros(max_length - coupons + 1, dtype=np.int64)
+        self.expected_counts = np.zeros(max_length - coupons + 1)
+        self.chi_squared = 0
+        self.chi_invert = 0
+        self.alpha = Constants.ALPHA
+        self.summary = None
+
+    def create_segment_counter(self):
+        """
+        Crea un acumulador vacío que cuenta los segmentos de cada longitud por bloques.
+
+        Retorna:
+            CouponAccumulator: Acumulador vacío con los valores de la prueba.
+        """
+        return CouponAccumulator(self.coupons, self.max_length)
+
+    def create_accumulator(self):
+        """
+        Crea un acumulador de la prueba que puede alimentarse por bloques y unirse con otros.
+
+        Los segmentos dependen de todos los números anteriores, así que el acumulador de cada parte debe crearse con
+        continue_from a partir del de la anterior; ver CouponAccumulator.
+
+        Retorna:
+            TestAccumulator: Acumulador vacío de la prueba.
+        """
+        return TestAccumulator(self, 'execute_test', {'coupon': self.create_segment_counter()})
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def stirling(n, k):
+        """
+        Calcula el número de Stirling de segunda especie: las formas de repartir n elementos en k grupos no vacíos.
+
+        Parámetros:
+            n (int): Cantidad de elementos.
+            k (int): Cantidad de grupos.
+
+        Retorna:
+            int: Número de Stirling S(n, k).
+        """
+        if n == k:
+            return 1
+        if k == 0 or k > n:
+            return 0
+        return k * CouponTest.stirling(n - 1, k) + CouponTest.stirling(n - 1, k - 1)
+
+    def probabilities(self):
+        """
+        Calcula la probabilidad de cada longitud de segmento con números independientes.
+
+        Retorna:
+            numpy.ndarray: Probabilidad de cada longitud de coupons a max_length - 1, y de max_length o más al final.
+        """
+        arrangements = math.factorial(self.coupons)
+        probabilities = [arrangements * self.stirling(length - 1, self.coupons - 1) / self.coupons ** length
+                         for length in range(self.coupons, self.max_length)]
+        # Un segmento mide max_length o más si los primeros max_length - 1 números no traen todos los valores
+        probabilities.append(1 - arrangements * self.stirling(self.max_length - 1, self.coupons)
+                             / self.coupons ** (self.max_length - 1))
+        return np.array(probabilities)
+
+    def execute_test(self):
+        """
+        Ejecuta la prueba del coleccionista de cupones en la lista de números pseudoaleatorios.
+
+        Retorna:
+            bool: True si los números pseudoaleatorios pasan la prueba, False de lo contrario.
+
+        Raises:
+            ValueError: Si la muestra no tiene ningún segmento completo.
+        """
+        # Usa el conteo hecho al resumir la muestra si corresponde a la misma cantidad de valores
+        accumulator = self.summary.accumulators.get('coupon') if self.summary is not None else None
+        if accumulator is None or accumulator.key != self.create_segment_counter().key:
+            accumulator = self.create_segment_counter()
+            for chunk in MathUtils.iter_chunks(self.pseudo_random_numbers, self.CHUNK_SIZE):
+                accumulator.update(chunk)
+
+        self.observed_counts = accumulator.counts.copy()
+        self.segments = int(self.observed_counts.sum())
+        if not self.segments:
+            raise ValueError("La muestra no tiene ningún segmento completo")
+        self.expected_counts = self.probabilities() * self.segments
+        self.chi_squared = float(np.sum((self.observed_counts - self.expected_counts) ** 2 / self.expected_counts))
+        return self.evaluate(self.alpha)
+
+    def evaluate(self, alpha):
+        """
+        Evalúa la prueba con un nivel de significancia a partir del estadístico ya calculado, sin recorrer la muestra.
+
+        Parámetros:
+            alpha (float): Nivel de significancia.
+
+        Retorna:
+            bool: True si los números pseudoaleatorios pasan la prueba, False de lo contrario.
+        """
+        self.alpha = alpha
+        self.chi_invert = CriticalValues.chi2_isf(alpha, self.max_length - self.coupons)
+        return self.chi_squared < self.chi_invert
+
+    @property
+    def p_value(self):
+        """
+        Obtiene la probabilidad de observar un estadístico igual o mayor si la muestra es uniforme.
+
+        Retorna:
+            float: Valor p del estadístico.
+        """
+        return CriticalValues.chi2_sf(self.chi_squared, self.max_length - self.coupons)
+
+    def set_pseudo_random_numbers(self, pseudo_random_numbers, summary=None):
+        """
+        Establece la lista de números pseudoaleatorios para la prueba del coleccionista de cupones.
+
+        Parámetros:
+            pseudo_random_numbers (list | numpy.ndarray): Números pseudoaleatorios.
+            summary (SampleSummary, opcional): Resumen de la misma muestra con el acumulador 'coupon'.
+        """
+        self.pseudo_random_numbers = MathUtils.to_float_array(pseudo_random_numbers)
+        self.summary = summary
+
+    @property
+    def get_chi_squared(self):
+        """
+        Obtiene el estadístico calculado de la prueba del coleccionista de cupones.
+
+        Retorna:
+            float: Estadístico chi-cuadrado de las longitudes de los segmentos.
+        """
+        return self.chi_squared
+
+    @property
+    def get_chi_invert(self):
+        """
+        Obtiene el valor crítico de chi-cuadrado calculado.
+
+        Retorna:
+            float: Valor crítico de chi-cuadrado.
+        """
+        return self.chi_invert
@@ -0,0 +1,172 @@
+import numpy as np
+
+from model.Constants import Constants
+from model.accumulators.GapAccumulator import GapAccumulator
+from model.accumulators.TestAccumulator import TestAccumulator
+from model.util.CriticalValues import CriticalValues
+from model.util.MathUtils import MathUtils
+
+
+class GapTest:
+    """
+    Clase para realizar la prueba de huecos en una lista de números pseudoaleatorios.
+
+    Un número es un acierto si cae en [lower, upper), lo que con números uniformes ocurre con probabilidad
+    p = upper - lower. La longitud de un hueco es la cantidad de números que no aciertan entre dos aciertos
+    consecutivos, y con números independientes vale r con probabilidad p * (1 - p) ** r. Las longitudes de max_gap o
+    más se agrupan, con probabilidad (1 - p) ** max_gap, y el estadístico es el chi-cuadrado de las frecuencias
+    observadas, con max_gap grados de libertad.
+
+    Atributos:
+        pseudo_random_numbers (numpy.ndarray): Arreglo float64 de números pseudoaleatorios a analizar.
+        lower (float): Límite inferior del intervalo de aciertos.
+        upper (float): Límite superior, excluido, del intervalo de aciertos.
+        max_gap (int): Longitud a partir de la cual los huecos se cuentan juntos.
+        gaps (int): Cantidad de huecos completos.
+        observed_counts (numpy.ndarray): Frecuencia de cada longitud de 0 a max_gap - 1, y de max_gap o más.
+        expected_counts (numpy.ndarray): Frecuencia esperada de las mismas longitudes.
+        chi_squared (float): Estadístico de la prueba.
+        chi_invert (float): Valor crítico de chi-cuadrado para el nivel de significancia.
+        alpha (float): Nivel de significancia con el que se evaluó la prueba.
+        summary (SampleSummary): Resumen de la muestra que puede traer el conteo de huecos ya hecho.
+    """
+    CHUNK_SIZE = 1 << 20
+
+    def __init__(self, lower=0.0, upper=0.5, max_gap=5):
+        """
+        Inicializa una instancia de la clase GapTest.
+
+        Parámetros:
+            lower (float): Límite inferior del intervalo de aciertos.
+            upper (float): Límite superior, excluido, del intervalo de aciertos.
+            max_gap (int): Longitud a partir de la cual los huecos se cuentan juntos.
+
+        Raises:
+            ValueError: Si el intervalo no está contenido en [0, 1) con longitud positiva menor que 1, o si
+                max_gap no es positivo.
+        """
+        if not 0 <= lower < upper <= 1 or upper - lower >= 1:
+            raise ValueError("El intervalo de la prueba de huecos debe estar dentro de [0, 1) y no abarcarlo entero")
+        if max_gap < 1:
+            raise ValueError("La prueba de huecos necesita al menos una longitud de hueco")
+        self.pseudo_random_numbers = np.empty(0, dtype=np.float64)
+        self.lower = lower
+        self.upper = upper
+        self.max_gap = max_gap
+        self.gaps = 0
+        self.observed_counts = np.zeros(max_gap + 1, dtype=np.int64)
+        self.expected_counts = np.zeros(max_gap + 1)
+        self.chi_squared = 0
+        self.chi_invert = 0
+        self.alpha = Constants.ALPHA
+        self.summary = None
+
+    def create_gap_counter(self):
+        """
+        Crea un acumulador vacío que cuenta los huecos de cada longitud por bloques.
+
+        Retorna:
+            GapAccumulator: Acumulador vacío con el intervalo de la prueba.
+        """
+        return GapAccumulator(self.lower, self.upper, self.max_gap)
+
+    def create_accumulator(self):
+        """
+        Crea un acumulador de la prueba que puede alimentarse por bloques y unirse con otros.
+
+        Retorna:
+            TestAccumulator: Acumulador vacío de la prueba.
+        """
+        return TestAccumulator(self, 'execute_test', {'gap': self.create_gap_counter()})
+
+    def probabilities(self):
+        """
+        Calcula la probabilidad de cada longitud de hueco con números independientes.
+
+        Retorna:
+            numpy.ndarray: Probabilidad de cada longitud de 0 a max_gap - 1, y de max_gap o más al final.
+        """
+        hit = self.upper - self.lower
+        miss = (1 - hit) ** np.arange(self.max_gap + 1)
+        miss[:-1] *= hit
+        return miss
+
+    def execute_test(self):
+        """
+        Ejecuta la prueba de huecos en la lista de números pseudoaleatorios.
+
+        Retorna:
+            bool: True si los números pseudoaleatorios pasan la prueba de huecos, False de lo contrario.
+
+        Raises:
+            ValueError: Si la muestra no tiene ningún hueco completo.
+        """
+        # Usa el conteo hecho al resumir la muestra si corresponde al mismo intervalo
+        accumulator = self.summary.accumulators.get('gap') if self.summary is not None else None
+        if accumulator is None or accumulator.key != self.create_gap_counter().key:
+            accumulator = self.create_gap_counter()
+            for chunk in MathUtils.iter_chunks(self.pseudo_random_numbers, self.CHUNK_SIZE):
+                accumulator.update(chunk)
+
+        self.observed_counts = accumulator.counts.copy()
+        self.gaps = int(self.observed_counts.sum())
+        if not self.gaps:
+            raise ValueError("La muestra no tiene ningún hueco completo")
+        self.expected_counts = self.probabilities() * self.gaps
+        self.chi_squared = float(np.sum((self.observed_counts - self.expected_counts) ** 2 / self.expected_counts))
+        return self.evaluate(self.alpha)
+
+    def evaluate(self, alpha):
+        """
+        Evalúa la prueba con un nivel de significancia a partir del estadístico ya calculado, sin recorrer la muestra.
+
+        Parámetros:
+            alpha (float): Nivel de significancia.
+
+        Retorna:
+            bool: True si los números pseudoaleatorios pasan la prueba de huecos, False de lo contrario.
+        """
+        self.alpha = alpha
+        self.chi_invert = CriticalValues.chi2_isf(alpha, self.max_gap)
+        return self.chi_squared < self.chi_invert
+
+    @property
+    def p_value(self):
+        """
+        Obtiene la probabilidad de observar un estadístico igual o mayor si la muestra es uniforme.
+
+        Retorna:
+            float: Valor p del estadístico.
+        """
+        return CriticalValues.chi2_sf(self.chi_squared, self.max_gap)
+
+    def set_pseudo_random_numbers(self, pseudo_random_numbers, summary=None):
+        """
+        Establece la lista de números pseudoaleatorios para la prueba de huecos.
+
+        Parámetros:
+            pseudo_random_numbers (list | numpy.ndarray): Números pseudoaleatorios.
+            summary (SampleSummary, opcional): Resumen de la misma muestra con el acumulador 'gap'.
+        """
+        self.pseudo_random_numbers = MathUtils.to_float_array(pseudo_random_numbers)
+        self.summary = summary
+
+    @property
+    def get_chi_squared(self):
+        """
+        Obtiene el estadístico calculado de la prueba de huecos.
+
+        Retorna:
+            float: Estadístico chi-cuadrado de las longitudes de los huecos.
+        """
+        return self.chi_squared
+
+    @property
+    def get_chi_invert(self):
+        """
+        Obtiene el valor crítico de chi-cuadrado calculado.
+
+        Retorna:
+            float: Valor crítico de chi-cuadrado.
+        """
+        return self.chi_invert
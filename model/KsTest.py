@@ -1,4 +1,17 @@
+import functools
+import math
+
+import numpy as np
+
 from model.Constants import Constants
+from model.SampleSummary import SampleSummary
+from model.accumulators.HistogramAccumulator import HistogramAccumulator
+from model.accumulators.MomentsAccumulator import MomentsAccumulator
+from model.accumulators.TestAccumulator import TestAccumulator
+from model.util.ChunkedSample import ChunkedSample
+from model.util.CriticalValues import CriticalValues
+from model.util.Instrumentation import Instrumentation
+from model.util.MathUtils import MathUtils
 
 
 class KsTest:
@@ -6,17 +19,31 @@ class KsTest:
     Clase para realizar la prueba de Kolmogorov-Smirnov en una lista de números pseudoaleatorios.
 
     Atributos:
-        pseudo_random_numbers (list): Lista de números pseudoaleatorios a analizar.
+        pseudo_random_numbers (numpy.ndarray): Arreglo float64 de números pseudoaleatorios a analizar.
         intervals_amount (int): Cantidad de intervalos en los que se divide el rango de los números pseudoaleatorios para la prueba.
         intervals (list): Lista de los límites superiores de cada intervalo.
-        frequencies (list): Lista de frecuencias observadas de números pseudoaleatorios en cada intervalo.
-        obtained_accumulated_frequency (list): Lista de frecuencias acumuladas observadas en cada intervalo.
-        probability_obtained (list): Lista de probabilidades acumuladas observadas en cada intervalo.
-        expected_accumulated_frequency (list): Lista de frecuencias acumuladas esperadas en cada intervalo bajo la hipótesis de uniformidad.
-        probability_expected (list): Lista de probabilidades acumuladas esperadas en cada intervalo bajo la hipótesis de uniformidad.
-        difference (list): Lista de diferencias absolutas entre las probabilidades acumuladas observadas y esperadas en cada intervalo.
+        frequencies (numpy.ndarray): Frecuencias observadas de números pseudoaleatorios en cada intervalo.
+        obtained_accumulated_frequency (numpy.ndarray): Frecuencias acumuladas observadas en cada intervalo.
+        probability_obtained (numpy.ndarray): Probabilidades acumuladas observadas en cada intervalo.
+        expected_accumulated_frequency (numpy.ndarray): Frecuencias acumuladas esperadas en cada intervalo bajo la hipótesis de uniformidad.
+        probability_expected (numpy.ndarray): Probabilidades acumuladas esperadas en cada intervalo bajo la hipótesis de uniformidad.
+        difference (numpy.ndarray): Diferencias absolutas entre las probabilidades acumuladas observadas y esperadas en cada intervalo.
         max_difference (float): Máxima diferencia absoluta entre las probabilidades acumuladas observadas y esperadas en todos los intervalos.
+        alpha (float): Nivel de significancia con el que se evaluó la prueba.
+        critical_difference (float): Valor crítico de max_difference: el de D para Constants.DMAXP_SIZE números,
+            redondeado hacia arriba a cuatro decimales; con alpha = 0.05 es Constants.DMAXP.
+        sample_size (int): Tamaño de la muestra de la prueba exacta.
+        summary (SampleSummary): Resumen estadístico de la muestra.
+        d_plus (float): Máximo de Fn(x) - x en la prueba exacta.
+        d_minus (float): Máximo de x - Fn(x) en la prueba exacta.
+        d_statistic (float): Estadístico D = max(D+, D-) de la prueba exacta.
+        critical_value (float): Valor crítico de D para el tamaño de la muestra.
+        p_value (float): Probabilidad de observar un D igual o mayor si la muestra es uniforme.
+        error_bound (float): Error máximo de D; 0 si se ordenó la muestra, 1 / SKETCH_BINS si se usó el histograma.
     """
+    EXACT_SORT_LIMIT = 1 << 27
+    SKETCH_BINS = 1 << 20
+    BLOCK_SIZE = 1 << 20
 
     def __init__(self, intervals_amount):
         """
@@ -25,7 +52,7 @@ class KsTest:
         Parámetros:
             intervals_amount (int): Cantidad de intervalos para la prueba de Kolmogorov-Smirnov.
         """
-        self.pseudo_random_numbers = []
+        self.pseudo_random_numbers = np.empty(0, dtype=np.float64)
         self.intervals_amount = intervals_amount
         self.intervals = []
         self.frequencies = []
@@ -35,6 +62,16 @@ class KsTest:
         self.probability_expected = []
         self.difference = []
         self.max_difference = 0
+        self.alpha = Constants.ALPHA
+        self.critical_difference = Constants.DMAXP
+        self.sample_size = 0
+        self.summary = None
+        self.d_plus = 0
+        self.d_minus = 0
+        self.d_statistic = 0
+        self.critical_value = 0
+        self.p_value = 1
+        self.error_bound = 0
 
     def execute_test(self):
         """
@@ -50,81 +87,222 @@ class KsTest:
         self.calculate_expected_accumulated_frequencies()
         self.calculate_expected_probabilities()
         self.calculate_differences()
-        return not (self.max_difference > Constants.DMAXP)
+        return self.evaluate(self.alpha)
+
+    def evaluate(self, alpha):
+        """
+        Evalúa la prueba con un nivel de significancia a partir de la diferencia máxima ya calculada, sin recorrer la
+        muestra.
+
+        Parámetros:
+            alpha (float): Nivel de significancia.
+
+        Retorna:
+            bool: True si los números pasan la prueba, False de lo contrario.
+        """
+        self.alpha = alpha
+        self.critical_difference = math.ceil(CriticalValues.kstwo_isf(alpha, Constants.DMAXP_SIZE) * 10 ** 4) / 10 ** 4
+        return not (self.max_difference > self.critical_difference)
+
+    @property
+    def difference_p_value(self):
+        """
+        Obtiene la probabilidad de observar una diferencia máxima igual o mayor si la muestra es uniforme, con la
+        misma distribución de la que sale critical_difference.
+
+        Retorna:
+            float: Valor p de max_difference.
+        """
+        return CriticalValues.kstwo_sf(self.max_difference, Constants.DMAXP_SIZE)
+
+    def execute_exact_test(self, alpha=None):
+        """
+        Ejecuta la prueba de Kolmogorov-Smirnov con el estadístico D continuo, sin agrupar la muestra en intervalos.
+
+        El valor crítico y el valor p salen de la distribución exacta de D para el tamaño de la muestra.
+
+        Parámetros:
+            alpha (float, opcional): Nivel de significancia; por defecto, alpha.
+
+        Retorna:
+            bool: True si los números pasan la prueba, False de lo contrario.
+        """
+        self.calculate_exact_statistic()
+        self.sample_size = self.sample_summary().count
+        self.p_value = CriticalValues.kstwo_sf(self.d_statistic, self.sample_size)
+        return self.evaluate_exact(self.alpha if alpha is None else alpha)
+
+    def evaluate_exact(self, alpha):
+        """
+        Evalúa la prueba exacta con un nivel de significancia a partir del estadístico D ya calculado, sin recorrer
+        la muestra.
+
+        Parámetros:
+            alpha (float): Nivel de significancia.
+
+        Retorna:
+            bool: True si los números pasan la prueba, False de lo contrario.
+        """
+        self.alpha = alpha
+        self.critical_value = CriticalValues.kstwo_isf(alpha, self.sample_size)
+        return self.d_statistic <= self.critical_value
+
+    def calculate_exact_statistic(self):
+        """
+        Calcula D+, D- y D contra la distribución uniforme en [0, 1).
+
+        La muestra se ordena en memoria si tiene a lo sumo EXACT_SORT_LIMIT números y no se lee por bloques; en
+        ese caso D es exacto. Si no, se usa un histograma de SKETCH_BINS intervalos que se obtiene en un recorrido;
+        ver calculate_sketch_statistic.
+        """
+        summary = self.sample_summary()
+        if not summary.count:
+            raise ValueError("No hay números pseudoaleatorios")
+        if isinstance(self.pseudo_random_numbers, ChunkedSample) or summary.count > self.EXACT_SORT_LIMIT:
+            self.calculate_sketch_statistic()
+        else:
+            with Instrumentation.phase('sort', 'ks_exact'):
+                sorted_numbers = np.sort(np.asarray(self.pseudo_random_numbers, dtype=np.float64))
+            self.calculate_sorted_statistic(sorted_numbers)
+        self.d_statistic = max(self.d_plus, self.d_minus)
+
+    def calculate_sorted_statistic(self, sorted_numbers):
+        """
+        Calcula D+ y D- exactos a partir de la muestra ordenada, por bloques para no crear arreglos auxiliares de
+        todo su tamaño.
+
+        Parámetros:
+            sorted_numbers (numpy.ndarray): Muestra ordenada de menor a mayor.
+        """
+        n = len(sorted_numbers)
+        self.d_plus = self.d_minus = 0.0
+        for start in range(0, n, self.BLOCK_SIZE):
+            cdf = np.clip(sorted_numbers[start:start + self.BLOCK_SIZE], 0, 1)
+            ranks = np.arange(start, start + len(cdf), dtype=np.float64)
+            self.d_plus = max(self.d_plus, float(np.max((ranks + 1) / n - cdf)))
+            self.d_minus = max(self.d_minus, float(np.max(cdf - ranks / n)))
+        self.error_bound = 0
+
+    def calculate_sketch_statistic(self):
+        """
+        Acota D+ y D- con un histograma de SKETCH_BINS intervalos iguales, sin ordenar la muestra.
+
+        Si G(e) es la fracción de números menores que el límite e, dentro del intervalo [e_j, e_j+1) se cumple
+        G(e_j) <= Fn(x) <= G(e_j+1), así que max(G(e_j+1) - e_j) y max(e_j+1 - G(e_j)) acotan por arriba a D+ y D-
+        y exceden su valor real en a lo sumo el ancho de un intervalo. El error queda en error_bound.
+        """
+        summary = self.sample_summary()
+        counts = summary.histogram(HistogramAccumulator.uniform(self.SKETCH_BINS))
+        below = np.concatenate(([0], np.cumsum(counts))) / summary.count
+        edges = np.arange(self.SKETCH_BINS + 1) / self.SKETCH_BINS
+        self.d_plus = max(float(np.max(below[1:] - edges[:-1])), 0.0)
+        self.d_minus = max(float(np.max(edges[1:] - below[:-1])), 0.0)
+        self.error_bound = 1 / self.SKETCH_BINS
 
     def calculate_intervals(self):
         """
         Calcula los intervalos para la prueba de Kolmogorov-Smirnov.
         """
-        start = 0
-        end = 1
-        width = (end - start) / self.intervals_amount
-        aux = start
-        for i in range(self.intervals_amount):
-            aux += width
-            self.intervals.append(round(aux, 2))
+        self.intervals = list(KsTest.interval_limits(self.intervals_amount))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def interval_limits(intervals_amount):
+        """
+        Calcula los límites superiores de los intervalos iguales de [0, 1); se calculan una vez por cantidad.
+
+        Parámetros:
+            intervals_amount (int): Cantidad de intervalos.
+
+        Retorna:
+            tuple: Límites i / intervals_amount, para i de 1 a intervals_amount.
+        """
+        return tuple(i / intervals_amount for i in range(1, intervals_amount + 1))
+
+    def create_histogram(self):
+        """
+        Crea el acumulador de frecuencias de la prueba.
+
+        Retorna:
+            HistogramAccumulator: Acumulador vacío con los intervalos de la prueba.
+        """
+        return HistogramAccumulator.uniform(self.intervals_amount)
+
+    def create_accumulator(self):
+        """
+        Crea un acumulador de la prueba que puede alimentarse por bloques y unirse con otros.
+
+        Retorna:
+            TestAccumulator: Acumulador vacío de la prueba.
+        """
+        return TestAccumulator(self, 'execute_test', {
+            'moments': MomentsAccumulator(),
+            'ks': self.create_histogram(),
+        })
 
     def calculate_frequencies(self):
         """
         Calcula las frecuencias de los números pseudoaleatorios en cada intervalo.
+
+        Cada número se asigna al primer intervalo cuyo límite superior es mayor que él; los números
+        que no son menores que el último límite no se cuentan. El intervalo se calcula directamente, así que el
+        costo no depende de la cantidad de intervalos.
         """
-        self.frequencies = [0] * self.intervals_amount
-        for number in self.pseudo_random_numbers:
-            for i in range(len(self.intervals)):
-                if number < self.intervals[i]:
-                    self.frequencies[i] += 1
-                    break
+        self.frequencies = self.sample_summary().histogram(self.create_histogram())
 
     def calculate_obtained_frequencies(self):
         """
         Calcula las frecuencias acumuladas obtenidas de los números pseudoaleatorios.
         """
-        self.obtained_accumulated_frequency = [0] * self.intervals_amount
-        for i in range(len(self.frequencies)):
-            self.obtained_accumulated_frequency[i] = self.frequencies[i] + self.obtained_accumulated_frequency[i - 1]
+        self.obtained_accumulated_frequency = np.cumsum(self.frequencies)
 
     def calculate_probabilities(self):
         """
         Calcula las probabilidades acumuladas obtenidas de los números pseudoaleatorios.
         """
-        self.probability_obtained = [0] * self.intervals_amount
-        for i in range(len(self.obtained_accumulated_frequency)):
-            self.probability_obtained[i] = self.obtained_accumulated_frequency[i] / len(self.pseudo_random_numbers)
+        self.probability_obtained = self.obtained_accumulated_frequency / self.sample_summary().count
 
     def calculate_expected_accumulated_frequencies(self):
         """
         Calcula las frecuencias acumuladas esperadas para cada intervalo.
         """
-        self.expected_accumulated_frequency = [0] * self.intervals_amount
-        expected_frequency = len(self.pseudo_random_numbers) / self.intervals_amount
-        for i in range(len(self.probability_obtained)):
-            self.expected_accumulated_frequency[i] = expected_frequency * (i + 1)
+        expected_frequency = self.sample_summary().count / self.intervals_amount
+        self.expected_accumulated_frequency = expected_frequency * np.arange(1, self.intervals_amount + 1)
 
     def calculate_expected_probabilities(self):
         """
         Calcula las probabilidades acumuladas esperadas para cada intervalo.
         """
-        self.probability_expected = [0] * self.intervals_amount
-        for i in range(len(self.expected_accumulated_frequency)):
-            self.probability_expected[i] = self.expected_accumulated_frequency[i] / len(self.pseudo_random_numbers)
+        self.probability_expected = self.expected_accumulated_frequency / self.sample_summary().count
 
     def calculate_differences(self):
         """
         Calcula las diferencias absolutas entre las probabilidades acumuladas obtenidas y esperadas.
         """
-        self.difference = [0] * self.intervals_amount
-        for i in range(len(self.difference)):
-            self.difference[i] = round(abs(self.probability_expected[i] - self.probability_obtained[i]), 5)
-        self.max_difference = max(self.difference)
+        self.difference = np.round(np.abs(self.probability_expected - self.probability_obtained), 5)
+        self.max_difference = float(self.difference.max())
 
-    def set_pseudo_random_numbers(self, pseudo_random_numbers):
+    def set_pseudo_random_numbers(self, pseudo_random_numbers, summary=None):
         """
         Establece la lista de números pseudoaleatorios para la prueba de Kolmogorov-Smirnov.
 
         Parámetros:
-            pseudo_random_numbers (list): Lista de números pseudoaleatorios.
+            pseudo_random_numbers (list | numpy.ndarray): Números pseudoaleatorios.
+            summary (SampleSummary, opcional): Resumen ya calculado de la misma muestra.
+        """
+        self.pseudo_random_numbers = MathUtils.to_float_array(pseudo_random_numbers)
+        self.summary = summary
+
+    def sample_summary(self):
+        """
+        Obtiene el resumen estadístico de la muestra, calculándolo si ninguna otra prueba lo compartió.
+
+        Retorna:
+            SampleSummary: Resumen de la muestra actual.
         """
-        self.pseudo_random_numbers = pseudo_random_numbers
+        if self.summary is None:
+            self.summary = SampleSummary(self.pseudo_random_numbers)
+        return self.summary
 
     @property
     def get_max_difference(self):
@@ -1,8 +1,12 @@
 import math
 
-from scipy.stats import norm
+import numpy as np
 from model.Constants import Constants
-from statistics import mean
+from model.SampleSummary import SampleSummary
+from model.accumulators.MomentsAccumulator import MomentsAccumulator
+from model.accumulators.TestAccumulator import TestAccumulator
+from model.util.CriticalValues import CriticalValues
+from model.util.MathUtils import MathUtils
 
 
 class MeanTest:
@@ -10,50 +14,78 @@ class MeanTest:
     Clase para realizar la prueba de la media en una lista de números pseudoaleatorios.
 
     Atributos:
-        pseudo_random_numbers (list): Lista de números pseudoaleatorios a analizar.
+        pseudo_random_numbers (numpy.ndarray): Arreglo float64 de números pseudoaleatorios a analizar.
         r (float): Promedio de los números pseudoaleatorios.
+        count (int): Cantidad de números de la muestra.
+        alpha (float): Nivel de significancia con el que se evaluó la prueba.
         half_alpha (float): Mitad del nivel de significancia alpha.
         zeta (float): Valor crítico de la distribución normal estándar para el nivel de confianza.
         lower_limit (float): Límite inferior del intervalo de confianza para la media.
         higher_limit (float): Límite superior del intervalo de confianza para la media.
         status (bool): Indica si los números pseudoaleatorios pasan la prueba de la media.
+        summary (SampleSummary): Resumen estadístico de la muestra.
     """
 
     def __init__(self):
         """
         Inicializa una instancia de la clase MeanTest.
         """
-        self.pseudo_random_numbers = []
+        self.pseudo_random_numbers = np.empty(0, dtype=np.float64)
         self.r = 0
+        self.count = 0
+        self.alpha = Constants.ALPHA
         self.half_alpha = 0
         self.zeta = 0
         self.lower_limit = 0
         self.higher_limit = 0
         self.status = False
+        self.summary = None
 
-    def set_pseudo_random_numbers(self, pseudo_random_numbers):
+    def set_pseudo_random_numbers(self, pseudo_random_numbers, summary=None):
         """
         Establece la lista de números pseudoaleatorios para la prueba de la media.
 
         Parámetros:
-            pseudo_random_numbers (list): Lista de números pseudoaleatorios.
+            pseudo_random_numbers (list | numpy.ndarray): Números pseudoaleatorios.
+            summary (SampleSummary, opcional): Resumen ya calculado de la misma muestra.
         """
-        self.pseudo_random_numbers = pseudo_random_numbers
+        self.pseudo_random_numbers = MathUtils.to_float_array(pseudo_random_numbers)
+        self.summary = summary
+
+    def sample_summary(self):
+        """
+        Obtiene el resumen estadístico de la muestra, calculándolo si ninguna otra prueba lo compartió.
+
+        Retorna:
+            SampleSummary: Resumen de la muestra actual.
+        """
+        if self.summary is None:
+            self.summary = SampleSummary(self.pseudo_random_numbers)
+        return self.summary
+
+    def create_accumulator(self):
+        """
+        Crea un acumulador de la prueba que puede alimentarse por bloques y unirse con otros.
+
+        Retorna:
+            TestAccumulator: Acumulador vacío de la prueba.
+        """
+        return TestAccumulator(self, 'execute_test', {'moments': MomentsAccumulator()})
 
     def calculate_average(self):
         """
         Calcula el promedio de la lista de números pseudoaleatorios.
         """
-        if self.pseudo_random_numbers:
-            self.r = mean(self.pseudo_random_numbers)
+        if self.sample_summary().count:
+            self.r = self.sample_summary().mean
         return self.r
 
     def calculate_zeta(self):
         """
         Calcula el valor crítico de la distribución normal estándar para el nivel de confianza.
         """
-        self.half_alpha = 1 - (Constants.ALPHA / 2)
-        self.zeta = norm.ppf(self.half_alpha)
+        self.half_alpha = 1 - (self.alpha / 2)
+        self.zeta = CriticalValues.norm_ppf(self.half_alpha)
 
     def calculate_lower_limit(self, zeta, n):
         """
@@ -90,17 +122,45 @@ class MeanTest:
         Retorna:
             bool: True si los números pasan la prueba, False de lo contrario.
         """
-        if not self.pseudo_random_numbers:
+        self.count = self.sample_summary().count
+        if not self.count:
             print("La lista de números pseudoaleatorios está vacía.")
             return False
         self.calculate_average()
+        return self.evaluate(self.alpha)
+
+    def evaluate(self, alpha):
+        """
+        Evalúa la prueba con un nivel de significancia a partir del promedio ya calculado, sin recorrer la muestra.
+
+        Parámetros:
+            alpha (float): Nivel de significancia.
+
+        Retorna:
+            bool: True si los números pasan la prueba, False de lo contrario.
+        """
+        self.alpha = alpha
+        if not self.count:
+            return False
         self.calculate_zeta()
-        n = len(self.pseudo_random_numbers)
-        self.lower_limit = self.calculate_lower_limit(self.zeta, n)
-        self.higher_limit = self.calculate_higher_limit(self.zeta, n)
+        self.lower_limit = self.calculate_lower_limit(self.zeta, self.count)
+        self.higher_limit = self.calculate_higher_limit(self.zeta, self.count)
         self.status = self.lower_limit <= self.r <= self.higher_limit
         return self.status
 
+    @property
+    def p_value(self):
+        """
+        Obtiene la probabilidad de observar un promedio al menos tan alejado de 0.5, por cualquiera de los dos
+        lados, si la muestra es uniforme.
+
+        Retorna:
+            float: Valor p del promedio.
+        """
+        if not self.count:
+            return None
+        return min(2 * CriticalValues.norm_sf(abs(self.r - 0.5) * math.sqrt(12 * self.count)), 1.0)
+
     @property
     def get_r(self):
         """
@@ -0,0 +1,216 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from model.SampleSummary import SampleSummary
+from model.accumulators.MomentsAccumulator import MomentsAccumulator
+from model.util.NormalizedArray import NormalizedArray
+from model.util.SampleFingerprint import SampleFingerprint
+
+
+def accumulate_shard(source, start, stop, parts, chunk_size):
+    """
+    Alimenta acumuladores con un fragmento de la muestra; se ejecuta en un proceso del grupo.
+
+    Parámetros:
+        source (tuple): Descripción de dónde leer la muestra, creada por ParallelRunner.describe_sample.
+        start (int): Posición del primer número del fragmento.
+        stop (int): Posición siguiente al último número del fragmento.
+        parts (dict): Acumuladores vacíos indexados por nombre.
+        chunk_size (int): Cantidad de números por bloque.
+
+    Retorna:
+        dict: Los mismos acumuladores, alimentados con el fragmento.
+    """
+    kind, location, dtype, offset, length, normalized = source
+    if kind == 'shared_memory':
+        memory = shared_memory.SharedMemory(name=location)
+        values = np.ndarray((length,), dtype=dtype, buffer=memory.buf)
+    else:
+        memory = None
+        values = np.memmap(location, dtype=dtype, mode='r', offset=offset, shape=(length,))
+    sample = NormalizedArray(values) if normalized else values
+    try:
+        # Los acumuladores que combinan números consecutivos leen los anteriores al fragmento, con los que se
+        # completan las tuplas, comparaciones y productos que empiezan antes de él
+        for part in parts.values():
+            if hasattr(part, 'prime'):
+                part.prime(sample, start)
+        for chunk_start in range(start, stop, chunk_size):
+            chunk = sample[chunk_start:min(chunk_start + chunk_size, stop)]
+            for part in parts.values():
+                part.update(chunk)
+    finally:
+        del values, sample
+        if memory is not None:
+            memory.close()
+    return parts
+
+
+class ParallelRunner:
+    """
+    Ejecuta la batería de pruebas repartiendo la muestra entre un grupo de procesos.
+
+    La muestra se divide en fragmentos contiguos y cada proceso alimenta con el suyo los acumuladores de las
+    pruebas: momentos, histogramas con intervalos conocidos, la huella de la muestra y los conteos de
+    Tests.create_counters, salvo los que marcan SEQUENTIAL porque cada parte depende de todas las anteriores, como
+    CouponAccumulator. Los procesos leen la muestra de memoria compartida, o directamente del archivo si está
+    mapeada en memoria, así que nunca se serializa; solo viajan los acumuladores, que ocupan unos pocos kilobytes
+    (la huella, unos bytes por cada SampleFingerprint.SEGMENT_SIZE números). Si el histograma de chi-cuadrado
+    depende del mínimo y el máximo globales, se hace una segunda ronda después de unir los momentos. Los acumuladores
+    unidos forman un SampleSummary que se instala en Tests, de modo que las pruebas dejan sus resultados en los
+    mismos atributos.
+
+    Atributos:
+        tests (Tests): Batería de pruebas cuya muestra se analiza.
+        workers (int): Cantidad de procesos.
+        chunk_size (int): Cantidad de números por bloque dentro de cada fragmento.
+    """
+    CHUNK_SIZE = 1 << 20
+
+    def __init__(self, tests, workers=None, chunk_size=CHUNK_SIZE):
+        """
+        Inicializa una instancia de ParallelRunner.
+
+        Parámetros:
+            tests (Tests): Batería de pruebas con la muestra ya establecida.
+            workers (int, opcional): Cantidad de procesos; por defecto, la cantidad de núcleos.
+            chunk_size (int): Cantidad de números por bloque dentro de cada fragmento.
+        """
+        self.tests = tests
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+
+    @staticmethod
+    def can_share(sample):
+        """
+        Indica si la muestra puede repartirse entre procesos sin serializarla.
+
+        Parámetros:
+            sample (numpy.ndarray | NormalizedArray | ChunkedSample): Muestra a analizar.
+
+        Retorna:
+            bool: True para arreglos en memoria o mapeados; False para muestras que se leen por bloques.
+        """
+        return isinstance(sample, (np.ndarray, NormalizedArray))
+
+    def run(self):
+        """
+        Resume la muestra en paralelo y ejecuta todas las pruebas sobre el resumen.
+
+        Retorna:
+            list: Resultado de cada prueba de Tests.TEST_NAMES, en ese orden.
+        """
+        self.tests.use_summary(self.summarize())
+        return [getattr(self.tests, f'execute_{test_name}_test')() for test_name in self.tests.TEST_NAMES]
+
+    def summarize(self):
+        """
+        Calcula en paralelo el resumen de la muestra que necesitan todas las pruebas.
+
+        Retorna:
+            SampleSummary: Resumen con momentos, histogramas y conteos de la muestra completa.
+        """
+        sample = self.tests.pseudo_random_numbers
+        memory = None
+        raw = sample.raw if isinstance(sample, NormalizedArray) else sample
+        source = self.describe_sample(raw, isinstance(sample, NormalizedArray))
+        if source is None:
+            memory = shared_memory.SharedMemory(create=True, size=max(raw.nbytes, 1))
+            np.ndarray(raw.shape, dtype=raw.dtype, buffer=memory.buf)[:] = raw
+            source = ('shared_memory', memory.name, raw.dtype.str, 0, len(raw), isinstance(sample, NormalizedArray))
+
+        try:
+            context = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(max_workers=self.workers, mp_context=context) as pool:
+                # Los acumuladores secuenciales no se reparten; sus pruebas recorren la muestra al ejecutarse
+                counters = {name: part for name, part in self.tests.create_counters().items()
+                            if not getattr(part, 'SEQUENTIAL', False)}
+                parts = self.accumulate(pool, source, len(raw), {
+                    'moments': MomentsAccumulator(),
+                    **dict(zip(('ks', 'chi'), self.tests.create_histograms())),
+                    **counters,
+                    'fingerprint': SampleFingerprint(),
+                })
+                fingerprint = parts.pop('fingerprint')
+                moments = parts['moments']
+                if moments.count and self.tests.chi_test.domain is None:
+                    try:
+                        chi_histogram = self.tests.chi_test.create_histogram(
+                            *self.tests.chi_test.interval_range(moments))
+                        parts.update(self.accumulate(pool, source, len(raw), {'chi': chi_histogram}))
+                    except ValueError:
+                        # Sin intervalos válidos la prueba de chi-cuadrado informa el error al ejecutarse
+                        pass
+        finally:
+            if memory is not None:
+                memory.close()
+                memory.unlink()
+        summary = SampleSummary.from_accumulators(parts, sample)
+        summary.fingerprint = fingerprint.hexdigest
+        summary.progress = self.tests.progress
+        return summary
+
+    def accumulate(self, pool, source, length, parts):
+        """
+        Reparte la muestra en fragmentos, los acumula en el grupo de procesos y une los resultados en orden.
+
+        El avance se informa a la función progress de Tests cada vez que termina un fragmento; si la función lanza
+        una excepción, los fragmentos pendientes se cancelan.
+
+        Parámetros:
+            pool (ProcessPoolExecutor): Grupo de procesos.
+            source (tuple): Descripción de dónde leer la muestra.
+            length (int): Cantidad de números de la muestra.
+            parts (dict): Acumuladores vacíos indexados por nombre.
+
+        Retorna:
+            dict: Acumuladores de la muestra completa.
+        """
+        # Varios fragmentos por proceso reparten mejor la carga si algún núcleo está ocupado
+        shard_size = max(-(-length // (self.workers * 4)), 1)
+        futures = [pool.submit(accumulate_shard, source, start, min(start + shard_size, length), parts,
+                               self.chunk_size)
+                   for start in range(0, length, shard_size)]
+        merged = None
+        processed = 0
+        try:
+            for future in futures:
+                shard_parts = future.result()
+                if merged is None:
+                    merged = shard_parts
+                else:
+                    for name, part in shard_parts.items():
+                        merged[name].merge(part)
+                processed = min(processed + shard_size, length)
+                if self.tests.progress is not None:
+                    self.tests.progress(processed, length)
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+        return merged if merged is not None else parts
+
+    @staticmethod
+    def describe_sample(values, normalized):
+        """
+        Describe un arreglo mapeado en memoria para que cada proceso lo abra por su cuenta.
+
+        Parámetros:
+            values (numpy.ndarray): Arreglo de la muestra.
+            normalized (bool): True si los procesos deben normalizarlo con NormalizedArray.
+
+        Retorna:
+            tuple | None: ('file', ruta, tipo, desplazamiento, cantidad, normalized), o None si el arreglo no
+            proviene de un archivo mapeado y debe copiarse a memoria compartida.
+        """
+        base = values
+        while isinstance(base, np.ndarray) and not isinstance(base, np.memmap):
+            base = base.base
+        if not isinstance(base, np.memmap) or getattr(base, 'filename', None) is None or not values.flags.c_contiguous:
+            return None
+        offset = base.offset + values.__array_interface__['data'][0] - base.__array_interface__['data'][0]
+        return 'file', base.filename, values.dtype.str, offset, len(values), normalized
@@ -1,94 +1,156 @@
-from collections import Counter
-
 import numpy as np
-from scipy.stats import chi2
+
+from model.Constants import Constants
+from model.accumulators.PokerAccumulator import PokerAccumulator
+from model.accumulators.TestAccumulator import TestAccumulator
+from model.util.CriticalValues import CriticalValues
+from model.util.HandTable import HandTable
+from model.util.MathUtils import MathUtils
 
 
 class PokerTest:
     """
     Clase para realizar la prueba de póker en una lista de números pseudoaleatorios.
 
+    Cada número aporta una mano formada por sus primeros digit_length decimales. Las manos se clasifican con la
+    tabla precalculada de HandTable, de la que también salen las probabilidades esperadas de cada categoría.
+
     Atributos:
-        pseudo_random_numbers (list): Lista de números pseudoaleatorios a analizar.
+        pseudo_random_numbers (numpy.ndarray): Arreglo float64 de números pseudoaleatorios a analizar.
+        digit_length (int): Cantidad de decimales de cada mano, entre 2 y 7.
         expected_counts (dict): Diccionario que contiene las frecuencias esperadas para cada categoría de mano de póker.
         category_counts (dict): Diccionario que contiene las frecuencias observadas para cada categoría de mano de póker.
         chi_squared (float): Valor de chi cuadrado calculado a partir de las frecuencias observadas y esperadas.
         x_square (float): Valor crítico de chi cuadrado para el nivel de significancia deseado.
+        alpha (float): Nivel de significancia con el que se evaluó la prueba.
+        summary (SampleSummary): Resumen de la muestra que puede traer el conteo de manos ya hecho.
     """
-    def __init__(self):
+    # Margen que evita que 0.3 * 10 ** 5 = 29999.999999999996 se trunque a 29999
+    ROUNDING = 1e-6
+    CHUNK_SIZE = 1 << 20
+
+    def __init__(self, digit_length=5):
         """
         Inicializa una instancia de la clase PokerTest.
+
+        Parámetros:
+            digit_length (int): Cantidad de decimales de cada mano, entre 2 y 7.
+
+        Raises:
+            ValueError: Si el tamaño de mano está fuera de los límites de HandTable.
         """
-        self.pseudo_random_numbers = []
+        HandTable.check_digit_length(digit_length)
+        self.pseudo_random_numbers = np.empty(0, dtype=np.float64)
+        self.digit_length = digit_length
         self.expected_counts = {}
         self.category_counts = {}
         self.chi_squared = 0
         self.x_square = 0
+        self.alpha = Constants.ALPHA
+        self.summary = None
+
+    def create_hand_counter(self, digit_length=None):
+        """
+        Crea un acumulador vacío que cuenta las manos de cada categoría por bloques.
+
+        Parámetros:
+            digit_length (int, opcional): Cantidad de decimales de cada mano; por defecto, la de la prueba.
+
+        Retorna:
+            PokerAccumulator: Acumulador vacío.
+        """
+        return PokerAccumulator(type(self), digit_length or self.digit_length)
 
-    def classify_hand(self, digits):
+    def create_accumulator(self):
+        """
+        Crea un acumulador de la prueba que puede alimentarse por bloques y unirse con otros.
+
+        Retorna:
+            TestAccumulator: Acumulador vacío de la prueba.
+        """
+        return TestAccumulator(self, 'execute_poker_test', {'poker': self.create_hand_counter()})
+
+    @staticmethod
+    def categories(digit_length):
+        """
+        Obtiene los nombres de las categorías de un tamaño de mano.
+
+        Parámetros:
+            digit_length (int): Cantidad de dígitos de cada mano.
+
+        Retorna:
+            tuple: Nombres en el orden de los índices que devuelve classify_hands.
+        """
+        return HandTable.categories(digit_length)
+
+    @staticmethod
+    def classify_hand(digits):
         """
         Clasifica una mano de póker dada una secuencia de dígitos.
 
         Parámetros:
-            digits (str): Secuencia de dígitos que representa una mano de póker.
+            digits (str | list): Secuencia de dígitos que representa una mano de póker.
 
         Retorna:
             str: Categoría de la mano de póker.
         """
-        counts = Counter(digits).values()
-        if len(counts) == 5:
-            return 'Todos diferentes'
-        elif len(counts) == 4:
-            return 'Un par'
-        elif len(counts) == 3:
-            if 3 in counts:
-                return 'Tercia'
-            else:
-                return 'Dos pares'
-        elif len(counts) == 2:
-            if 4 in counts:
-                return 'Poker'
-            else:
-                return 'Full'
-        else:
-            return 'Quintillas'
-
-    def execute_poker_test(self, digit_length=5):
+        hand = int(''.join(map(str, digits)))
+        return HandTable.categories(len(digits))[HandTable.table(len(digits))[hand]]
+
+    @classmethod
+    def extract_hands(cls, numbers, digit_length):
         """
-        Ejecuta la prueba de póker en la lista de números pseudoaleatorios.
+        Obtiene el entero que forman los primeros decimales de cada número, sin pasar por su representación en texto.
 
         Parámetros:
-            digit_length (int): Longitud de los dígitos a considerar para cada mano de póker.
+            numbers (numpy.ndarray): Arreglo float64 de números pseudoaleatorios.
+            digit_length (int): Cantidad de decimales de cada mano.
 
         Retorna:
-            bool: True si los números pseudoaleatorios pasan la prueba de póker, False de lo contrario.
+            numpy.ndarray: Arreglo int32 con una mano por número, entre 0 y 10 ** digit_length - 1.
+        """
+        scale = 10 ** digit_length
+        values = np.floor(np.mod(numbers, 1) * scale + cls.ROUNDING)
+        return np.minimum(values, scale - 1).astype(np.int32)
+
+    @staticmethod
+    def classify_hands(hands, digit_length):
+        """
+        Clasifica un conjunto de manos con una sola consulta a la tabla precalculada.
+
+        Parámetros:
+            hands (numpy.ndarray): Arreglo de manos como las devuelve extract_hands.
+            digit_length (int): Cantidad de dígitos de cada mano.
+
+        Retorna:
+            numpy.ndarray: Índice uint8 en categories(digit_length) de la categoría de cada mano.
         """
+        return HandTable.table(digit_length)[hands]
 
-        # Genera la secuencia de manos a partir de los números pseudoaleatorios
-        sequence = ''.join([str(number % 1)[2:7].ljust(5, '0') for number in self.pseudo_random_numbers])
-        hands = [sequence[i:i + digit_length] for i in range(0, len(sequence), digit_length)]
+    def execute_poker_test(self, digit_length=None):
+        """
+        Ejecuta la prueba de póker en la lista de números pseudoaleatorios.
 
-        # Clasifica cada mano y cuenta la frecuencia de cada categoría
-        categories = list(map(self.classify_hand, hands))
-        self.category_counts = Counter(categories)
+        Parámetros:
+            digit_length (int, opcional): Cantidad de decimales de cada mano; por defecto, la de la prueba.
 
-        # Asegúra que el valor de 'Quintillas' sea 0 si no está presente
-        if 'Quintillas' not in self.category_counts:
-            self.category_counts['Quintillas'] = 0
+        Retorna:
+            bool: True si los números pseudoaleatorios pasan la prueba de póker, False de lo contrario.
+        """
+        digit_length = digit_length or self.digit_length
 
-        # Calcula el número total de manos
-        total_hands = len(hands)
+        # Usa el conteo hecho al resumir la muestra si corresponde al mismo tamaño de mano
+        accumulator = self.summary.accumulators.get('poker') if self.summary is not None else None
+        if accumulator is None or accumulator.digit_length != digit_length:
+            accumulator = self.create_hand_counter(digit_length)
+            for chunk in MathUtils.iter_chunks(self.pseudo_random_numbers, self.CHUNK_SIZE):
+                accumulator.update(chunk)
+        self.category_counts, total_hands = accumulator.category_counts()
 
         # Define las frecuencias esperadas para cada categoría de mano
-        self.expected_counts = {
-            'Todos diferentes': 0.3024 * total_hands,
-            'Un par': 0.5040 * total_hands,
-            'Dos pares': 0.1080 * total_hands,
-            'Tercia': 0.0720 * total_hands,
-            'Full': 0.0090 * total_hands,
-            'Poker': 0.0045 * total_hands,
-            'Quintillas': 0.0001 * total_hands
-        }
+        probabilities = HandTable.probabilities(digit_length)
+        self.expected_counts = {category: probability * total_hands
+                                for category, probability in probabilities.items()}
 
         self.chi_squared = 0
 
@@ -98,14 +160,39 @@ class PokerTest:
             expected = self.expected_counts[category]
             self.chi_squared += np.power((observed - expected), 2) / expected
 
-        self.x_square = chi2.isf(0.05, 6)
+        return self.evaluate(self.alpha)
+
+    def evaluate(self, alpha):
+        """
+        Evalúa la prueba con un nivel de significancia a partir del estadístico ya calculado, sin recorrer la muestra.
+
+        Parámetros:
+            alpha (float): Nivel de significancia.
+
+        Retorna:
+            bool: True si los números pseudoaleatorios pasan la prueba de póker, False de lo contrario.
+        """
+        self.alpha = alpha
+        self.x_square = CriticalValues.chi2_isf(alpha, len(self.expected_counts) - 1)
         return self.chi_squared < self.x_square
 
-    def set_pseudo_random_numbers(self, pseudo_random_numbers):
+    @property
+    def p_value(self):
+        """
+        Obtiene la probabilidad de observar un estadístico igual o mayor si la muestra es uniforme.
+
+        Retorna:
+            float: Valor p del estadístico.
+        """
+        return CriticalValues.chi2_sf(self.chi_squared, len(self.expected_counts) - 1)
+
+    def set_pseudo_random_numbers(self, pseudo_random_numbers, summary=None):
         """
         Establece la lista de números pseudoaleatorios para la prueba de póker.
 
         Parámetros:
-            pseudo_random_numbers (list): Lista de números pseudoaleatorios.
+            pseudo_random_numbers (list | numpy.ndarray): Números pseudoaleatorios.
+            summary (SampleSummary, opcional): Resumen de la misma muestra con el acumulador 'poker'.
         """
-        self.pseudo_random_numbers = pseudo_random_numbers
+        self.pseudo_random_numbers = MathUtils.to_float_array(pseudo_random_numbers)
+        self.summary = summary
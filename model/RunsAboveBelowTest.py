@@ -0,0 +1,163 @@
+import math
+
+import numpy as np
+
+from model.Constants import Constants
+from model.accumulators.RunsAccumulator import RunsAccumulator
+from model.accumulators.TestAccumulator import TestAccumulator
+from model.util.CriticalValues import CriticalValues
+from model.util.MathUtils import MathUtils
+
+
+class RunsAboveBelowTest:
+    """
+    Clase para realizar la prueba de corridas arriba y abajo de la media en una lista de números pseudoaleatorios.
+
+    Una corrida es una racha de números consecutivos del mismo lado de 0.5, la media de la distribución uniforme;
+    se usa la media teórica y no la de la muestra para que la prueba se calcule en un solo recorrido. Con n0 números
+    debajo y n1 encima, la cantidad de corridas tiene media 2 n0 n1 / n + 1/2 y varianza
+    2 n0 n1 (2 n0 n1 - n) / (n^2 (n - 1)), y se aproxima a una normal.
+
+    Atributos:
+        pseudo_random_numbers (numpy.ndarray): Arreglo float64 de números pseudoaleatorios a analizar.
+        n (int): Cantidad de números.
+        below (int): Cantidad de números menores que 0.5.
+        above (int): Cantidad de números no menores que 0.5.
+        runs (int): Cantidad de corridas observadas.
+        expected_runs (float): Media de la cantidad de corridas.
+        variance (float): Varianza de la cantidad de corridas.
+        z (float): Estadístico normal estandarizado.
+        zeta (float): Valor crítico de la distribución normal estándar para el nivel de confianza.
+        alpha (float): Nivel de significancia con el que se evaluó la prueba.
+        summary (SampleSummary): Resumen de la muestra que puede traer el conteo de corridas ya hecho.
+    """
+    CHUNK_SIZE = 1 << 20
+
+    def __init__(self):
+        """
+        Inicializa una instancia de la clase RunsAboveBelowTest.
+        """
+        self.pseudo_random_numbers = np.empty(0, dtype=np.float64)
+        self.n = 0
+        self.below = 0
+        self.above = 0
+        self.runs = 0
+        self.expected_runs = 0
+        self.variance = 0
+        self.z = 0
+        self.zeta = 0
+        self.alpha = Constants.ALPHA
+        self.summary = None
+
+    @staticmethod
+    def create_runs_counter():
+        """
+        Crea un acumulador vacío que cuenta las corridas por bloques; lo comparte con RunsUpDownTest.
+
+        Retorna:
+            RunsAccumulator: Acumulador vacío.
+        """
+        return RunsAccumulator()
+
+    def create_accumulator(self):
+        """
+        Crea un acumulador de la prueba que puede alimentarse por bloques y unirse con otros.
+
+        Retorna:
+            TestAccumulator: Acumulador vacío de la prueba.
+        """
+        return TestAccumulator(self, 'execute_test', {'runs': self.create_runs_counter()})
+
+    def runs_counter(self):
+        """
+        Obtiene el conteo de corridas del resumen de la muestra o, si no lo trae, recorre la muestra por bloques.
+
+        Retorna:
+            RunsAccumulator: Conteo de la muestra completa.
+        """
+        accumulator = self.summary.accumulators.get('runs') if self.summary is not None else None
+        if accumulator is None:
+            accumulator = self.create_runs_counter()
+            for chunk in MathUtils.iter_chunks(self.pseudo_random_numbers, self.CHUNK_SIZE):
+                accumulator.update(chunk)
+        return accumulator
+
+    def execute_test(self):
+        """
+        Ejecuta la prueba de corridas arriba y abajo de la media.
+
+        Retorna:
+            bool: True si los números pseudoaleatorios pasan la prueba, False de lo contrario.
+
+        Raises:
+            ValueError: Si todos los números quedan del mismo lado de la media.
+        """
+        accumulator = self.runs_counter()
+        self.n = accumulator.count
+        self.above = accumulator.above
+        self.below = self.n - self.above
+        product = 2 * self.below * self.above
+        if not product or product <= self.n:
+            raise ValueError("Se necesitan números a ambos lados de la media")
+        self.runs = accumulator.side_changes + 1
+        self.expected_runs = product / self.n + 0.5
+        self.variance = product * (product - self.n) / (self.n ** 2 * (self.n - 1))
+        self.z = (self.runs - self.expected_runs) / math.sqrt(self.variance)
+        return self.evaluate(self.alpha)
+
+    def evaluate(self, alpha):
+        """
+        Evalúa la prueba con un nivel de significancia a partir del estadístico Z ya calculado, sin recorrer la
+        muestra.
+
+        Parámetros:
+            alpha (float): Nivel de significancia.
+
+        Retorna:
+            bool: True si los números pseudoaleatorios pasan la prueba, False de lo contrario.
+        """
+        self.alpha = alpha
+        self.zeta = CriticalValues.norm_ppf(1 - alpha / 2)
+        return abs(self.z) < self.zeta
+
+    @property
+    def p_value(self):
+        """
+        Obtiene la probabilidad de observar un estadístico Z al menos tan alejado de 0 si los números son
+        independientes.
+
+        Retorna:
+            float: Valor p de dos colas de Z.
+        """
+        return min(2 * CriticalValues.norm_sf(abs(self.z)), 1.0)
+
+    def set_pseudo_random_numbers(self, pseudo_random_numbers, summary=None):
+        """
+        Establece la lista de números pseudoaleatorios para la prueba de corridas.
+
+        Parámetros:
+            pseudo_random_numbers (list | numpy.ndarray): Números pseudoaleatorios.
+            summary (SampleSummary, opcional): Resumen de la misma muestra con el acumulador 'runs'.
+        """
+        self.pseudo_random_numbers = MathUtils.to_float_array(pseudo_random_numbers)
+        self.summary = summary
+
+    @property
+    def get_runs(self):
+        """
+        Obtiene la cantidad de corridas observadas.
+
+        Retorna:
+            int: Cantidad de corridas.
+        """
+        return self.runs
+
+    @property
+    def get_z(self):
+        """
+        Obtiene el estadístico normal de la prueba.
+
+        Retorna:
+            float: Estadístico estandarizado.
+        """
+        return self.z
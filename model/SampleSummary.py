@@ -0,0 +1,193 @@
+from model.accumulators.HistogramAccumulator import HistogramAccumulator
+from model.accumulators.MomentsAccumulator import MomentsAccumulator
+from model.util.ChunkedSample import ChunkedSample
+from model.util.Instrumentation import Instrumentation
+from model.util.SampleFingerprint import SampleFingerprint
+from model.util.MathUtils import MathUtils
+
+
+class SampleSummary:
+    """
+    Resumen estadístico de una muestra de números pseudoaleatorios compartido por todas las pruebas.
+
+    La muestra se recorre una sola vez, por bloques, para obtener la cantidad, la suma, la suma de cuadrados,
+    el mínimo, el máximo y los histogramas con límites conocidos de antemano. En el mismo recorrido se alimentan
+    los acumuladores adicionales que registren las pruebas, como el conteo de manos de la prueba de póker.
+    Los histogramas cuyos límites dependen del mínimo y el máximo se calculan la primera vez que se piden,
+    con un segundo recorrido, y quedan guardados.
+
+    Atributos:
+        pseudo_random_numbers (numpy.ndarray | NormalizedArray | ChunkedSample): Muestra resumida.
+        moments (MomentsAccumulator): Momentos y extremos de la muestra.
+        histograms (dict): Histogramas calculados, indexados por su distribución de intervalos.
+        accumulators (dict): Acumuladores adicionales alimentados en el recorrido, indexados por nombre.
+        fingerprint (str): Huella de la muestra calculada en el mismo recorrido (ver SampleFingerprint), o None si
+            el resumen se armó con acumuladores y no se conocen sus números.
+        progress (callable): Función que recibe los números recorridos y el total (o None si no se conoce)
+            después de cada bloque; puede lanzar una excepción para interrumpir el recorrido.
+    """
+    CHUNK_SIZE = 1 << 20
+
+    def __init__(self, pseudo_random_numbers, histograms=(), accumulators=None, progress=None):
+        """
+        Inicializa una instancia de la clase SampleSummary y recorre la muestra.
+
+        Parámetros:
+            pseudo_random_numbers (numpy.ndarray | NormalizedArray | ChunkedSample): Números pseudoaleatorios.
+            histograms (iterable): Acumuladores vacíos de los histogramas que se calculan en el mismo recorrido.
+            accumulators (dict, opcional): Acumuladores con un método update(chunk) que se alimentan en el mismo recorrido.
+            progress (callable, opcional): Función que se llama después de cada bloque recorrido.
+        """
+        self.pseudo_random_numbers = pseudo_random_numbers
+        self.progress = progress
+        self.moments = MomentsAccumulator()
+        self.histograms = {}
+        self.accumulators = dict(accumulators or {})
+        self.fingerprint = None
+        self.scan(list(histograms))
+
+    @classmethod
+    def from_accumulators(cls, accumulators, pseudo_random_numbers=None):
+        """
+        Crea un resumen a partir de acumuladores ya alimentados, sin recorrer la muestra.
+
+        Parámetros:
+            accumulators (dict): Acumuladores de momentos, de histogramas y adicionales, indexados por nombre.
+            pseudo_random_numbers (opcional): Muestra que se recorre si se pide un histograma no acumulado.
+
+        Retorna:
+            SampleSummary: Resumen con los valores acumulados.
+        """
+        summary = cls.__new__(cls)
+        summary.pseudo_random_numbers = pseudo_random_numbers
+        summary.progress = None
+        summary.moments = MomentsAccumulator()
+        summary.histograms = {}
+        summary.accumulators = {}
+        summary.fingerprint = None
+        for name, accumulator in accumulators.items():
+            if isinstance(accumulator, MomentsAccumulator):
+                summary.moments = accumulator
+            elif isinstance(accumulator, HistogramAccumulator):
+                summary.histograms[accumulator.key] = accumulator.counts
+            else:
+                summary.accumulators[name] = accumulator
+        return summary
+
+    def scan(self, histograms):
+        """
+        Recorre la muestra una vez y alimenta los momentos, los histogramas pedidos, los acumuladores adicionales y
+        la huella de la muestra.
+
+        Parámetros:
+            histograms (list): Acumuladores de histogramas a calcular.
+        """
+        fingerprint = SampleFingerprint()
+        consumers = [('moments', self.moments)] + [('histogram', histogram) for histogram in histograms] + \
+            list(self.accumulators.items()) + [('fingerprint', fingerprint)]
+        for chunk in self.iter_chunks():
+            for name, consumer in consumers:
+                with Instrumentation.phase(name, 'summary'):
+                    consumer.update(chunk)
+        for histogram in histograms:
+            self.histograms[histogram.key] = histogram.counts
+        self.fingerprint = fingerprint.hexdigest
+
+    def histogram(self, accumulator):
+        """
+        Obtiene un histograma de la muestra, recorriéndola solo si no se había calculado antes.
+
+        Parámetros:
+            accumulator (HistogramAccumulator): Acumulador vacío con la distribución de intervalos deseada.
+
+        Retorna:
+            numpy.ndarray: Frecuencia de cada intervalo.
+        """
+        if accumulator.key not in self.histograms:
+            if self.pseudo_random_numbers is None:
+                raise ValueError("El histograma pedido no se acumuló")
+            for chunk in self.iter_chunks():
+                with Instrumentation.phase('histogram', 'summary'):
+                    accumulator.update(chunk)
+            self.histograms[accumulator.key] = accumulator.counts
+        return self.histograms[accumulator.key]
+
+    def iter_chunks(self):
+        """
+        Recorre la muestra por bloques e informa el avance a la función progress, si hay una.
+
+        Retorna:
+            generator: Bloques float64 de la muestra.
+        """
+        # Las muestras por bloques no conocen su tamaño hasta el primer recorrido completo
+        if isinstance(self.pseudo_random_numbers, ChunkedSample):
+            total = self.pseudo_random_numbers.count
+        else:
+            total = len(self.pseudo_random_numbers)
+        processed = 0
+        for chunk in MathUtils.iter_chunks(self.pseudo_random_numbers, self.CHUNK_SIZE):
+            yield chunk
+            processed += len(chunk)
+            if self.progress is not None:
+                self.progress(processed, total)
+
+    def edge_histogram(self, edges):
+        """
+        Obtiene el histograma de la muestra para una lista de límites superiores.
+
+        Parámetros:
+            edges (list): Límites superiores ordenados de los intervalos.
+
+        Retorna:
+            numpy.ndarray: Frecuencia de cada intervalo.
+        """
+        return self.histogram(HistogramAccumulator.by_edges(edges))
+
+    def linear_histogram(self, start, width, bins):
+        """
+        Obtiene el histograma de la muestra para intervalos de igual ancho.
+
+        Parámetros:
+            start (float): Límite inferior del primer intervalo.
+            width (float): Ancho de cada intervalo.
+            bins (int): Cantidad de intervalos.
+
+        Retorna:
+            numpy.ndarray: Frecuencia de cada intervalo.
+        """
+        return self.histogram(HistogramAccumulator.linear(start, width, bins))
+
+    @property
+    def count(self):
+        """Obtiene la cantidad de números de la muestra."""
+        return self.moments.count
+
+    @property
+    def total(self):
+        """Obtiene la suma de los números de la muestra."""
+        return self.moments.total
+
+    @property
+    def sum_of_squares(self):
+        """Obtiene la suma de los cuadrados de los números de la muestra."""
+        return self.moments.sum_of_squares
+
+    @property
+    def minimum(self):
+        """Obtiene el menor número de la muestra."""
+        return self.moments.minimum
+
+    @property
+    def maximum(self):
+        """Obtiene el mayor número de la muestra."""
+        return self.moments.maximum
+
+    @property
+    def mean(self):
+        """Obtiene la media de la muestra, o NaN si está vacía."""
+        return self.moments.mean
+
+    @property
+    def variance(self):
+        """Obtiene la varianza poblacional de la muestra, equivalente a numpy.var, o NaN si está vacía."""
+        return self.moments.variance
@@ -0,0 +1,194 @@
+import numpy as np
+
+from model.Constants import Constants
+from model.accumulators.SerialAccumulator import SerialAccumulator
+from model.accumulators.TestAccumulator import TestAccumulator
+from model.util.CriticalValues import CriticalValues
+from model.util.MathUtils import MathUtils
+
+
+class SerialTest:
+    """
+    Clase para realizar la prueba serial en una lista de números pseudoaleatorios.
+
+    Divide [0, 1) en intervals_amount intervalos iguales, como la prueba de chi-cuadrado con dominio fijo, y cuenta
+    cuántas tuplas de dimensions números consecutivos caen en cada celda de la cuadrícula que forman. Con números
+    independientes todas las celdas son igual de probables, así que detecta correlaciones entre números
+    consecutivos que las pruebas de una dimensión no ven.
+
+    Sin solapamiento, las tuplas son independientes y el estadístico es el chi-cuadrado de sus frecuencias, con
+    intervals_amount ** dimensions - 1 grados de libertad. Con solapamiento hay una tupla por número, pero las
+    tuplas vecinas comparten números; el estadístico es entonces la diferencia entre el de las tuplas de dimensions
+    números y el de las de dimensions - 1, que sigue una chi-cuadrado con
+    intervals_amount ** dimensions - intervals_amount ** (dimensions - 1) grados de libertad.
+
+    Atributos:
+        pseudo_random_numbers (numpy.ndarray): Arreglo float64 de números pseudoaleatorios a analizar.
+        intervals_amount (int): Cantidad de intervalos por dimensión.
+        dimensions (int): Cantidad de números de cada tupla, entre 2 y 4.
+        overlapping (bool): True si las tuplas se solapan.
+        tuples (int): Cantidad de tuplas contadas.
+        occupied_cells (int): Cantidad de celdas con al menos una tupla.
+        chi_squared (float): Estadístico de la prueba.
+        degrees_of_freedom (int): Grados de libertad del estadístico.
+        chi_invert (float): Valor crítico de chi-cuadrado para el nivel de significancia.
+        alpha (float): Nivel de significancia con el que se evaluó la prueba.
+        summary (SampleSummary): Resumen de la muestra que puede traer el conteo de tuplas ya hecho.
+    """
+    MIN_DIMENSIONS = 2
+    MAX_DIMENSIONS = 4
+    CHUNK_SIZE = 1 << 20
+
+    def __init__(self, intervals_amount=10, dimensions=2, overlapping=False):
+        """
+        Inicializa una instancia de la clase SerialTest.
+
+        Parámetros:
+            intervals_amount (int): Cantidad de intervalos por dimensión.
+            dimensions (int): Cantidad de números de cada tupla, entre 2 y 4.
+            overlapping (bool): True para contar una tupla por número, solapadas.
+
+        Raises:
+            ValueError: Si hay menos de dos intervalos o la cantidad de dimensiones está fuera de los límites.
+        """
+        if intervals_amount < 2:
+            raise ValueError("La prueba serial necesita al menos dos intervalos")
+        if not self.MIN_DIMENSIONS <= dimensions <= self.MAX_DIMENSIONS:
+            raise ValueError(f"Las tuplas de la prueba serial deben tener entre {self.MIN_DIMENSIONS} y "
+                             f"{self.MAX_DIMENSIONS} números, no {dimensions}")
+        self.pseudo_random_numbers = np.empty(0, dtype=np.float64)
+        self.intervals_amount = intervals_amount
+        self.dimensions = dimensions
+        self.overlapping = overlapping
+        self.tuples = 0
+        self.occupied_cells = 0
+        self.chi_squared = 0
+        self.degrees_of_freedom = 0
+        self.chi_invert = 0
+        self.alpha = Constants.ALPHA
+        self.summary = None
+
+    def create_tuple_counter(self):
+        """
+        Crea un acumulador vacío que cuenta las tuplas de cada celda por bloques.
+
+        Retorna:
+            SerialAccumulator: Acumulador vacío con la cuadrícula de la prueba.
+        """
+        return SerialAccumulator(self.intervals_amount, self.dimensions, self.overlapping)
+
+    def create_accumulator(self):
+        """
+        Crea un acumulador de la prueba que puede alimentarse por bloques y unirse con otros.
+
+        Las tuplas que cruzan el límite entre dos partes solo se cuentan si el acumulador de la parte siguiente se
+        prepara con prime o continue_from; ver SerialAccumulator.
+
+        Retorna:
+            TestAccumulator: Acumulador vacío de la prueba.
+        """
+        return TestAccumulator(self, 'execute_test', {'serial': self.create_tuple_counter()})
+
+    def execute_test(self):
+        """
+        Ejecuta la prueba serial en la lista de números pseudoaleatorios.
+
+        Retorna:
+            bool: True si los números pseudoaleatorios pasan la prueba serial, False de lo contrario.
+
+        Raises:
+            ValueError: Si la muestra no tiene ninguna tupla completa.
+        """
+        # Usa el conteo hecho al resumir la muestra si corresponde a la misma cuadrícula
+        accumulator = self.summary.accumulators.get('serial') if self.summary is not None else None
+        if accumulator is None or accumulator.key != self.create_tuple_counter().key:
+            accumulator = self.create_tuple_counter()
+            for chunk in MathUtils.iter_chunks(self.pseudo_random_numbers, self.CHUNK_SIZE):
+                accumulator.update(chunk)
+
+        counts = accumulator.counts[self.dimensions]
+        self.tuples = counts.total
+        if not self.tuples:
+            raise ValueError("La muestra no tiene ninguna tupla completa")
+        self.occupied_cells = len(counts.occupied())
+        self.chi_squared = self.psi_squared(counts, self.dimensions)
+        self.degrees_of_freedom = self.intervals_amount ** self.dimensions - 1
+        if self.overlapping:
+            self.chi_squared -= self.psi_squared(accumulator.counts[self.dimensions - 1], self.dimensions - 1)
+            self.degrees_of_freedom -= self.intervals_amount ** (self.dimensions - 1) - 1
+        return self.evaluate(self.alpha)
+
+    def evaluate(self, alpha):
+        """
+        Evalúa la prueba con un nivel de significancia a partir del estadístico ya calculado, sin recorrer la muestra.
+
+        Parámetros:
+            alpha (float): Nivel de significancia.
+
+        Retorna:
+            bool: True si los números pseudoaleatorios pasan la prueba serial, False de lo contrario.
+        """
+        self.alpha = alpha
+        self.chi_invert = CriticalValues.chi2_isf(alpha, self.degrees_of_freedom)
+        return self.chi_squared < self.chi_invert
+
+    @property
+    def p_value(self):
+        """
+        Obtiene la probabilidad de observar un estadístico igual o mayor si la muestra es uniforme.
+
+        Retorna:
+            float: Valor p del estadístico.
+        """
+        return CriticalValues.chi2_sf(self.chi_squared, self.degrees_of_freedom)
+
+    def psi_squared(self, counts, order):
+        """
+        Calcula el chi-cuadrado de las frecuencias de las celdas suponiendo que todas son igual de probables.
+
+        Solo recorre las celdas no vacías: la suma de (O - E) ** 2 / E sobre todas las celdas es igual a
+        cells * suma(O ** 2) / N - N.
+
+        Parámetros:
+            counts (SparseCounts): Frecuencias de las tuplas de order números.
+            order (int): Cantidad de números de cada tupla.
+
+        Retorna:
+            float: Estadístico chi-cuadrado.
+        """
+        observed = counts.occupied().astype(np.float64)
+        total = observed.sum()
+        if not total:
+            return 0.0
+        return float(self.intervals_amount ** order * np.dot(observed, observed) / total - total)
+
+    def set_pseudo_random_numbers(self, pseudo_random_numbers, summary=None):
+        """
+        Establece la lista de números pseudoaleatorios para la prueba serial.
+
+        Parámetros:
+            pseudo_random_numbers (list | numpy.ndarray): Números pseudoaleatorios.
+            summary (SampleSummary, opcional): Resumen de la misma muestra con el acumulador 'serial'.
+        """
+        self.pseudo_random_numbers = MathUtils.to_float_array(pseudo_random_numbers)
+        self.summary = summary
+
+    @property
+    def get_chi_squared(self):
+        """
+        Obtiene el estadístico calculado de la prueba serial.
+
+        Retorna:
+            float: Estadístico chi-cuadrado de las tuplas.
+        """
+        return self.chi_squared
+
+    @property
+    def get_chi_invert(self):
+        """
+        Obtiene el valor crítico de chi-cuadrado calculado.
+
+        Retorna:
+            float: Valor crítico de chi-cuadrado.
+        """
+        return self.chi_invert
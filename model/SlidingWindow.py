@@ -0,0 +1,240 @@
+import copy
+from collections import deque
+
+from model.ChiTest import ChiTest
+from model.accumulators.MomentsAccumulator import MomentsAccumulator
+
+
+class SlidingWindow:
+    """
+    Evalúa la batería de pruebas sobre ventanas deslizantes de una secuencia larga de números.
+
+    La secuencia se divide en bloques de stride números y cada bloque se resume una sola vez en acumuladores de
+    momentos, frecuencias y manos de póker. Al avanzar, los acumuladores de la ventana suman el bloque que entra y
+    restan el que sale, así que evaluar una ventana no vuelve a recorrer sus números. Como las sumas en punto
+    flotante acumulan error al restar, los momentos se reconstruyen a partir de los bloques cada vez que la ventana
+    se renueva por completo.
+
+    La prueba de chi-cuadrado usa intervalos fijos en [0, 1), porque los de la muestra completa dependen de su
+    mínimo y su máximo, que cambian de una ventana a otra. Si stride es igual al tamaño de la ventana, las
+    ventanas no se solapan.
+
+    Las pruebas que combinan números consecutivos (serial, corridas, autocorrelación, huecos y coleccionista de
+    cupones) se calculan sobre los números de la ventana sola, sin las tuplas, comparaciones, productos, huecos ni
+    segmentos que empiezan antes. Los bloques se resumen continuando al anterior, así que sus acumuladores cuentan
+    lo que cruza el inicio del bloque; por eso cada bloque guarda además un resumen desde cero de las pruebas de
+    BOUNDED_PARTS, que ocupa el lugar del primer bloque de la ventana. Eso basta si el estado con el que termina el
+    primer bloque es el mismo en ambos resúmenes, es decir, si depende solo de sus últimos números y el bloque los
+    tiene todos. No ocurre con los huecos ni los cupones, cuyo estado depende de toda la secuencia anterior, ni con
+    un avance menor que los números que arrastra la prueba; esas pruebas se omiten cuando las ventanas se solapan
+    (ver find_omitted_tests). Si las ventanas no se solapan, cada una es un solo bloque resumido desde cero y se
+    evalúan todas.
+
+    Atributos:
+        tests (Tests): Batería de pruebas con la que se evalúa cada ventana.
+        window_size (int): Cantidad de números por ventana.
+        stride (int): Cantidad de números que avanza la ventana.
+        blocks (collections.deque): Acumuladores de los bloques que forman la ventana actual.
+        fresh_blocks (collections.deque): Acumuladores de BOUNDED_PARTS de cada bloque de la ventana actual,
+            resumidos sin continuar al bloque anterior; vacío si las ventanas no se solapan.
+        window_parts (dict): Acumuladores de la ventana actual.
+        position (int): Cantidad de números recibidos.
+        window_index (int): Cantidad de ventanas evaluadas.
+        omitted (tuple): Pruebas que no se evalúan en cada ventana; ver find_omitted_tests.
+    """
+    # Acumuladores cuyo estado al final de un bloque depende solo de sus últimos números; en los de huecos y
+    # cupones depende de toda la secuencia anterior
+    BOUNDED_PARTS = ('serial', 'runs', 'autocorrelation')
+
+    def __init__(self, tests, window_size, stride=None):
+        """
+        Inicializa una instancia de SlidingWindow.
+
+        Parámetros:
+            tests (Tests): Batería de pruebas; se usa solo para evaluar las ventanas.
+            window_size (int): Cantidad de números por ventana.
+            stride (int, opcional): Cantidad de números que avanza la ventana; por defecto, window_size.
+
+        Raises:
+            ValueError: Si window_size no es múltiplo de stride.
+        """
+        stride = stride or window_size
+        if stride <= 0 or window_size % stride:
+            raise ValueError("El tamaño de la ventana debe ser un múltiplo positivo del avance")
+        self.tests = tests
+        self.tests.chi_test.domain = ChiTest.FIXED_DOMAIN
+        self.window_size = window_size
+        self.stride = stride
+        self.blocks_per_window = window_size // stride
+        self.blocks = deque()
+        self.fresh_blocks = deque()
+        self.window_parts = self.tests.create_running_parts()
+        self.current_block = self.tests.create_running_parts()
+        self.current_fresh = self.create_fresh_parts()
+        self.current_count = 0
+        self.position = 0
+        self.window_index = 0
+        self.slides = 0
+        self.omitted = self.find_omitted_tests()
+
+    def find_omitted_tests(self):
+        """
+        Determina qué pruebas no pueden calcularse sobre los números de cada ventana sola.
+
+        Si las ventanas se solapan, el primer bloque de una ventana se toma de su resumen desde cero y los demás de
+        los resúmenes continuados. Eso da el resultado de la ventana sola solo si el bloque tiene los números que
+        arrastra cada prueba: dos para las corridas ascendentes y descendentes, max_lag para la autocorrelación y
+        dimensions - 1 para la prueba serial con solapamiento; la prueba serial sin solapamiento, además, necesita
+        que el avance sea múltiplo de la dimensión para que las tuplas de la ventana empiecen en su primer número.
+        Los huecos y los cupones nunca cumplen la condición.
+
+        Retorna:
+            tuple: Nombres de las pruebas omitidas, de Tests.TEST_NAMES; vacío si las ventanas no se solapan.
+        """
+        if self.blocks_per_window == 1:
+            return ()
+        serial_test = self.tests.serial_test
+        if serial_test.overlapping:
+            serial_exact = self.stride >= serial_test.dimensions - 1
+        else:
+            serial_exact = self.stride % serial_test.dimensions == 0
+        exact = {
+            'serial': serial_exact,
+            'runs_up_down': self.stride >= 2,
+            'autocorrelation': self.stride >= self.tests.autocorrelation_test.max_lag,
+            'gap': False,
+            'coupon': False,
+        }
+        return tuple(test_name for test_name in self.tests.TEST_NAMES if not exact.get(test_name, True))
+
+    def create_fresh_parts(self):
+        """
+        Crea los acumuladores de BOUNDED_PARTS que resumen un bloque sin continuar al anterior.
+
+        Retorna:
+            dict: Acumuladores vacíos indexados por nombre, o vacío si las ventanas no se solapan y cada bloque ya
+            se resume desde cero.
+        """
+        if self.blocks_per_window == 1:
+            return {}
+        parts = self.tests.create_counters()
+        return {name: parts[name] for name in self.BOUNDED_PARTS}
+
+    def update(self, chunk):
+        """
+        Agrega números a la secuencia y evalúa las ventanas que se completen.
+
+        Parámetros:
+            chunk (numpy.ndarray): Bloque float64 de números, de cualquier tamaño.
+
+        Retorna:
+            list: Resultado de cada ventana completada, en orden; ver evaluate.
+        """
+        results = []
+        start = 0
+        while start < len(chunk):
+            taken = min(self.stride - self.current_count, len(chunk) - start)
+            piece = chunk[start:start + taken]
+            for part in self.current_block.values():
+                part.update(piece)
+            for part in self.current_fresh.values():
+                part.update(piece)
+            self.current_count += taken
+            self.position += taken
+            start += taken
+            if self.current_count == self.stride:
+                result = self.push_block(self.current_block, self.current_fresh)
+                self.current_block = self.next_block(self.current_block)
+                self.current_fresh = self.create_fresh_parts()
+                self.current_count = 0
+                if result is not None:
+                    results.append(result)
+        return results
+
+    def next_block(self, previous):
+        """
+        Crea los acumuladores del bloque siguiente, que continúan las tuplas que dejó incompletas el anterior si las
+        ventanas se solapan.
+
+        Parámetros:
+            previous (dict): Acumuladores del bloque que acaba de completarse.
+
+        Retorna:
+            dict: Acumuladores vacíos del bloque siguiente.
+        """
+        block = self.tests.create_running_parts()
+        if self.blocks_per_window == 1:
+            return block
+        for name, part in block.items():
+            if hasattr(part, 'continue_from'):
+                part.continue_from(previous[name])
+        return block
+
+    def push_block(self, block, fresh):
+        """
+        Agrega un bloque completo a la ventana y quita el más antiguo si la ventana ya estaba llena.
+
+        Parámetros:
+            block (dict): Acumuladores del bloque que entra.
+            fresh (dict): Acumuladores de BOUNDED_PARTS del mismo bloque, resumido desde cero.
+
+        Retorna:
+            dict | None: Resultado de la ventana si quedó completa, o None si todavía faltan bloques.
+        """
+        self.blocks.append(block)
+        self.fresh_blocks.append(fresh)
+        for name, part in block.items():
+            self.window_parts[name].merge(copy.deepcopy(part))
+        if len(self.blocks) > self.blocks_per_window:
+            leaving = self.blocks.popleft()
+            self.fresh_blocks.popleft()
+            for name, part in leaving.items():
+                self.window_parts[name].subtract(part)
+            self.slides += 1
+            if self.slides % self.blocks_per_window == 0:
+                self.rebuild_moments()
+        if len(self.blocks) < self.blocks_per_window:
+            return None
+        return self.evaluate()
+
+    def rebuild_moments(self):
+        """
+        Vuelve a unir los momentos de los bloques de la ventana para descartar el error de las restas.
+        """
+        moments = MomentsAccumulator()
+        for block in self.blocks:
+            moments.merge(copy.deepcopy(block['moments']))
+        self.window_parts['moments'] = moments
+
+    def evaluate(self):
+        """
+        Ejecuta las pruebas sobre los acumuladores de la ventana actual.
+
+        Retorna:
+            dict: Índice de la ventana, posición del primer y del último número más uno, y por cada prueba su
+            veredicto, estadístico, límites de aceptación y valor p, sin las pruebas de omitted.
+        """
+        # El mínimo y el máximo no pueden restarse, así que se toman de los bloques
+        self.window_parts['moments'].minimum = min(block['moments'].minimum for block in self.blocks)
+        self.window_parts['moments'].maximum = max(block['moments'].maximum for block in self.blocks)
+        if self.blocks_per_window == 1:
+            # La ventana es un solo bloque, resumido desde cero; al unir bloques se cuenta lo que cruza entre ellos
+            parts = dict(self.blocks[0])
+        else:
+            parts = dict(self.window_parts)
+        # El primer bloque resumido desde cero, seguido de los demás tal como se continuaron
+        for name, fresh in self.fresh_blocks[0].items():
+            rest = copy.deepcopy(self.window_parts[name])
+            rest.subtract(self.blocks[0][name])
+            parts[name] = copy.deepcopy(fresh)
+            parts[name].merge(rest)
+        tests = self.tests.evaluate_parts(parts)
+        result = {
+            'window': self.window_index,
+            'start': self.position - self.window_size,
+            'stop': self.position,
+            'tests': {test_name: test_result for test_name, test_result in tests.items()
+                      if test_name not in self.omitted},
+        }
+        self.window_index += 1
+        return result
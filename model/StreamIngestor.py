@@ -0,0 +1,289 @@
+import asyncio
+import os
+import sys
+import time
+
+import numpy as np
+
+from model.util.NormalizedArray import NormalizedArray
+
+
+class StreamIngestor:
+    """
+    Lee números continuamente de una tubería, un socket o un archivo que crece y los resume a medida que llegan.
+
+    La lectura y el resumen son dos tareas de asyncio unidas por una cola acotada: si los acumuladores no dan
+    abasto, la cola se llena, la lectura se detiene y el sistema operativo frena al generador que escribe. Los
+    acumuladores son los mismos que usa Tests para secuencias que no terminan (create_running_parts), así que
+    snapshot puede evaluar todas las pruebas en cualquier momento sin volver a leer los números.
+
+    Los datos pueden ser texto, con números separados por espacios, saltos de línea o comas, o binarios con un tipo
+    fijo como '<f8' o '<u4'; los enteros se llevan a [0, 1) igual que en DataLoader.
+
+    Atributos:
+        tests (Tests): Batería de pruebas con la que se evalúan los resúmenes.
+        dtype (numpy.dtype): Tipo de los datos binarios, o None si los datos son texto.
+        queue (asyncio.Queue): Bloques leídos que esperan ser resumidos.
+        parts (dict): Acumuladores de todos los números recibidos.
+        count (int): Cantidad de números resumidos.
+        started (float): Instante en que empezó la lectura, según time.perf_counter.
+    """
+    QUEUE_SIZE = 64
+    READ_SIZE = 1 << 16
+    POLL_INTERVAL = 0.2
+    SEPARATORS = bytes.maketrans(b',[]\t\r\n', b'      ')
+
+    def __init__(self, tests, dtype=None, queue_size=QUEUE_SIZE):
+        """
+        Inicializa una instancia de StreamIngestor.
+
+        Parámetros:
+            tests (Tests): Batería de pruebas; su estado se reemplaza en cada snapshot.
+            dtype (str, opcional): Tipo de los datos binarios, por ejemplo '<f8'; None para texto.
+            queue_size (int): Cantidad máxima de bloques en espera.
+        """
+        self.tests = tests
+        self.dtype = np.dtype(dtype) if dtype else None
+        self.normalizer = NormalizedArray(np.empty(0, dtype=self.dtype)) if self.dtype is not None else None
+        self.queue_size = queue_size
+        self.queue = None
+        self.parts = tests.create_running_parts()
+        self.count = 0
+        self.started = None
+        self.stopping = None
+        self.connections = {}
+
+    async def run(self, source):
+        """
+        Lee una fuente hasta que termina o hasta que se llama a stop, resumiendo los números que llegan.
+
+        Si el resumen de un bloque falla, la lectura se cancela y la excepción se propaga; de lo contrario la cola
+        se llenaría y la lectura quedaría esperando para siempre.
+
+        Parámetros:
+            source (str): 'stdin' o '-', 'tcp://host:puerto', 'unix://ruta', 'tail://ruta' o la ruta de un archivo.
+                Con tcp y unix se escucha en esa dirección y se leen las conexiones que lleguen; con tail se sigue
+                leyendo el archivo a medida que crece.
+        """
+        self.queue = asyncio.Queue(maxsize=self.queue_size)
+        self.stopping = asyncio.Event()
+        self.started = time.perf_counter()
+        consumer = asyncio.create_task(self.consume())
+        producer = asyncio.create_task(self.produce_all(source))
+        tasks = {producer, consumer}
+        try:
+            # consume solo termina si falla, así que basta con esperar a la primera tarea que termine
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        for task in done:
+            task.result()
+
+    async def produce_all(self, source):
+        """
+        Lee toda la fuente y espera a que se resuman los bloques que quedaron en la cola.
+
+        Parámetros:
+            source (str): Fuente de los datos; ver run.
+        """
+        await self.produce(source)
+        await self.queue.join()
+
+    async def produce(self, source):
+        """
+        Abre la fuente y envía sus datos a la cola.
+
+        Parámetros:
+            source (str): Fuente de los datos; ver run.
+        """
+        if source in ('stdin', '-'):
+            reader = asyncio.StreamReader(limit=self.READ_SIZE)
+            loop = asyncio.get_running_loop()
+            await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin.buffer)
+            await self.first_completed(self.read_stream(reader))
+        elif source.startswith('tcp://'):
+            host, port = source[len('tcp://'):].rsplit(':', 1)
+            await self.serve(await asyncio.start_server(self.handle_connection, host, int(port)))
+        elif source.startswith('unix://'):
+            await self.serve(await asyncio.start_unix_server(self.handle_connection, source[len('unix://'):]))
+        elif source.startswith('tail://'):
+            await self.first_completed(self.follow_file(source[len('tail://'):], follow=True))
+        else:
+            await self.first_completed(self.follow_file(source, follow=False))
+
+    async def first_completed(self, reading):
+        """
+        Espera a que termine una lectura o a que se llame a stop, lo que ocurra primero.
+
+        Parámetros:
+            reading (coroutine): Lectura de la fuente.
+        """
+        tasks = [asyncio.create_task(reading), asyncio.create_task(self.stopping.wait())]
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in pending:
+            task.cancel()
+        for task in done:
+            task.result()
+
+    async def serve(self, server):
+        """
+        Acepta conexiones hasta que se llama a stop y luego cierra las que siguen abiertas; lo que ya se había
+        recibido de ellas se resume.
+
+        Parámetros:
+            server (asyncio.Server): Servidor que ya escucha en la dirección pedida.
+        """
+        async with server:
+            await self.stopping.wait()
+        for writer in self.connections.values():
+            writer.close()
+        await asyncio.gather(*self.connections, return_exceptions=True)
+
+    async def handle_connection(self, reader, writer):
+        """
+        Lee una conexión entrante hasta que el cliente la cierra.
+
+        Los bloques de varias conexiones simultáneas se intercalan en el orden en que llegan.
+
+        Parámetros:
+            reader (asyncio.StreamReader): Datos de la conexión.
+            writer (asyncio.StreamWriter): Extremo de escritura de la conexión, que solo se usa para cerrarla.
+        """
+        connection = asyncio.current_task()
+        self.connections[connection] = writer
+        try:
+            await self.read_stream(reader)
+        finally:
+            del self.connections[connection]
+            writer.close()
+
+    async def read_stream(self, reader):
+        """
+        Lee un flujo de asyncio hasta el final.
+
+        Parámetros:
+            reader (asyncio.StreamReader): Flujo de datos.
+        """
+        pending = b''
+        while True:
+            data = await reader.read(self.READ_SIZE)
+            pending = await self.feed(pending + data, final=not data)
+            if not data:
+                return
+
+    async def follow_file(self, file_path, follow):
+        """
+        Lee un archivo y, si se pide, sigue leyendo lo que se le agrega.
+
+        Parámetros:
+            file_path (str): Ruta del archivo.
+            follow (bool): True para esperar datos nuevos al llegar al final en lugar de terminar.
+        """
+        pending = b''
+        with open(file_path, 'rb') as file:
+            while True:
+                data = file.read(self.READ_SIZE)
+                if data:
+                    pending = await self.feed(pending + data)
+                elif follow:
+                    await asyncio.sleep(self.POLL_INTERVAL)
+                else:
+                    await self.feed(pending, final=True)
+                    return
+
+    async def feed(self, data, final=False):
+        """
+        Convierte los números completos de los datos y los pone en la cola; espera si la cola está llena.
+
+        Parámetros:
+            data (bytes): Datos leídos de la fuente, precedidos por lo que sobró de la lectura anterior.
+            final (bool): True si la fuente terminó y no quedan datos por llegar.
+
+        Retorna:
+            bytes: Datos del final que todavía no forman un número completo.
+        """
+        values, pending = self.parse(data, final)
+        if len(values):
+            await self.queue.put(values)
+        return pending
+
+    def parse(self, data, final=False):
+        """
+        Convierte a float64 los números completos de los datos.
+
+        Parámetros:
+            data (bytes): Datos leídos.
+            final (bool): True si no llegarán más datos y todo debe convertirse.
+
+        Retorna:
+            tuple: Números completos y los datos del final que todavía no forman un número.
+
+        Raises:
+            ValueError: Si el texto contiene algo distinto de números.
+        """
+        if self.dtype is not None:
+            usable = len(data) - len(data) % self.dtype.itemsize
+            return self.normalizer.normalize(np.frombuffer(data[:usable], dtype=self.dtype)), data[usable:]
+
+        text = data.translate(self.SEPARATORS)
+        # Un número puede quedar partido al final del bloque, así que solo se convierte hasta el último separador
+        cut = len(text) if final else text.rfind(b' ') + 1
+        text, pending = text[:cut], data[cut:]
+        expected = len(text.split())
+        if not expected:
+            return np.empty(0, dtype=np.float64), pending
+        try:
+            values = np.fromstring(text.decode('ascii', errors='replace'), dtype=np.float64, sep=' ')
+        except ValueError:
+            values = None
+        if values is None or len(values) != expected:
+            raise ValueError("Los datos recibidos contienen algo distinto de números")
+        return values, pending
+
+    async def consume(self):
+        """
+        Resume los bloques de la cola a medida que llegan.
+        """
+        while True:
+            values = await self.queue.get()
+            try:
+                for part in self.parts.values():
+                    part.update(values)
+                self.count += len(values)
+            finally:
+                self.queue.task_done()
+
+    def stop(self):
+        """
+        Pide que se deje de leer la fuente; los bloques ya leídos se terminan de resumir.
+        """
+        if self.stopping is not None:
+            self.stopping.set()
+
+    def snapshot(self):
+        """
+        Evalúa todas las pruebas con los números resumidos hasta ahora.
+
+        Retorna:
+            dict: Cantidad de números, velocidad de llegada en números por segundo, bloques en espera y resultado de
+            cada prueba, o solo los tres primeros si todavía no llegaron números.
+        """
+        seconds = time.perf_counter() - self.started if self.started is not None else 0
+        snapshot = {
+            'count': self.count,
+            'numbers_per_second': self.count / seconds if seconds > 0 else 0.0,
+            'queued_blocks': self.queue.qsize() if self.queue is not None else 0,
+        }
+        if self.count:
+            snapshot['tests'] = self.tests.evaluate_parts(self.parts)
+        return snapshot
+
+
+if __name__ == '__main__':
+    from model.Tests import Tests
+
+    ingestor = StreamIngestor(Tests(), os.environ.get('STREAM_DTYPE'))
+    asyncio.run(ingestor.run(sys.argv[1] if len(sys.argv) > 1 else 'stdin'))
+    print(ingestor.snapshot())
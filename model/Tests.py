@@ -1,8 +1,27 @@
+import contextlib
+import copy
+
+import numpy as np
+
+from model.AutocorrelationTest import AutocorrelationTest
 from model.ChiTest import ChiTest
+from model.Constants import Constants
+from model.CouponTest import CouponTest
+from model.GapTest import GapTest
 from model.KsTest import KsTest
 from model.MeanTest import MeanTest
+from model.ParallelRunner import ParallelRunner
 from model.PokerTest import PokerTest
+from model.RunsAboveBelowTest import RunsAboveBelowTest
+from model.RunsUpDownTest import RunsUpDownTest
+from model.SampleSummary import SampleSummary
+from model.SerialTest import SerialTest
+from model.SlidingWindow import SlidingWindow
 from model.VarianceTest import VarianceTest
+from model.accumulators.MomentsAccumulator import MomentsAccumulator
+from model.util.ChunkedSample import ChunkedSample
+from model.util.Instrumentation import Instrumentation
+from model.util.MathUtils import MathUtils
 
 
 class Tests:
@@ -15,29 +34,493 @@ class Tests:
         ks_test (KsTest): Instancia de la clase KsTest para realizar la prueba de Kolmogorov-Smirnov.
         chi_test (ChiTest): Instancia de la clase ChiTest para realizar la prueba de chi cuadrado.
         poker_test (PokerTest): Instancia de la clase PokerTest para realizar la prueba de póker.
+        serial_test (SerialTest): Instancia de la clase SerialTest para realizar la prueba serial.
+        runs_up_down_test (RunsUpDownTest): Instancia para realizar la prueba de corridas arriba y abajo.
+        runs_above_below_test (RunsAboveBelowTest): Instancia para realizar la prueba de corridas arriba y abajo de
+            la media.
+        autocorrelation_test (AutocorrelationTest): Instancia para realizar la prueba de autocorrelación.
+        gap_test (GapTest): Instancia de la clase GapTest para realizar la prueba de huecos.
+        coupon_test (CouponTest): Instancia para realizar la prueba del coleccionista de cupones.
+        workers (int): Cantidad de procesos con los que se resumen las muestras grandes.
+        pseudo_random_numbers (numpy.ndarray): Arreglo float64 compartido por todas las pruebas.
+        summary (SampleSummary): Resumen de la muestra calculado en un solo recorrido y compartido por las pruebas.
+        progress (callable): Función que recibe los números recorridos y el total en cada recorrido de la muestra.
+        instrumentation (Instrumentation): Registro de los tiempos y la memoria de cada fase, o None para no medir.
+        alpha (float): Nivel de significancia con el que se evalúan las pruebas.
+        fingerprint (str): Huella de la muestra actual (ver SampleFingerprint), o None si no se conoce.
+        statistics (dict): Estado de cada prueba ya calculada, indexado por la huella de la muestra, el atributo de
+            la prueba y sus parámetros (ver statistics_key), junto con los nombres de las pruebas que contiene.
     """
-    def __init__(self):
+    PARALLEL_THRESHOLD = 1 << 23
+    TEST_NAMES = ('mean', 'variance', 'ks', 'chi', 'poker', 'serial', 'runs_up_down', 'runs_above_below',
+                  'autocorrelation', 'gap', 'coupon')
+    # Atributo de la prueba, método que calcula el estadístico y método que solo evalúa el umbral, por nombre
+    TEST_METHODS = {
+        'mean': ('mean_test', 'execute_test', 'evaluate'),
+        'variance': ('variance_test', 'execute_test', 'evaluate'),
+        'ks': ('ks_test', 'execute_test', 'evaluate'),
+        'ks_exact': ('ks_test', 'execute_exact_test', 'evaluate_exact'),
+        'chi': ('chi_test', 'execute_chi_test', 'evaluate'),
+        'poker': ('poker_test', 'execute_poker_test', 'evaluate'),
+        'serial': ('serial_test', 'execute_test', 'evaluate'),
+        'runs_up_down': ('runs_up_down_test', 'execute_test', 'evaluate'),
+        'runs_above_below': ('runs_above_below_test', 'execute_test', 'evaluate'),
+        'autocorrelation': ('autocorrelation_test', 'execute_test', 'evaluate'),
+        'gap': ('gap_test', 'execute_test', 'evaluate'),
+        'coupon': ('coupon_test', 'execute_test', 'evaluate'),
+    }
+    # Atributos de las pruebas que no forman parte del estado guardado en statistics
+    SHARED_ATTRIBUTES = ('pseudo_random_numbers', 'summary', 'alpha')
+    # Parámetros de cada prueba de los que depende su estadístico, por atributo; distinguen los estados guardados en
+    # statistics y nunca se restauran desde ellos
+    CONFIGURATION_ATTRIBUTES = {
+        'ks_test': ('intervals_amount',),
+        'chi_test': ('intervals_amount', 'domain'),
+        'poker_test': ('digit_length',),
+        'serial_test': ('intervals_amount', 'dimensions', 'overlapping'),
+        'autocorrelation_test': ('max_lag',),
+        'gap_test': ('lower', 'upper', 'max_gap'),
+        'coupon_test': ('coupons', 'max_length'),
+    }
+
+    def __init__(self, workers=1):
         """
         Inicializa una instancia de la clase Tests.
+
+        Parámetros:
+            workers (int): Cantidad de procesos para resumir muestras de al menos PARALLEL_THRESHOLD números;
+                con 1 todo se calcula en el proceso actual.
         """
+        self.workers = workers
+        self.progress = None
+        self.instrumentation = None
+        self.alpha = Constants.ALPHA
+        self.fingerprint = None
+        self.statistics = {}
         self.mean_test = MeanTest()
         self.variance_test = VarianceTest()
         self.ks_test = KsTest(10)
         self.chi_test = ChiTest(10)
         self.poker_test = PokerTest()
+        self.serial_test = SerialTest()
+        self.runs_up_down_test = RunsUpDownTest()
+        self.runs_above_below_test = RunsAboveBelowTest()
+        self.autocorrelation_test = AutocorrelationTest()
+        self.gap_test = GapTest()
+        self.coupon_test = CouponTest()
+        self.pseudo_random_numbers = MathUtils.to_float_array([])
+        self.summary = None
 
     def set_pseudo_random_numbers(self, pseudo_random_numbers):
         """
         Establece la lista de números pseudoaleatorios para todas las pruebas.
 
+        La lista se convierte una sola vez a un arreglo contiguo de float64 que todas las pruebas comparten, y se
+        resume en un solo recorrido que incluye el histograma de la prueba de Kolmogorov-Smirnov. Cada llamada
+        reemplaza el resumen anterior, por lo que ninguna prueba puede leer datos de una muestra previa.
+        El mismo recorrido alimenta los conteos de las demás pruebas (ver create_counters). Si hay varios procesos
+        disponibles y la muestra es grande, el recorrido se reparte entre ellos con ParallelRunner.
+
+        Parámetros:
+            pseudo_random_numbers (list | numpy.ndarray): Números pseudoaleatorios.
+        """
+        with self.measure('summary'):
+            self.pseudo_random_numbers = MathUtils.to_float_array(pseudo_random_numbers)
+            self.use_summary(None)
+            if (self.workers > 1 and ParallelRunner.can_share(self.pseudo_random_numbers)
+                    and len(self.pseudo_random_numbers) >= self.PARALLEL_THRESHOLD):
+                self.use_summary(ParallelRunner(self, self.workers).summarize())
+            else:
+                self.use_summary(SampleSummary(self.pseudo_random_numbers, self.create_histograms(),
+                                               self.create_counters(), self.progress))
+
+    def create_histograms(self):
+        """
+        Crea los histogramas cuyos intervalos se conocen antes de recorrer la muestra.
+
+        Siempre incluye el de Kolmogorov-Smirnov; el de chi-cuadrado se incluye si la prueba tiene un dominio fijo
+        y sus intervalos no son los mismos, porque en ese caso ambas comparten un único conteo.
+
+        Retorna:
+            list: Acumuladores vacíos, sin dos con la misma distribución de intervalos.
+        """
+        histograms = [self.ks_test.create_histogram()]
+        if self.chi_test.domain is not None:
+            try:
+                chi_histogram = self.chi_test.create_histogram(*self.chi_test.domain)
+            except ValueError:
+                # La prueba de chi-cuadrado informa el error al ejecutarse
+                return histograms
+            if chi_histogram.key != histograms[0].key:
+                histograms.append(chi_histogram)
+        return histograms
+
+    def create_counters(self):
+        """
+        Crea los acumuladores que, además de los momentos y los histogramas, se alimentan al resumir la muestra.
+
+        Retorna:
+            dict: Acumuladores vacíos de las manos de póker, las tuplas de la prueba serial, las corridas, los
+            productos de cada desfase, los huecos y los segmentos de cupones, indexados por el nombre con el que los
+            buscan las pruebas en SampleSummary.
+        """
+        return {
+            'poker': self.poker_test.create_hand_counter(),
+            'serial': self.serial_test.create_tuple_counter(),
+            'runs': self.runs_up_down_test.create_runs_counter(),
+            'autocorrelation': self.autocorrelation_test.create_lag_counter(),
+            'gap': self.gap_test.create_gap_counter(),
+            'coupon': self.coupon_test.create_segment_counter(),
+        }
+
+    def set_progress(self, progress):
+        """
+        Establece la función que recibe el avance de los recorridos de la muestra.
+
+        La función se llama después de cada bloque con los números recorridos y el total, o None si todavía no se
+        conoce; si lanza una excepción, el recorrido se interrumpe y la excepción se propaga.
+
+        Parámetros:
+            progress (callable): Función de avance, o None para no informarlo.
+        """
+        self.progress = progress
+        if self.summary is not None:
+            self.summary.progress = progress
+
+    def set_instrumentation(self, instrumentation):
+        """
+        Establece dónde registrar el tiempo real, el tiempo de CPU y la memoria de cada fase de las pruebas.
+
+        Parámetros:
+            instrumentation (Instrumentation): Registro de fases, o None para no medir.
+        """
+        self.instrumentation = instrumentation
+
+    def measure(self, phase_name):
+        """
+        Registra una fase en la instrumentación de la batería, si hay una, junto con las fases internas que marquen
+        las pruebas mientras dura.
+
+        Parámetros:
+            phase_name (str): Nombre de la fase, por ejemplo el de la prueba.
+
+        Retorna:
+            contextlib.AbstractContextManager: Bloque que delimita la fase.
+        """
+        if self.instrumentation is None:
+            return contextlib.nullcontext()
+        stack = contextlib.ExitStack()
+        stack.enter_context(self.instrumentation.activate())
+        stack.enter_context(Instrumentation.phase(phase_name, 'tests'))
+        return stack
+
+    def use_summary(self, summary):
+        """
+        Comparte con todas las pruebas un resumen de la muestra actual.
+
+        Parámetros:
+            summary (SampleSummary): Resumen de la muestra, o None para descartar el anterior.
+        """
+        self.summary = summary
+        self.fingerprint = None if summary is None else summary.fingerprint
+        self.mean_test.set_pseudo_random_numbers(self.pseudo_random_numbers, summary)
+        self.variance_test.set_pseudo_random_numbers(self.pseudo_random_numbers, summary)
+        self.ks_test.set_pseudo_random_numbers(self.pseudo_random_numbers, summary)
+        self.chi_test.set_pseudo_random_numbers(self.pseudo_random_numbers, summary)
+        self.poker_test.set_pseudo_random_numbers(self.pseudo_random_numbers, summary)
+        self.serial_test.set_pseudo_random_numbers(self.pseudo_random_numbers, summary)
+        self.runs_up_down_test.set_pseudo_random_numbers(self.pseudo_random_numbers, summary)
+        self.runs_above_below_test.set_pseudo_random_numbers(self.pseudo_random_numbers, summary)
+        self.autocorrelation_test.set_pseudo_random_numbers(self.pseudo_random_numbers, summary)
+        self.gap_test.set_pseudo_random_numbers(self.pseudo_random_numbers, summary)
+        self.coupon_test.set_pseudo_random_numbers(self.pseudo_random_numbers, summary)
+
+    def set_chunked_file(self, file_path, chunk_size=1 << 20):
+        """
+        Prepara las pruebas para un archivo que se lee por bloques, sin cargarlo completo en memoria.
+
+        Cada prueba obtiene sus estadísticas de estados acumulados bloque a bloque: momentos para la media y la
+        varianza, frecuencias por intervalo para Kolmogorov-Smirnov y chi-cuadrado, y los conteos de create_counters
+        para las demás.
+        El archivo se lee una vez al llamar a este método y, si la prueba de chi-cuadrado no tiene un dominio fijo,
+        una segunda vez cuando se ejecuta.
+
+        Parámetros:
+            file_path (str): Ruta del archivo en cualquiera de los formatos que admite DataLoader.
+            chunk_size (int): Cantidad de números por bloque.
+        """
+        self.set_pseudo_random_numbers(ChunkedSample(file_path, chunk_size))
+
+    def iter_windows(self, pseudo_random_numbers, window_size, stride=None):
+        """
+        Evalúa todas las pruebas sobre ventanas deslizantes de una muestra, sin cargarla completa si se lee por
+        bloques.
+
+        Las ventanas se evalúan con una batería aparte, así que el estado de esta instancia no cambia. Si se
+        solapan, se omiten las pruebas que no pueden calcularse sobre los números de cada ventana sola; ver
+        SlidingWindow.
+
         Parámetros:
-            pseudo_random_numbers (list): Lista de números pseudoaleatorios.
+            pseudo_random_numbers (numpy.ndarray | NormalizedArray | ChunkedSample): Muestra a recorrer.
+            window_size (int): Cantidad de números por ventana.
+            stride (int, opcional): Cantidad de números que avanza la ventana; por defecto, window_size.
+
+        Retorna:
+            generator: Resultado de cada ventana, en orden; ver SlidingWindow.evaluate.
+        """
+        window = SlidingWindow(Tests(), window_size, stride)
+        for chunk in MathUtils.iter_chunks(MathUtils.to_float_array(pseudo_random_numbers), SampleSummary.CHUNK_SIZE):
+            yield from window.update(chunk)
+
+    def create_running_parts(self):
+        """
+        Crea los acumuladores con los que se resume una secuencia de números que todavía no termina.
+
+        La prueba de chi-cuadrado usa intervalos fijos, ya que el mínimo y el máximo de la secuencia no se conocen
+        de antemano; si no se estableció un dominio, se usa ChiTest.FIXED_DOMAIN. Si sus intervalos son los de la
+        prueba de Kolmogorov-Smirnov, no tiene acumulador propio y ambas usan el mismo.
+
+        Retorna:
+            dict: Acumuladores vacíos indexados por nombre, con las claves que usan las pruebas en SampleSummary.
+        """
+        if self.chi_test.domain is None:
+            self.chi_test.domain = ChiTest.FIXED_DOMAIN
+        parts = {'moments': MomentsAccumulator()}
+        for name, histogram in zip(('ks', 'chi'), self.create_histograms()):
+            parts[name] = histogram
+        parts.update(self.create_counters())
+        return parts
+
+    def evaluate_parts(self, parts):
         """
-        self.mean_test.set_pseudo_random_numbers(pseudo_random_numbers)
-        self.variance_test.set_pseudo_random_numbers(pseudo_random_numbers)
-        self.ks_test.set_pseudo_random_numbers(pseudo_random_numbers)
-        self.chi_test.set_pseudo_random_numbers(pseudo_random_numbers)
-        self.poker_test.set_pseudo_random_numbers(pseudo_random_numbers)
+        Ejecuta todas las pruebas sobre acumuladores creados con create_running_parts.
+
+        Reemplaza la muestra de esta instancia por un resumen de los acumuladores, que no se modifican.
+
+        Parámetros:
+            parts (dict): Acumuladores alimentados.
+
+        Retorna:
+            dict: Veredicto, estadístico, límites de aceptación y valor p de cada prueba, indexados por nombre.
+        """
+        self.pseudo_random_numbers = np.empty(0, dtype=np.float64)
+        self.use_summary(SampleSummary.from_accumulators(copy.deepcopy(parts)))
+        results = {}
+        for test_name in self.TEST_NAMES:
+            passed = getattr(self, f'execute_{test_name}_test')()
+            statistic, lower_limit, upper_limit = self.describe_test(test_name) if passed is not None \
+                else (None, None, None)
+            results[test_name] = {
+                'passed': None if passed is None else bool(passed),
+                'statistic': None if statistic is None else float(statistic),
+                'lower_limit': None if lower_limit is None else float(lower_limit),
+                'upper_limit': None if upper_limit is None else float(upper_limit),
+                'p_value': None if passed is None else self.p_value(test_name),
+            }
+        return results
+
+    def describe_test(self, test_name):
+        """
+        Obtiene el estadístico de una prueba ya ejecutada y los límites de su región de aceptación.
+
+        Parámetros:
+            test_name (str): 'ks_exact' o cualquiera de TEST_NAMES.
+
+        Retorna:
+            tuple: Estadístico, límite inferior y límite superior; los límites que no aplican son None.
+        """
+        if test_name == 'mean':
+            return self.mean_test.r, self.mean_test.lower_limit, self.mean_test.higher_limit
+        if test_name == 'variance':
+            # En la prueba de varianza upper_limit es el menor de los dos límites
+            return self.variance_test.variance, self.variance_test.upper_limit, self.variance_test.lower_limit
+        if test_name == 'ks':
+            return self.ks_test.max_difference, None, self.ks_test.critical_difference
+        if test_name == 'ks_exact':
+            return self.ks_test.d_statistic, None, self.ks_test.critical_value
+        if test_name == 'chi':
+            return self.chi_test.total_error, None, self.chi_test.chi_invert
+        if test_name == 'serial':
+            return self.serial_test.chi_squared, None, self.serial_test.chi_invert
+        if test_name == 'runs_up_down':
+            return self.runs_up_down_test.z, -self.runs_up_down_test.zeta, self.runs_up_down_test.zeta
+        if test_name == 'runs_above_below':
+            return self.runs_above_below_test.z, -self.runs_above_below_test.zeta, self.runs_above_below_test.zeta
+        if test_name == 'autocorrelation':
+            return self.autocorrelation_test.chi_squared, None, self.autocorrelation_test.chi_invert
+        if test_name == 'gap':
+            return self.gap_test.chi_squared, None, self.gap_test.chi_invert
+        if test_name == 'coupon':
+            return self.coupon_test.chi_squared, None, self.coupon_test.chi_invert
+        return self.poker_test.chi_squared, None, self.poker_test.x_square
+
+    def p_value(self, test_name):
+        """
+        Obtiene el valor p exacto de una prueba ya ejecutada: el menor nivel de significancia con el que se rechaza.
+
+        Parámetros:
+            test_name (str): 'ks_exact' o cualquiera de TEST_NAMES.
+
+        Retorna:
+            float: Valor p, o None si la prueba no tiene números.
+        """
+        if test_name == 'ks':
+            p_value = self.ks_test.difference_p_value
+        elif test_name == 'ks_exact':
+            p_value = self.ks_test.p_value
+        else:
+            p_value = getattr(self, self.TEST_METHODS[test_name][0]).p_value
+        return None if p_value is None else float(p_value)
+
+    def is_computed(self, test_name):
+        """
+        Indica si el estadístico de una prueba ya se calculó para la muestra actual.
+
+        Parámetros:
+            test_name (str): 'ks_exact' o cualquiera de TEST_NAMES.
+
+        Retorna:
+            bool: True si la prueba puede evaluarse sin recorrer la muestra.
+        """
+        entry = self.statistics.get(self.statistics_key(self.TEST_METHODS[test_name][0]))
+        return entry is not None and test_name in entry[1]
+
+    def statistics_key(self, attribute):
+        """
+        Obtiene la clave con la que se guarda en statistics el estado de una prueba para la muestra actual.
+
+        Parámetros:
+            attribute (str): Atributo de la prueba en esta instancia, por ejemplo 'chi_test'.
+
+        Retorna:
+            tuple: Huella de la muestra, atributo y valor actual de cada parámetro de CONFIGURATION_ATTRIBUTES.
+        """
+        test = getattr(self, attribute)
+        configuration = tuple(getattr(test, name) for name in self.CONFIGURATION_ATTRIBUTES.get(attribute, ()))
+        return self.fingerprint, attribute, configuration
+
+    def clear_statistics(self):
+        """
+        Descarta los estadísticos guardados de todas las muestras.
+        """
+        self.statistics = {}
+
+    def run_test(self, test_name):
+        """
+        Ejecuta una prueba con el nivel de significancia alpha, calculando su estadístico solo si no está guardado
+        para la huella de la muestra actual y los parámetros actuales de la prueba.
+
+        Si el estadístico ya se calculó, se restaura el estado de la prueba y solo se evalúa el umbral, sin recorrer
+        la muestra aunque se haya cargado otra entre medio. Las muestras sin huella, como los resúmenes de
+        acumuladores, se calculan siempre.
+
+        Parámetros:
+            test_name (str): 'ks_exact' o cualquiera de TEST_NAMES.
+
+        Retorna:
+            bool: True si los números pasan la prueba, False de lo contrario.
+        """
+        attribute, execute_method, evaluate_method = self.TEST_METHODS[test_name]
+        test = getattr(self, attribute)
+        key = self.statistics_key(attribute)
+        entry = self.statistics.get(key)
+        if entry is not None:
+            vars(test).update(copy.deepcopy(entry[0]))
+            if test_name in entry[1]:
+                return getattr(test, evaluate_method)(self.alpha)
+        test.alpha = self.alpha
+        with self.measure(test_name):
+            passed = getattr(test, execute_method)()
+        if self.fingerprint is not None:
+            excluded = self.SHARED_ATTRIBUTES + self.CONFIGURATION_ATTRIBUTES.get(attribute, ())
+            state = {name: value for name, value in vars(test).items() if name not in excluded}
+            names = (entry[1] if entry is not None else frozenset()) | {test_name}
+            self.statistics[key] = (copy.deepcopy(state), names)
+        return passed
+
+    def set_alpha(self, alpha):
+        """
+        Cambia el nivel de significancia y vuelve a evaluar las pruebas ya calculadas para la muestra actual, sin
+        recorrerla.
+
+        Parámetros:
+            alpha (float): Nivel de significancia, entre 0 y 1.
+
+        Retorna:
+            dict: Nuevo veredicto de cada prueba ya calculada, indexado por nombre.
+
+        Raises:
+            ValueError: Si alpha no está entre 0 y 1.
+        """
+        if not 0 < alpha < 1:
+            raise ValueError("El nivel de significancia debe estar entre 0 y 1")
+        self.alpha = alpha
+        verdicts = {}
+        for test_name in self.TEST_NAMES + ('ks_exact',):
+            if self.is_computed(test_name):
+                verdicts[test_name] = bool(self.run_test(test_name))
+        return verdicts
+
+    def evaluate_levels(self, test_name, alphas):
+        """
+        Evalúa una prueba con varios niveles de significancia a partir de un único cálculo de su estadístico.
+
+        La prueba queda evaluada con el nivel alpha de esta instancia, como antes de la llamada.
+
+        Parámetros:
+            test_name (str): 'ks_exact' o cualquiera de TEST_NAMES.
+            alphas (list): Niveles de significancia.
+
+        Retorna:
+            list: Nivel, veredicto y límites de aceptación con cada nivel, en el orden de alphas.
+        """
+        attribute, _, evaluate_method = self.TEST_METHODS[test_name]
+        evaluate = getattr(getattr(self, attribute), evaluate_method)
+        levels = []
+        try:
+            for alpha in alphas:
+                passed = evaluate(alpha)
+                _, lower_limit, upper_limit = self.describe_test(test_name)
+                levels.append({
+                    'alpha': float(alpha),
+                    'passed': bool(passed),
+                    'lower_limit': None if lower_limit is None else float(lower_limit),
+                    'upper_limit': None if upper_limit is None else float(upper_limit),
+                })
+        finally:
+            evaluate(self.alpha)
+        return levels
+
+    def create_accumulators(self, min_value=None, max_value=None):
+        """
+        Crea un acumulador por prueba para alimentarlos por bloques y unir resultados parciales.
+
+        Cada proceso o máquina que tenga un fragmento de la muestra puede alimentar sus propios acumuladores y
+        enviarlos para unirlos con merge; finalize calcula luego el resultado exacto de la muestra completa. El
+        acumulador de chi-cuadrado solo se crea si se conocen el mínimo y el máximo de toda la muestra.
+
+        Parámetros:
+            min_value (float, opcional): Menor número de la muestra completa.
+            max_value (float, opcional): Mayor número de la muestra completa.
+
+        Retorna:
+            dict: Acumuladores vacíos indexados por el nombre de cada prueba de TEST_NAMES.
+        """
+        accumulators = {
+            'mean': self.mean_test.create_accumulator(),
+            'variance': self.variance_test.create_accumulator(),
+            'ks': self.ks_test.create_accumulator(),
+            'poker': self.poker_test.create_accumulator(),
+            'serial': self.serial_test.create_accumulator(),
+            'runs_up_down': self.runs_up_down_test.create_accumulator(),
+            'runs_above_below': self.runs_above_below_test.create_accumulator(),
+            'autocorrelation': self.autocorrelation_test.create_accumulator(),
+            'gap': self.gap_test.create_accumulator(),
+            'coupon': self.coupon_test.create_accumulator(),
+        }
+        if min_value is not None and max_value is not None:
+            accumulators['chi'] = self.chi_test.create_accumulator(min_value, max_value)
+        return accumulators
 
     def execute_mean_test(self):
         """
@@ -47,7 +530,7 @@ class Tests:
             bool: True si los números pasan la prueba, False de lo contrario, o None en caso de error.
         """
         try:
-            return self.mean_test.execute_test()
+            return self.run_test('mean')
         except Exception as e:
             print(f"Error al ejecutar la prueba de media: {e}")
             return None
@@ -60,7 +543,7 @@ class Tests:
             bool: True si los números pasan la prueba, False de lo contrario, o None en caso de error.
         """
         try:
-            return self.variance_test.execute_test()
+            return self.run_test('variance')
         except Exception as e:
             print(f"Error al ejecutar la prueba de varianza: {e}")
             return None
@@ -73,11 +556,25 @@ class Tests:
             bool: True si los números pasan la prueba, False de lo contrario, o None en caso de error.
         """
         try:
-            return self.ks_test.execute_test()
+            return self.run_test('ks')
         except Exception as e:
             print(f"Error al ejecutar la prueba de Kolmogorov-Smirnov: {e}")
             return None
 
+    def execute_ks_exact_test(self):
+        """
+        Ejecuta la prueba de Kolmogorov-Smirnov con el estadístico D exacto y el valor crítico para el tamaño de la
+        muestra.
+
+        Retorna:
+            bool: True si los números pasan la prueba, False de lo contrario, o None en caso de error.
+        """
+        try:
+            return self.run_test('ks_exact')
+        except Exception as e:
+            print(f"Error al ejecutar la prueba exacta de Kolmogorov-Smirnov: {e}")
+            return None
+
     def execute_chi_test(self):
         """
         Ejecuta la prueba chi cuadrado.
@@ -86,7 +583,7 @@ class Tests:
             bool: True si los números pasan la prueba, False de lo contrario, o None en caso de error.
         """
         try:
-            return self.chi_test.execute_chi_test()
+            return self.run_test('chi')
         except Exception as e:
             print(f"Error al ejecutar la prueba de Chi Cuadrada: {e}")
             return None
@@ -99,7 +596,85 @@ class Tests:
             bool: True si los números pasan la prueba, False de lo contrario, o None en caso de error.
         """
         try:
-            return self.poker_test.execute_poker_test()
+            return self.run_test('poker')
         except Exception as e:
             print(f"Error al ejecutar la prueba de Poker: {e}")
             return None
+
+    def execute_serial_test(self):
+        """
+        Ejecuta la prueba serial.
+
+        Retorna:
+            bool: True si los números pasan la prueba, False de lo contrario, o None en caso de error.
+        """
+        try:
+            return self.run_test('serial')
+        except Exception as e:
+            print(f"Error al ejecutar la prueba serial: {e}")
+            return None
+
+    def execute_runs_up_down_test(self):
+        """
+        Ejecuta la prueba de corridas arriba y abajo.
+
+        Retorna:
+            bool: True si los números pasan la prueba, False de lo contrario, o None en caso de error.
+        """
+        try:
+            return self.run_test('runs_up_down')
+        except Exception as e:
+            print(f"Error al ejecutar la prueba de corridas arriba y abajo: {e}")
+            return None
+
+    def execute_runs_above_below_test(self):
+        """
+        Ejecuta la prueba de corridas arriba y abajo de la media.
+
+        Retorna:
+            bool: True si los números pasan la prueba, False de lo contrario, o None en caso de error.
+        """
+        try:
+            return self.run_test('runs_above_below')
+        except Exception as e:
+            print(f"Error al ejecutar la prueba de corridas arriba y abajo de la media: {e}")
+            return None
+
+    def execute_autocorrelation_test(self):
+        """
+        Ejecuta la prueba de autocorrelación.
+
+        Retorna:
+            bool: True si los números pasan la prueba, False de lo contrario, o None en caso de error.
+        """
+        try:
+            return self.run_test('autocorrelation')
+        except Exception as e:
+            print(f"Error al ejecutar la prueba de autocorrelación: {e}")
+            return None
+
+    def execute_gap_test(self):
+        """
+        Ejecuta la prueba de huecos.
+
+        Retorna:
+            bool: True si los números pasan la prueba, False de lo contrario, o None en caso de error.
+        """
+        try:
+            return self.run_test('gap')
+        except Exception as e:
+            print(f"Error al ejecutar la prueba de huecos: {e}")
+            return None
+
+    def execute_coupon_test(self):
+        """
+        Ejecuta la prueba del coleccionista de cupones.
+
+        Retorna:
+            bool: True si los números pasan la prueba, False de lo contrario, o None en caso de error.
+        """
+        try:
+            return self.run_test('coupon')
+        except Exception as e:
+            print(f"Error al ejecutar la prueba del coleccionista de cupones: {e}")
+            return None
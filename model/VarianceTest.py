@@ -1,8 +1,10 @@
 import numpy as np
-from scipy.stats import chi2
 from model.Constants import Constants
-from statistics import mean
+from model.SampleSummary import SampleSummary
+from model.accumulators.MomentsAccumulator import MomentsAccumulator
+from model.accumulators.TestAccumulator import TestAccumulator
 
+from model.util.CriticalValues import CriticalValues
 from model.util.MathUtils import MathUtils
 
 
@@ -11,8 +13,10 @@ class VarianceTest:
     Esta clase se encarga de realizar la prueba de varianza para una lista de números pseudoaleatorios.
 
     Atributos:
-        pseudo_random_numbers (list): Lista de números pseudoaleatorios.
+        pseudo_random_numbers (numpy.ndarray): Arreglo float64 de números pseudoaleatorios.
         mean (float): Media de los números pseudoaleatorios.
+        degrees_of_freedom (int): Cantidad de números menos uno.
+        alpha (float): Nivel de significancia con el que se evaluó la prueba.
         one_half_alpha (float): Valor de (1 - alpha/2).
         half_alpha (float): Valor de (alpha/2).
         complete_chi_invert (float): Valor inverso de la distribución chi-cuadrado para (1 - alpha/2).
@@ -20,13 +24,16 @@ class VarianceTest:
         lower_limit (float): Límite inferior del intervalo de confianza.
         upper_limit (float): Límite superior del intervalo de confianza.
         variance (float): Varianza de los números pseudoaleatorios.
+        summary (SampleSummary): Resumen estadístico de la muestra.
     """
     def __init__(self):
         """
         Inicializa una instancia de la clase VarianceTest.
         """
-        self.pseudo_random_numbers = []
+        self.pseudo_random_numbers = np.empty(0, dtype=np.float64)
         self.mean = None
+        self.degrees_of_freedom = 0
+        self.alpha = Constants.ALPHA
         self.one_half_alpha = None
         self.half_alpha = None
         self.complete_chi_invert = None
@@ -34,6 +41,7 @@ class VarianceTest:
         self.lower_limit = None
         self.upper_limit = None
         self.variance = None
+        self.summary = None
 
     def execute_test(self):
         """"
@@ -44,17 +52,59 @@ class VarianceTest:
         Retorna:
             bool: True si la varianza está dentro del intervalo de confianza, False en caso contrario.
         """
-        n = len(self.pseudo_random_numbers) - 1
-        self.mean = mean(self.pseudo_random_numbers)
+        n = self.sample_summary().count - 1
+        if n < 1:
+            raise ValueError("Se necesitan al menos dos números pseudoaleatorios")
+        self.mean = self.sample_summary().mean
         self.variance = MathUtils.truncate(self.calculate_variance())
-        self.one_half_alpha = 1 - (Constants.ALPHA / 2)
-        self.half_alpha = Constants.ALPHA / 2
-        self.complete_chi_invert = MathUtils.truncate(chi2.ppf(self.one_half_alpha, n))
-        self.half_chi_invert = MathUtils.truncate(chi2.ppf(self.half_alpha, n))
+        self.degrees_of_freedom = n
+        return self.evaluate(self.alpha)
+
+    def evaluate(self, alpha):
+        """
+        Evalúa la prueba con un nivel de significancia a partir de la varianza ya calculada, sin recorrer la muestra.
+
+        Parámetros:
+            alpha (float): Nivel de significancia.
+
+        Retorna:
+            bool: True si la varianza está dentro del intervalo de confianza, False en caso contrario.
+        """
+        n = self.degrees_of_freedom
+        self.alpha = alpha
+        self.one_half_alpha = 1 - (alpha / 2)
+        self.half_alpha = alpha / 2
+        self.complete_chi_invert = MathUtils.truncate(CriticalValues.chi2_ppf(self.one_half_alpha, n))
+        self.half_chi_invert = MathUtils.truncate(CriticalValues.chi2_ppf(self.half_alpha, n))
         self.lower_limit = MathUtils.truncate(self.complete_chi_invert / (12 * n))
         self.upper_limit = MathUtils.truncate(self.half_chi_invert / (12 * n))
         return self.upper_limit <= self.variance <= self.lower_limit
 
+    @property
+    def p_value(self):
+        """
+        Obtiene la probabilidad de observar una varianza al menos tan alejada de 1/12, por cualquiera de los dos
+        lados, si la muestra es uniforme.
+
+        Retorna:
+            float: Valor p de la varianza.
+        """
+        n = self.degrees_of_freedom
+        if not n:
+            return None
+        # 12 * n * varianza sigue una chi-cuadrado con n grados de libertad, igual que los límites de la prueba
+        statistic = 12 * n * self.variance
+        return min(2 * min(CriticalValues.chi2_cdf(statistic, n), CriticalValues.chi2_sf(statistic, n)), 1.0)
+
+    def create_accumulator(self):
+        """
+        Crea un acumulador de la prueba que puede alimentarse por bloques y unirse con otros.
+
+        Retorna:
+            TestAccumulator: Acumulador vacío de la prueba.
+        """
+        return TestAccumulator(self, 'execute_test', {'moments': MomentsAccumulator()})
+
     def calculate_variance(self):
         """
         Calcula la varianza de los números pseudoaleatorios.
@@ -62,17 +112,29 @@ class VarianceTest:
         Retorna:
             float: Varianza de los números pseudoaleatorios.
         """
-        variance = np.var(self.pseudo_random_numbers)
-        return variance
+        return self.sample_summary().variance
 
-    def set_pseudo_random_numbers(self, flat_list):
+    def set_pseudo_random_numbers(self, flat_list, summary=None):
         """
         Establece la lista de números pseudoaleatorios.
 
         Args:
-            flat_list (list): Lista de números pseudoaleatorios.
+            flat_list (list | numpy.ndarray): Números pseudoaleatorios.
+            summary (SampleSummary, opcional): Resumen ya calculado de la misma muestra.
+        """
+        self.pseudo_random_numbers = MathUtils.to_float_array(flat_list)
+        self.summary = summary
+
+    def sample_summary(self):
+        """
+        Obtiene el resumen estadístico de la muestra, calculándolo si ninguna otra prueba lo compartió.
+
+        Retorna:
+            SampleSummary: Resumen de la muestra actual.
         """
-        self.pseudo_random_numbers = flat_list
+        if self.summary is None:
+            self.summary = SampleSummary(self.pseudo_random_numbers)
+        return self.summary
 
     @property
     def get_mean(self):
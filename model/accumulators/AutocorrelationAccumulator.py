@@ -0,0 +1,140 @@
+import numpy as np
+
+from model.util.Instrumentation import Instrumentation
+
+
+class AutocorrelationAccumulator:
+    """
+    Acumula por bloques, para cada desfase k entre 1 y max_lag, la suma de los productos
+    (x[i] - 0.5) * (x[i + k] - 0.5) de los números separados por k posiciones.
+
+    Las sumas de todos los desfases salen de correlaciones calculadas con la transformada rápida de Fourier sobre
+    segmentos del bloque, en O(m log max_lag) para un bloque de m números en lugar de O(m * max_lag). Cada producto
+    se cuenta en el acumulador de su segundo número; para los que empiezan antes del bloque se guardan los últimos
+    max_lag números recibidos, que un acumulador de una parte intermedia obtiene con prime o continue_from, como en
+    SerialAccumulator.
+
+    Atributos:
+        max_lag (int): Mayor desfase acumulado.
+        count (int): Cantidad de números recibidos.
+        sums (numpy.ndarray): Suma de los productos de cada desfase; sums[k - 1] corresponde al desfase k.
+        pairs (numpy.ndarray): Cantidad de productos sumados de cada desfase.
+        previous (numpy.ndarray): Últimos números recibidos, ya centrados en 0.5.
+    """
+    MEAN = 0.5
+
+    def __init__(self, max_lag):
+        """
+        Inicializa una instancia de AutocorrelationAccumulator vacía.
+
+        Parámetros:
+            max_lag (int): Mayor desfase acumulado.
+        """
+        self.max_lag = max_lag
+        self.count = 0
+        self.sums = np.zeros(max_lag, dtype=np.float64)
+        self.pairs = np.zeros(max_lag, dtype=np.int64)
+        self.previous = np.empty(0, dtype=np.float64)
+
+    def prime(self, sample, start):
+        """
+        Toma de la muestra los números anteriores a start que completan los primeros productos de la parte que
+        empieza ahí, sin contarlos.
+
+        Parámetros:
+            sample (numpy.ndarray | NormalizedArray): Muestra completa.
+            start (int): Posición del primer número de la parte que recorre este acumulador.
+        """
+        self.previous = np.asarray(sample[max(start - self.max_lag, 0):start], dtype=np.float64) - self.MEAN
+
+    def continue_from(self, other):
+        """
+        Toma de un acumulador de la parte anterior los números que completan los primeros productos de esta.
+
+        Parámetros:
+            other (AutocorrelationAccumulator): Acumulador de la parte inmediatamente anterior.
+        """
+        self.previous = other.previous.copy()
+
+    def update(self, chunk):
+        """
+        Suma los productos de cada desfase que terminan en un bloque de números.
+
+        El bloque se divide en segmentos y cada uno se correlaciona con los max_lag números que lo preceden y con él
+        mismo; las transformadas de todos los segmentos se calculan juntas, con un tamaño fijo y pequeño.
+
+        Parámetros:
+            chunk (numpy.ndarray): Bloque float64 de números.
+        """
+        if not len(chunk):
+            return
+        centered = np.asarray(chunk, dtype=np.float64) - self.MEAN
+        known = len(self.previous)
+        size = self.fft_size(self.max_lag)
+        segment = size - self.max_lag
+        segments = -(-len(centered) // segment)
+        # Los números que faltan antes del primero y después del último se completan con ceros, que no suman
+        values = np.zeros(self.max_lag + segments * segment)
+        values[self.max_lag - known:self.max_lag] = self.previous
+        values[self.max_lag:self.max_lag + len(centered)] = centered
+        with Instrumentation.phase('correlate', 'autocorrelation'):
+            windows = np.lib.stride_tricks.sliding_window_view(values, size)[::segment]
+            current = values[self.max_lag:].reshape(segments, segment)
+            # correlation[i, s] = sum(windows[i, j + s] * current[i, j]); con size >= segment + max_lag los
+            # desfases no dan la vuelta al arreglo circular
+            correlation = np.fft.irfft(np.fft.rfft(windows, size) * np.conj(np.fft.rfft(current, size)), size)
+        lags = np.arange(1, self.max_lag + 1)
+        self.sums += correlation[:, self.max_lag - lags].sum(axis=0)
+        self.pairs += np.maximum(len(centered) - np.maximum(lags - known, 0), 0)
+        self.previous = values[self.max_lag + len(centered) - min(self.max_lag, known + len(centered)):
+                               self.max_lag + len(centered)].copy()
+        self.count += len(chunk)
+
+    @staticmethod
+    def fft_size(max_lag):
+        """
+        Elige el tamaño de las transformadas de los segmentos.
+
+        Parámetros:
+            max_lag (int): Mayor desfase acumulado.
+
+        Retorna:
+            int: Potencia de 2 de al menos 4096 puntos y al menos cuatro veces max_lag, para que cada segmento
+            aporte la mayor parte de sus puntos.
+        """
+        return 1 << max(12, (4 * max_lag - 1).bit_length())
+
+    def merge(self, other):
+        """
+        Une las sumas de un acumulador que recorrió la parte siguiente de la muestra.
+
+        Parámetros:
+            other (AutocorrelationAccumulator): Acumulador de la parte siguiente, preparado con prime o
+                continue_from.
+
+        Raises:
+            ValueError: Si los acumuladores tienen distinto desfase máximo.
+        """
+        if other.max_lag != self.max_lag:
+            raise ValueError("Los acumuladores tienen distinto desfase máximo")
+        self.sums += other.sums
+        self.pairs += other.pairs
+        if other.count:
+            self.previous = other.previous
+        self.count += other.count
+
+    def subtract(self, other):
+        """
+        Quita las sumas de una parte de la muestra que se había unido a este acumulador.
+
+        Parámetros:
+            other (AutocorrelationAccumulator): Acumulador de la parte que se quita.
+
+        Raises:
+            ValueError: Si los acumuladores tienen distinto desfase máximo.
+        """
+        if other.max_lag != self.max_lag:
+            raise ValueError("Los acumuladores tienen distinto desfase máximo")
+        self.sums -= other.sums
+        self.pairs -= other.pairs
+        self.count -= other.count
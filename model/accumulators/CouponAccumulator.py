@@ -0,0 +1,172 @@
+import numpy as np
+
+from model.accumulators.HistogramAccumulator import HistogramAccumulator
+from model.util.Instrumentation import Instrumentation
+
+
+class CouponAccumulator:
+    """
+    Acumula por bloques las longitudes de los segmentos de la prueba del coleccionista de cupones: cada número se
+    convierte en uno de coupons valores y un segmento termina en cuanto aparecieron todos.
+
+    El estado es compacto: las frecuencias de cada longitud (las de max_length o más se agrupan) y, del segmento
+    abierto, los valores ya vistos como máscara de bits y su longitud. Dentro de un bloque no se recorre número por
+    número: una pasada vectorizada por valor calcula, para cada posición, dónde terminaría un segmento que empezara
+    ahí, y luego un único recorrido hacia adelante salta de un segmento al siguiente, llevando el inicio del segmento
+    abierto. Un bloque de m números cuesta O(m * coupons) operaciones vectorizadas más una iteración por segmento.
+
+    Dónde empieza cada segmento depende de todos los números anteriores, así que las partes de una muestra no pueden
+    recorrerse por separado: el acumulador de cada parte debe crearse con continue_from a partir del de la anterior,
+    y entonces unirlo o restarlo suma o quita los segmentos que terminan en ella. Por eso SEQUENTIAL es True.
+
+    Atributos:
+        coupons (int): Cantidad de valores distintos.
+        max_length (int): Longitud a partir de la cual los segmentos se cuentan juntos.
+        counts (numpy.ndarray): Frecuencia de cada longitud de coupons a max_length - 1, y de max_length o más al
+            final.
+        count (int): Cantidad de números recibidos.
+        mask (int): Valores vistos en el segmento abierto, un bit por valor.
+        length (int): Cantidad de números del segmento abierto.
+    """
+    SEQUENTIAL = True
+
+    def __init__(self, coupons, max_length):
+        """
+        Inicializa una instancia de CouponAccumulator vacía.
+
+        Parámetros:
+            coupons (int): Cantidad de valores distintos.
+            max_length (int): Longitud a partir de la cual los segmentos se cuentan juntos.
+        """
+        self.coupons = coupons
+        self.max_length = max_length
+        self.bounds = HistogramAccumulator.uniform_bounds(coupons)
+        self.counts = np.zeros(max_length - coupons + 1, dtype=np.int64)
+        self.count = 0
+        self.mask = 0
+        self.length = 0
+
+    @property
+    def key(self):
+        """Obtiene la configuración de la prueba; solo se unen acumuladores con la misma."""
+        return self.coupons, self.max_length
+
+    def continue_from(self, other):
+        """
+        Continúa el segmento que dejó abierto el acumulador de la parte anterior.
+
+        Parámetros:
+            other (CouponAccumulator): Acumulador de la parte inmediatamente anterior.
+        """
+        self.mask = other.mask
+        self.length = other.length
+
+    def add_lengths(self, lengths):
+        """
+        Cuenta longitudes de segmentos completos.
+
+        Parámetros:
+            lengths (numpy.ndarray): Longitudes, todas de al menos coupons números.
+        """
+        self.counts += np.bincount(np.minimum(lengths, self.max_length) - self.coupons, minlength=len(self.counts))
+
+    def segment_ends(self, values):
+        """
+        Calcula, para cada posición, dónde terminaría un segmento que empezara en ella.
+
+        Parámetros:
+            values (numpy.ndarray): Valor de cada número, entre 0 y coupons - 1.
+
+        Retorna:
+            tuple: Posición del último número del segmento que empieza en cada posición, o len(values) si el bloque
+            termina antes de completarlo, y la primera posición de cada valor a partir de la 0.
+        """
+        size = len(values)
+        positions = np.arange(size, dtype=np.int64)
+        ends = np.zeros(size, dtype=np.int64)
+        first = np.empty(self.coupons, dtype=np.int64)
+        for value in range(self.coupons):
+            # Próxima aparición del valor en cada posición, acumulando el mínimo desde el final
+            following = np.minimum.accumulate(np.where(values == value, positions, size)[::-1])[::-1]
+            np.maximum(ends, following, out=ends)
+            first[value] = following[0]
+        return ends, first
+
+    def update(self, chunk):
+        """
+        Cuenta los segmentos que terminan en un bloque de números.
+
+        Parámetros:
+            chunk (numpy.ndarray): Bloque float64 de números.
+        """
+        size = len(chunk)
+        if not size:
+            return
+        values = np.minimum(HistogramAccumulator.uniform_indexes(chunk, self.coupons, self.bounds), self.coupons - 1)
+        with Instrumentation.phase('segments', 'coupon'):
+            ends, first = self.segment_ends(values)
+            start = 0
+            if self.length:
+                # El segmento abierto termina cuando aparecen los valores que le faltan
+                missing = [value for value in range(self.coupons) if not self.mask >> value & 1]
+                end = int(first[missing].max())
+                if end == size:
+                    self.mask |= int(np.bitwise_or.reduce(np.left_shift(1, np.unique(values))))
+                    self.length += size
+                    self.count += size
+                    return
+                self.add_lengths(np.array([self.length + end + 1]))
+                start = end + 1
+
+            # Un único recorrido hacia adelante: cada segmento empieza justo después del final del anterior, que
+            # ends ya conoce, así que se avanza de a un segmento y no de a un número
+            end_of = ends.item
+            starts = []
+            position = start
+            while position < size:
+                starts.append(position)
+                position = end_of(position) + 1
+
+        starts = np.array(starts, dtype=np.int64)
+        closed = ends[starts] < size
+        self.add_lengths(ends[starts[closed]] + 1 - starts[closed])
+        if len(starts) and not closed[-1]:
+            self.mask = int(np.bitwise_or.reduce(np.left_shift(1, np.unique(values[starts[-1]:]))))
+            self.length = size - int(starts[-1])
+        else:
+            self.mask = 0
+            self.length = 0
+        self.count += size
+
+    def merge(self, other):
+        """
+        Une los segmentos de un acumulador de la parte siguiente de la muestra.
+
+        Parámetros:
+            other (CouponAccumulator): Acumulador de la parte siguiente, creado con continue_from.
+
+        Raises:
+            ValueError: Si los acumuladores tienen distinta configuración.
+        """
+        if other.key != self.key:
+            raise ValueError("Los acumuladores de cupones tienen distinta configuración")
+        self.counts += other.counts
+        if other.count:
+            self.mask = other.mask
+            self.length = other.length
+        self.count += other.count
+
+    def subtract(self, other):
+        """
+        Quita los segmentos que terminan en una parte de la muestra que se había unido a este acumulador.
+
+        Parámetros:
+            other (CouponAccumulator): Acumulador de la parte que se quita.
+
+        Raises:
+            ValueError: Si los acumuladores tienen distinta configuración.
+        """
+        if other.key != self.key:
+            raise ValueError("Los acumuladores de cupones tienen distinta configuración")
+        self.counts -= other.counts
+        self.count -= other.count
@@ -0,0 +1,133 @@
+import numpy as np
+
+
+class GapAccumulator:
+    """
+    Acumula por bloques las longitudes de los huecos de la prueba de huecos: la cantidad de números fuera de
+    [lower, upper) entre dos números consecutivos que caen dentro.
+
+    El estado es compacto: las frecuencias de cada longitud (las de max_gap o más se agrupan), la longitud del hueco
+    abierto al final y, si el acumulador no conoce los números anteriores a su parte, cuántos números precedieron a
+    su primer acierto. Con eso, unir el acumulador de la parte siguiente completa el hueco que cruza el límite, así
+    que las partes pueden recorrerse por separado. Un acumulador creado con continue_from ya sabe cuánto mide el
+    hueco abierto y cuenta el hueco que cruza el límite en su propia parte, de modo que restarlo quita exactamente
+    los huecos que terminan en ella.
+
+    Atributos:
+        lower (float): Límite inferior del intervalo de aciertos.
+        upper (float): Límite superior, excluido, del intervalo de aciertos.
+        max_gap (int): Longitud a partir de la cual los huecos se cuentan juntos.
+        counts (numpy.ndarray): Frecuencia de cada longitud de 0 a max_gap - 1, y de max_gap o más al final.
+        count (int): Cantidad de números recibidos.
+        gap (int): Números desde el último acierto, o -1 si todavía no hubo ninguno.
+        leading (int): Números antes del primer acierto de la parte, o None si la parte continúa a otra.
+    """
+    def __init__(self, lower, upper, max_gap):
+        """
+        Inicializa una instancia de GapAccumulator vacía.
+
+        Parámetros:
+            lower (float): Límite inferior del intervalo de aciertos.
+            upper (float): Límite superior, excluido, del intervalo de aciertos.
+            max_gap (int): Longitud a partir de la cual los huecos se cuentan juntos.
+        """
+        self.lower = lower
+        self.upper = upper
+        self.max_gap = max_gap
+        self.counts = np.zeros(max_gap + 1, dtype=np.int64)
+        self.count = 0
+        self.gap = -1
+        self.leading = 0
+
+    @property
+    def key(self):
+        """Obtiene la configuración de la prueba; solo se unen acumuladores con la misma."""
+        return self.lower, self.upper, self.max_gap
+
+    def continue_from(self, other):
+        """
+        Continúa el hueco que dejó abierto el acumulador de la parte anterior.
+
+        Parámetros:
+            other (GapAccumulator): Acumulador de la parte inmediatamente anterior.
+        """
+        self.gap = other.gap
+        self.leading = None if other.gap >= 0 else 0
+
+    def add_gaps(self, gaps):
+        """
+        Cuenta longitudes de huecos.
+
+        Parámetros:
+            gaps (numpy.ndarray): Longitudes de huecos completos.
+        """
+        self.counts += np.bincount(np.minimum(gaps, self.max_gap), minlength=self.max_gap + 1)
+
+    def update(self, chunk):
+        """
+        Cuenta los huecos que se cierran en un bloque de números.
+
+        Parámetros:
+            chunk (numpy.ndarray): Bloque float64 de números.
+        """
+        if not len(chunk):
+            return
+        hits = np.flatnonzero((chunk >= self.lower) & (chunk < self.upper))
+        if not len(hits):
+            if self.gap >= 0:
+                self.gap += len(chunk)
+            else:
+                self.leading += len(chunk)
+        else:
+            gaps = np.diff(hits) - 1
+            if self.gap >= 0:
+                gaps = np.concatenate(([self.gap + hits[0]], gaps))
+            else:
+                self.leading += int(hits[0])
+            self.add_gaps(gaps)
+            self.gap = len(chunk) - 1 - int(hits[-1])
+        self.count += len(chunk)
+
+    def merge(self, other):
+        """
+        Une los huecos de un acumulador que recorrió la parte siguiente de la muestra.
+
+        Parámetros:
+            other (GapAccumulator): Acumulador de la parte siguiente, creado vacío o con continue_from.
+
+        Raises:
+            ValueError: Si los acumuladores tienen distinta configuración.
+        """
+        if other.key != self.key:
+            raise ValueError("Los acumuladores de huecos tienen distinta configuración")
+        self.counts += other.counts
+        if other.count:
+            if other.leading is None:
+                self.gap = other.gap
+            elif other.gap >= 0:
+                # El hueco que cruza el límite termina en el primer acierto de la otra parte
+                if self.gap >= 0:
+                    self.add_gaps(np.array([self.gap + other.leading]))
+                elif self.leading is not None:
+                    self.leading += other.leading
+                self.gap = other.gap
+            elif self.gap >= 0:
+                self.gap += other.count
+            elif self.leading is not None:
+                self.leading += other.count
+        self.count += other.count
+
+    def subtract(self, other):
+        """
+        Quita los huecos que terminan en una parte de la muestra que se había unido a este acumulador.
+
+        Parámetros:
+            other (GapAccumulator): Acumulador de la parte que se quita, creado con continue_from.
+
+        Raises:
+            ValueError: Si los acumuladores tienen distinta configuración.
+        """
+        if other.key != self.key:
+            raise ValueError("Los acumuladores de huecos tienen distinta configuración")
+        self.counts -= other.counts
+        self.count -= other.count
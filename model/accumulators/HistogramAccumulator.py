@@ -0,0 +1,161 @@
+import numpy as np
+
+
+class HistogramAccumulator:
+    """
+    Acumula por bloques las frecuencias de una muestra en un conjunto fijo de intervalos.
+
+    Admite tres distribuciones de intervalos:
+        - Por límites superiores ('edges'): cada número va al primer intervalo cuyo límite superior es mayor que él
+          y los números que no son menores que el último límite no se cuentan.
+        - Uniforme ('uniform'): igual que 'edges' con los límites i / bins, para i de 1 a bins, pero el intervalo
+          se calcula directamente en O(1) por número en lugar de buscarlo (prueba de Kolmogorov-Smirnov).
+        - Lineal ('linear'): el índice es floor((número - start) / width), limitado a [0, bins - 1]
+          (prueba de chi-cuadrado).
+
+    Atributos:
+        key (tuple): Descripción de la distribución de intervalos; dos acumuladores con la misma clave pueden unirse.
+        counts (numpy.ndarray): Frecuencia de cada intervalo.
+    """
+    def __init__(self, key):
+        """
+        Inicializa una instancia de HistogramAccumulator.
+
+        Parámetros:
+            key (tuple): ('edges', límites), ('uniform', bins) o ('linear', start, width, bins).
+        """
+        self.key = key
+        if key[0] == 'edges':
+            self.edges = np.asarray(key[1], dtype=np.float64)
+            self.counts = np.zeros(len(self.edges), dtype=np.int64)
+        elif key[0] == 'uniform':
+            self.bins = key[1]
+            self.bounds = self.uniform_bounds(self.bins)
+            self.counts = np.zeros(self.bins, dtype=np.int64)
+        else:
+            _, self.start, self.width, self.bins = key
+            self.counts = np.zeros(self.bins, dtype=np.int64)
+
+    @classmethod
+    def by_edges(cls, edges):
+        """
+        Crea un acumulador para una lista de límites superiores.
+
+        Parámetros:
+            edges (list): Límites superiores ordenados de los intervalos.
+
+        Retorna:
+            HistogramAccumulator: Acumulador vacío.
+        """
+        return cls(('edges', tuple(float(edge) for edge in edges)))
+
+    @classmethod
+    def uniform(cls, bins):
+        """
+        Crea un acumulador para los límites superiores 1 / bins, 2 / bins, ..., 1.
+
+        Parámetros:
+            bins (int): Cantidad de intervalos.
+
+        Retorna:
+            HistogramAccumulator: Acumulador vacío.
+        """
+        return cls(('uniform', int(bins)))
+
+    @classmethod
+    def linear(cls, start, width, bins):
+        """
+        Crea un acumulador para intervalos de igual ancho.
+
+        Parámetros:
+            start (float): Límite inferior del primer intervalo.
+            width (float): Ancho de cada intervalo.
+            bins (int): Cantidad de intervalos.
+
+        Retorna:
+            HistogramAccumulator: Acumulador vacío.
+        """
+        return cls(('linear', float(start), float(width), int(bins)))
+
+    @staticmethod
+    def uniform_bounds(bins):
+        """
+        Calcula los límites de los intervalos iguales de [0, 1).
+
+        Parámetros:
+            bins (int): Cantidad de intervalos.
+
+        Retorna:
+            numpy.ndarray: Límites tales que el intervalo j abarca [bounds[j], bounds[j + 1]); el intervalo bins
+            reúne los números que no son menores que 1.
+        """
+        return np.concatenate(([-np.inf], np.arange(1, bins + 1) / bins, [np.inf]))
+
+    @staticmethod
+    def uniform_indexes(chunk, bins, bounds):
+        """
+        Calcula en O(1) por número el intervalo de [0, 1) de cada número de un bloque.
+
+        Parámetros:
+            chunk (numpy.ndarray): Bloque float64 de números.
+            bins (int): Cantidad de intervalos.
+            bounds (numpy.ndarray): Límites calculados con uniform_bounds.
+
+        Retorna:
+            numpy.ndarray: Índice de cada número entre 0 y bins; bins indica un número no menor que 1 o NaN.
+        """
+        estimate = np.floor(chunk * bins)
+        np.nan_to_num(estimate, copy=False, nan=bins)
+        np.clip(estimate, 0, bins, out=estimate)
+        indexes = estimate.astype(np.intp)
+        # El redondeo de chunk * bins puede dejar un número en el intervalo vecino de un límite; se corrige
+        # comparándolo con los límites exactos, igual que haría searchsorted
+        indexes += chunk >= bounds[indexes + 1]
+        indexes -= chunk < bounds[indexes]
+        return indexes
+
+    def update(self, chunk):
+        """
+        Agrega las frecuencias de un bloque de números.
+
+        Parámetros:
+            chunk (numpy.ndarray): Bloque float64 de números.
+        """
+        if self.key[0] == 'edges':
+            indexes = np.searchsorted(self.edges, chunk, side='right')
+            self.counts += np.bincount(indexes, minlength=len(self.edges) + 1)[:len(self.edges)]
+        elif self.key[0] == 'uniform':
+            indexes = self.uniform_indexes(chunk, self.bins, self.bounds)
+            self.counts += np.bincount(indexes, minlength=self.bins + 1)[:self.bins]
+        else:
+            indexes = np.floor_divide(chunk - self.start, self.width).astype(np.int64)
+            np.clip(indexes, 0, self.bins - 1, out=indexes)
+            self.counts += np.bincount(indexes, minlength=self.bins)
+
+    def merge(self, other):
+        """
+        Une las frecuencias de otro acumulador con la misma distribución de intervalos.
+
+        Parámetros:
+            other (HistogramAccumulator): Acumulador de otra parte de la muestra.
+
+        Raises:
+            ValueError: Si los intervalos de ambos acumuladores no coinciden.
+        """
+        if other.key != self.key:
+            raise ValueError("Los histogramas tienen intervalos distintos")
+        self.counts += other.counts
+
+    def subtract(self, other):
+        """
+        Quita las frecuencias de una parte de la muestra que se había unido a este acumulador.
+
+        Parámetros:
+            other (HistogramAccumulator): Acumulador de la parte que se quita.
+
+        Raises:
+            ValueError: Si los intervalos de ambos acumuladores no coinciden.
+        """
+        if other.key != self.key:
+            raise ValueError("Los histogramas tienen intervalos distintos")
+        self.counts -= other.counts
@@ -0,0 +1,114 @@
+import math
+
+import numpy as np
+
+
+class MomentsAccumulator:
+    """
+    Acumula por bloques la cantidad, la suma, la suma de cuadrados, los extremos y la suma de los cuadrados de las
+    desviaciones respecto a la media de una muestra.
+
+    Las medias y las desviaciones de cada bloque se combinan con la fórmula de Chan, que es estable numéricamente y
+    permite unir acumuladores calculados por separado.
+
+    Atributos:
+        count (int): Cantidad de números acumulados.
+        total (float): Suma de los números.
+        sum_of_squares (float): Suma de los cuadrados de los números.
+        m2 (float): Suma de los cuadrados de las desviaciones respecto a la media.
+        minimum (float): Menor número acumulado.
+        maximum (float): Mayor número acumulado.
+    """
+    def __init__(self):
+        """
+        Inicializa una instancia de MomentsAccumulator vacía.
+        """
+        self.count = 0
+        self.total = 0.0
+        self.sum_of_squares = 0.0
+        self.m2 = 0.0
+        self.minimum = math.nan
+        self.maximum = math.nan
+
+    def update(self, chunk):
+        """
+        Agrega un bloque de números.
+
+        Parámetros:
+            chunk (numpy.ndarray): Bloque float64 de números.
+        """
+        if not len(chunk):
+            return
+        block = MomentsAccumulator()
+        block.count = len(chunk)
+        block.total = float(chunk.sum())
+        deviations = chunk - block.total / block.count
+        block.m2 = float(np.dot(deviations, deviations))
+        block.sum_of_squares = float(np.dot(chunk, chunk))
+        block.minimum = float(chunk.min())
+        block.maximum = float(chunk.max())
+        self.merge(block)
+
+    def merge(self, other):
+        """
+        Une los momentos de otro acumulador a este.
+
+        Parámetros:
+            other (MomentsAccumulator): Acumulador de otra parte de la muestra.
+        """
+        if not other.count:
+            return
+        if not self.count:
+            self.__dict__.update(other.__dict__)
+            return
+        count = self.count + other.count
+        delta = other.total / other.count - self.total / self.count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.total += other.total
+        self.sum_of_squares += other.sum_of_squares
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+
+    def subtract(self, other):
+        """
+        Quita los momentos de una parte de la muestra que se había unido a este acumulador.
+
+        Invierte la fórmula de Chan. El mínimo y el máximo no pueden quitarse y quedan sin cambios; quien use
+        este método debe recalcularlos a partir de las partes que siguen en la muestra.
+
+        Parámetros:
+            other (MomentsAccumulator): Acumulador de la parte que se quita.
+        """
+        if not other.count:
+            return
+        count = self.count - other.count
+        if count <= 0:
+            self.__init__()
+            return
+        total = self.total - other.total
+        delta = other.total / other.count - total / count
+        self.m2 = max(self.m2 - other.m2 - delta * delta * count * other.count / self.count, 0.0)
+        self.count = count
+        self.total = total
+        self.sum_of_squares -= other.sum_of_squares
+
+    @property
+    def mean(self):
+        """
+        Obtiene la media de los números acumulados.
+
+        Retorna:
+            float: Media, o NaN si no hay números.
+        """
+        return self.total / self.count if self.count else math.nan
+
+    @property
+    def variance(self):
+        """
+        Obtiene la varianza poblacional de los números acumulados, equivalente a numpy.var.
+
+        Retorna:
+            float: Varianza, o NaN si no hay números.
+        """
+        return self.m2 / self.count if self.count else math.nan
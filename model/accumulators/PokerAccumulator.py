@@ -0,0 +1,85 @@
+import numpy as np
+
+from model.util.Instrumentation import Instrumentation
+
+
+class PokerAccumulator:
+    """
+    Acumula por bloques la cantidad de manos de póker de cada categoría.
+
+    Cada número forma su propia mano, así que el resultado no depende de cómo se divida la muestra.
+
+    Atributos:
+        classifier (type): Clase PokerTest que extrae y clasifica las manos.
+        digit_length (int): Cantidad de dígitos por mano.
+        counts (numpy.ndarray): Cantidad de manos de cada categoría, en el orden de PokerTest.categories.
+        total_hands (int): Cantidad de manos acumuladas.
+    """
+    def __init__(self, classifier, digit_length=5):
+        """
+        Inicializa una instancia de PokerAccumulator.
+
+        Se guarda la clase y no una instancia de la prueba para que el acumulador pueda enviarse a otros procesos
+        sin arrastrar la muestra.
+
+        Parámetros:
+            classifier (type): Clase PokerTest que extrae y clasifica las manos.
+            digit_length (int): Cantidad de dígitos por mano.
+        """
+        self.classifier = classifier
+        self.digit_length = digit_length
+        self.counts = np.zeros(len(classifier.categories(digit_length)), dtype=np.int64)
+        self.total_hands = 0
+
+    def update(self, chunk):
+        """
+        Clasifica las manos de un bloque de números.
+
+        Parámetros:
+            chunk (numpy.ndarray): Bloque float64 de números.
+        """
+        with Instrumentation.phase('extract_hands', 'poker'):
+            hands = self.classifier.extract_hands(chunk, self.digit_length)
+        with Instrumentation.phase('classify_hands', 'poker'):
+            categories = self.classifier.classify_hands(hands, self.digit_length)
+            self.counts += np.bincount(categories, minlength=len(self.counts))
+        self.total_hands += len(hands)
+
+    def merge(self, other):
+        """
+        Une las manos de un acumulador que recorrió otra parte de la muestra.
+
+        Parámetros:
+            other (PokerAccumulator): Acumulador de la otra parte de la muestra.
+
+        Raises:
+            ValueError: Si las manos tienen tamaños distintos.
+        """
+        if other.digit_length != self.digit_length:
+            raise ValueError("Las manos tienen tamaños distintos")
+        self.counts += other.counts
+        self.total_hands += other.total_hands
+
+    def subtract(self, other):
+        """
+        Quita las manos de una parte de la muestra que se había unido a este acumulador.
+
+        Parámetros:
+            other (PokerAccumulator): Acumulador de la parte que se quita.
+
+        Raises:
+            ValueError: Si las manos tienen tamaños distintos.
+        """
+        if other.digit_length != self.digit_length:
+            raise ValueError("Las manos tienen tamaños distintos")
+        self.counts -= other.counts
+        self.total_hands -= other.total_hands
+
+    def category_counts(self):
+        """
+        Obtiene la cantidad de manos de cada categoría.
+
+        Retorna:
+            tuple: Diccionario categoría -> cantidad y cantidad total de manos.
+        """
+        return dict(zip(self.classifier.categories(self.digit_length), self.counts.tolist())), self.total_hands
@@ -0,0 +1,106 @@
+import numpy as np
+
+
+class RunsAccumulator:
+    """
+    Acumula por bloques lo que necesitan las pruebas de corridas: cuántas veces cambia el sentido de la secuencia
+    (de subida a bajada o al revés) y cuántas veces pasa de un lado a otro de la media teórica 0.5.
+
+    Cada comparación entre dos números consecutivos se cuenta en el acumulador del segundo, y cada cambio de sentido
+    en el del tercer número que lo define. Para eso se guardan los dos últimos números recibidos; un acumulador que
+    recorre una parte intermedia de la muestra los obtiene con prime o continue_from, igual que SerialAccumulator,
+    y así unir acumuladores de partes consecutivas es sumar sus contadores.
+
+    Atributos:
+        count (int): Cantidad de números recibidos.
+        signs (int): Cantidad de comparaciones entre números consecutivos.
+        sign_changes (int): Cantidad de cambios entre subir y bajar.
+        above (int): Cantidad de números no menores que 0.5.
+        side_changes (int): Cantidad de veces que dos números consecutivos quedan a distinto lado de 0.5.
+        previous (numpy.ndarray): Últimos dos números, que completan las comparaciones del bloque siguiente.
+    """
+    MEAN = 0.5
+
+    def __init__(self):
+        """
+        Inicializa una instancia de RunsAccumulator vacía.
+        """
+        self.count = 0
+        self.signs = 0
+        self.sign_changes = 0
+        self.above = 0
+        self.side_changes = 0
+        self.previous = np.empty(0, dtype=np.float64)
+
+    def prime(self, sample, start):
+        """
+        Toma de la muestra los números anteriores a start que completan las primeras comparaciones de la parte que
+        empieza ahí, sin contarlos.
+
+        Parámetros:
+            sample (numpy.ndarray | NormalizedArray): Muestra completa.
+            start (int): Posición del primer número de la parte que recorre este acumulador.
+        """
+        self.previous = np.asarray(sample[max(start - 2, 0):start], dtype=np.float64)
+
+    def continue_from(self, other):
+        """
+        Toma de un acumulador de la parte anterior los números que completan las primeras comparaciones de esta.
+
+        Parámetros:
+            other (RunsAccumulator): Acumulador de la parte inmediatamente anterior.
+        """
+        self.previous = other.previous.copy()
+
+    def update(self, chunk):
+        """
+        Cuenta las comparaciones y los cambios que terminan en un bloque de números.
+
+        Parámetros:
+            chunk (numpy.ndarray): Bloque float64 de números.
+        """
+        if not len(chunk):
+            return
+        known = len(self.previous)
+        values = np.concatenate((self.previous, chunk))
+        ups = values[1:] > values[:-1]
+        # ups[i] compara values[i] con values[i + 1]; solo cuentan las comparaciones y los cambios que terminan en
+        # el bloque
+        first_sign = max(known - 1, 0)
+        self.signs += len(ups) - first_sign
+        start = max(first_sign, 1)
+        self.sign_changes += int(np.count_nonzero(ups[start:] != ups[start - 1:-1]))
+        sides = values >= self.MEAN
+        self.above += int(np.count_nonzero(sides[known:]))
+        start = max(known, 1)
+        self.side_changes += int(np.count_nonzero(sides[start:] != sides[start - 1:-1]))
+        self.previous = values[-2:].copy()
+        self.count += len(chunk)
+
+    def merge(self, other):
+        """
+        Une los contadores de un acumulador que recorrió la parte siguiente de la muestra.
+
+        Parámetros:
+            other (RunsAccumulator): Acumulador de la parte siguiente, preparado con prime o continue_from.
+        """
+        self.signs += other.signs
+        self.sign_changes += other.sign_changes
+        self.above += other.above
+        self.side_changes += other.side_changes
+        if other.count:
+            self.previous = other.previous
+        self.count += other.count
+
+    def subtract(self, other):
+        """
+        Quita los contadores de una parte de la muestra que se había unido a este acumulador.
+
+        Parámetros:
+            other (RunsAccumulator): Acumulador de la parte que se quita.
+        """
+        self.signs -= other.signs
+        self.sign_changes -= other.sign_changes
+        self.above -= other.above
+        self.side_changes -= other.side_changes
+        self.count -= other.count
@@ -0,0 +1,168 @@
+import numpy as np
+
+from model.accumulators.HistogramAccumulator import HistogramAccumulator
+from model.util.Instrumentation import Instrumentation
+from model.util.SparseCounts import SparseCounts
+
+
+class SerialAccumulator:
+    """
+    Acumula por bloques las frecuencias de las tuplas de números consecutivos en una cuadrícula de intervalos
+    iguales de [0, 1).
+
+    Cada número se asigna a uno de bins intervalos, como en la prueba de chi-cuadrado con dominio fijo, y cada
+    tupla a la celda que forman los intervalos de sus números. Las tuplas pueden no solaparse (la primera es la de
+    los números 0 a dimensions - 1, la siguiente empieza en dimensions) o solaparse (una tupla por cada número a
+    partir del dimensions-ésimo); en el segundo caso también se cuentan las tuplas de dimensions - 1 números, que
+    necesita el estadístico.
+
+    Cada acumulador cuenta las tuplas que terminan en los números que recibió. Para completar las que empiezan
+    antes, guarda los intervalos de los últimos números que todavía pueden formar parte de una tupla; un
+    acumulador que recorre una parte intermedia de la muestra los obtiene con prime o continue_from. Así, unir
+    acumuladores de partes consecutivas es sumar sus frecuencias.
+
+    Atributos:
+        bins (int): Cantidad de intervalos por dimensión.
+        dimensions (int): Cantidad de números de cada tupla.
+        overlapping (bool): True si las tuplas se solapan.
+        counts (dict): SparseCounts de cada tamaño de tupla contado.
+        count (int): Cantidad de números recibidos.
+        previous (numpy.ndarray): Intervalos de los últimos números, que completan las tuplas del bloque siguiente.
+    """
+    def __init__(self, bins, dimensions, overlapping=False):
+        """
+        Inicializa una instancia de SerialAccumulator.
+
+        Parámetros:
+            bins (int): Cantidad de intervalos por dimensión.
+            dimensions (int): Cantidad de números de cada tupla.
+            overlapping (bool): True para contar tuplas solapadas.
+        """
+        self.bins = bins
+        self.dimensions = dimensions
+        self.overlapping = overlapping
+        self.bounds = HistogramAccumulator.uniform_bounds(bins)
+        orders = (dimensions, dimensions - 1) if overlapping else (dimensions,)
+        self.counts = {order: SparseCounts(bins ** order) for order in orders}
+        self.count = 0
+        self.previous = np.empty(0, dtype=np.int64)
+
+    @property
+    def key(self):
+        """Obtiene la configuración de la cuadrícula; solo se unen acumuladores con la misma."""
+        return self.bins, self.dimensions, self.overlapping
+
+    def interval_indexes(self, numbers):
+        """
+        Calcula el intervalo de cada número; los que no son menores que 1 van al último.
+
+        Parámetros:
+            numbers (numpy.ndarray): Números float64.
+
+        Retorna:
+            numpy.ndarray: Índice int64 del intervalo de cada número.
+        """
+        indexes = HistogramAccumulator.uniform_indexes(np.asarray(numbers, dtype=np.float64), self.bins, self.bounds)
+        return np.minimum(indexes, self.bins - 1).astype(np.int64)
+
+    def prime(self, sample, start):
+        """
+        Toma de la muestra los números anteriores a start que completan las primeras tuplas de la parte que empieza
+        ahí, sin contarlos.
+
+        Parámetros:
+            sample (numpy.ndarray | NormalizedArray): Muestra completa.
+            start (int): Posición del primer número de la parte que recorre este acumulador.
+        """
+        needed = min(start, self.dimensions - 1) if self.overlapping else start % self.dimensions
+        self.previous = self.interval_indexes(sample[start - needed:start]) if needed else self.previous[:0]
+
+    def continue_from(self, other):
+        """
+        Toma de un acumulador de la parte anterior los números que completan las primeras tuplas de esta.
+
+        Parámetros:
+            other (SerialAccumulator): Acumulador de la parte inmediatamente anterior.
+        """
+        self.previous = other.previous.copy()
+
+    def update(self, chunk):
+        """
+        Cuenta las tuplas que terminan en un bloque de números.
+
+        Parámetros:
+            chunk (numpy.ndarray): Bloque float64 de números.
+        """
+        if not len(chunk):
+            return
+        sequence = np.concatenate((self.previous, self.interval_indexes(chunk)))
+        with Instrumentation.phase(f'count {self.dimensions}-tuples', 'serial'):
+            if self.overlapping:
+                for order, counts in self.counts.items():
+                    # Solo las tuplas cuyo último número es del bloque; las demás ya se contaron
+                    first = max(len(self.previous) - order + 1, 0)
+                    tuples = len(sequence) - order + 1 - first
+                    if tuples > 0:
+                        counts.add(self.cell_codes(sequence, first, tuples, order))
+                self.previous = sequence[-(self.dimensions - 1):]
+            else:
+                tuples = len(sequence) // self.dimensions
+                if tuples:
+                    codes = sequence[:tuples * self.dimensions].reshape(tuples, self.dimensions) @ \
+                        self.bins ** np.arange(self.dimensions - 1, -1, -1, dtype=np.int64)
+                    self.counts[self.dimensions].add(codes)
+                self.previous = sequence[tuples * self.dimensions:]
+        self.count += len(chunk)
+
+    def cell_codes(self, sequence, first, tuples, order):
+        """
+        Calcula la celda de tuplas solapadas consecutivas.
+
+        Parámetros:
+            sequence (numpy.ndarray): Intervalos de los números.
+            first (int): Posición del primer número de la primera tupla.
+            tuples (int): Cantidad de tuplas.
+            order (int): Cantidad de números de cada tupla.
+
+        Retorna:
+            numpy.ndarray: Código de la celda de cada tupla, con el primer número como dígito más significativo.
+        """
+        codes = sequence[first:first + tuples].copy()
+        for offset in range(1, order):
+            codes *= self.bins
+            codes += sequence[first + offset:first + offset + tuples]
+        return codes
+
+    def merge(self, other):
+        """
+        Une las frecuencias de un acumulador que recorrió la parte siguiente de la muestra.
+
+        Parámetros:
+            other (SerialAccumulator): Acumulador de la parte siguiente, preparado con prime o continue_from.
+
+        Raises:
+            ValueError: Si las cuadrículas son distintas.
+        """
+        if other.key != self.key:
+            raise ValueError("Las tuplas tienen cuadrículas distintas")
+        for order, counts in self.counts.items():
+            counts.merge(other.counts[order])
+        if other.count:
+            self.previous = other.previous
+        self.count += other.count
+
+    def subtract(self, other):
+        """
+        Quita las tuplas que terminan en una parte de la muestra que se había unido a este acumulador.
+
+        Parámetros:
+            other (SerialAccumulator): Acumulador de la parte que se quita.
+
+        Raises:
+            ValueError: Si las cuadrículas son distintas.
+        """
+        if other.key != self.key:
+            raise ValueError("Las tuplas tienen cuadrículas distintas")
+        for order, counts in self.counts.items():
+            counts.subtract(other.counts[order])
+        self.count -= other.count
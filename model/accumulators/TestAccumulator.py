@@ -0,0 +1,87 @@
+import copy
+
+import numpy as np
+
+from model.SampleSummary import SampleSummary
+
+
+class TestAccumulator:
+    """
+    Estado acumulable de una prueba, que se alimenta por bloques, se une con el de otras partes de la muestra y
+    al final produce el mismo resultado que ejecutar la prueba sobre la muestra completa.
+
+    Las partes que la componen (momentos, histogramas, conteos de manos) son exactas al unirse, así que los
+    resultados parciales de varios procesos o máquinas, cada uno con un fragmento de la muestra, se combinan sin
+    pérdida. Al serializarse se guarda una copia de la prueba sin su muestra.
+
+    Atributos:
+        test (object): Prueba que se ejecuta al finalizar.
+        execute_name (str): Nombre del método de la prueba que calcula el resultado.
+        parts (dict): Acumuladores que forman el estado, indexados por nombre.
+    """
+    def __init__(self, test, execute_name, parts):
+        """
+        Inicializa una instancia de TestAccumulator.
+
+        Parámetros:
+            test (object): Prueba que se ejecuta al finalizar.
+            execute_name (str): Nombre del método de la prueba que calcula el resultado.
+            parts (dict): Acumuladores vacíos que forman el estado, indexados por nombre.
+        """
+        self.test = test
+        self.execute_name = execute_name
+        self.parts = parts
+
+    def update(self, chunk):
+        """
+        Agrega un bloque de números a todas las partes del estado.
+
+        Parámetros:
+            chunk (numpy.ndarray): Bloque float64 de números.
+        """
+        for part in self.parts.values():
+            part.update(chunk)
+
+    def merge(self, other):
+        """
+        Une el estado de otro acumulador de la misma prueba, calculado sobre la parte siguiente de la muestra.
+
+        Parámetros:
+            other (TestAccumulator): Acumulador de otra parte de la muestra.
+
+        Raises:
+            ValueError: Si los acumuladores no tienen las mismas partes.
+        """
+        if other.parts.keys() != self.parts.keys():
+            raise ValueError("Los acumuladores pertenecen a pruebas distintas")
+        for name, part in self.parts.items():
+            part.merge(other.parts[name])
+
+    def finalize(self):
+        """
+        Calcula el resultado de la prueba a partir del estado acumulado, sin volver a leer la muestra.
+
+        La prueba se ejecuta sobre una copia, que reemplaza a test, porque la instancia con la que se creó el
+        acumulador suele ser la de Tests y conserva su propia muestra. Los atributos de la copia quedan con los mismos
+        valores que tendrían tras ejecutar la prueba sobre la muestra completa.
+
+        Retorna:
+            bool: True si los números pasan la prueba, False de lo contrario.
+        """
+        summary = SampleSummary.from_accumulators(self.parts)
+        self.test = copy.copy(self.test)
+        self.test.set_pseudo_random_numbers(np.empty(0, dtype=np.float64), summary)
+        return getattr(self.test, self.execute_name)()
+
+    def __getstate__(self):
+        """
+        Prepara el acumulador para enviarlo a otro proceso sin incluir la muestra de la prueba.
+
+        Retorna:
+            dict: Estado serializable del acumulador.
+        """
+        state = self.__dict__.copy()
+        state['test'] = copy.copy(self.test)
+        state['test'].pseudo_random_numbers = np.empty(0, dtype=np.float64)
+        state['test'].summary = None
+        return state
@@ -0,0 +1,84 @@
+import numpy as np
+
+from model.util.DataLoader import DataLoader
+
+
+class ChunkedSample:
+    """
+    Muestra que se lee del archivo por bloques cada vez que una prueba la recorre, sin mantenerla en memoria.
+
+    Permite analizar archivos más grandes que la memoria disponible: cada recorrido vuelve a leer el archivo y solo
+    conserva un bloque a la vez. Tests la resume en un recorrido que alimenta los momentos, el histograma de
+    Kolmogorov-Smirnov y el conteo de manos de póker; la prueba de chi-cuadrado hace un segundo recorrido porque
+    sus intervalos dependen del mínimo y el máximo.
+
+    Atributos:
+        file_path (str): Ruta del archivo con los números.
+        chunk_size (int): Cantidad de números por bloque.
+    """
+    def __init__(self, file_path, chunk_size=1 << 20):
+        """
+        Inicializa una instancia de ChunkedSample.
+
+        Parámetros:
+            file_path (str): Ruta del archivo en cualquiera de los formatos que admite DataLoader.
+            chunk_size (int): Cantidad de números por bloque.
+        """
+        self.file_path = file_path
+        self.chunk_size = chunk_size
+        self.count = None
+
+    def iter_chunks(self, chunk_size=None):
+        """
+        Lee el archivo desde el principio y lo entrega en bloques float64.
+
+        Siempre se usa el tamaño de bloque de la muestra, que es el que acota la memoria; el parámetro se acepta
+        para que la muestra pueda recorrerse igual que un arreglo con MathUtils.iter_chunks.
+
+        Parámetros:
+            chunk_size (int, opcional): Tamaño de bloque pedido por quien recorre la muestra; se ignora.
+
+        Retorna:
+            generator: Bloques float64 en el orden del archivo.
+        """
+        count = 0
+        for chunk in DataLoader.iter_chunks(self.file_path, self.chunk_size):
+            count += len(chunk)
+            yield chunk
+        self.count = count
+
+    def __len__(self):
+        """
+        Obtiene la cantidad de números del archivo, recorriéndolo si todavía no se conoce.
+
+        Retorna:
+            int: Cantidad de números de la muestra.
+        """
+        if self.count is None:
+            for _ in self.iter_chunks():
+                pass
+        return self.count
+
+    def __getitem__(self, index):
+        """
+        Lee los primeros números del archivo, por ejemplo para mostrarlos en la interfaz.
+
+        Parámetros:
+            index (slice): Rango que empieza en el primer número.
+
+        Retorna:
+            numpy.ndarray: Números del rango pedido.
+
+        Raises:
+            IndexError: Si el rango no empieza en el primer número.
+        """
+        if not isinstance(index, slice) or index.start not in (None, 0) or index.stop is None:
+            raise IndexError("Solo se pueden leer los primeros números de una muestra por bloques")
+        chunks = []
+        read = 0
+        for chunk in self.iter_chunks():
+            if read >= index.stop:
+                break
+            chunks.append(chunk)
+            read += len(chunk)
+        return np.concatenate(chunks)[index] if chunks else np.empty(0, dtype=np.float64)
@@ -0,0 +1,268 @@
+import functools
+import json
+import math
+import os
+
+from model.util.Instrumentation import Instrumentation
+
+
+class CriticalValues:
+    """
+    Clase de utilidades que obtiene los valores críticos de las pruebas sin recalcularlos en cada ejecución.
+
+    Cada valor se busca primero en una caché LRU acotada, luego en la tabla precalculada que se distribuye junto a
+    este módulo (critical_values.json) y solo si no aparece en ninguna se calcula con scipy.stats. La tabla cubre
+    los niveles de significancia habituales, incluidas las mitades de los de Constants.ALPHAS que usan las pruebas de
+    dos colas, hasta MAX_TABLE_DOF grados de libertad y los tamaños de TABLE_KSTWO_SIZES; si el archivo no existe,
+    los valores se calculan y quedan en la caché.
+
+    Las claves son (función, probabilidad, grados de libertad), donde la función es 'chi2.ppf', 'chi2.isf',
+    'norm.ppf' o 'kstwo.isf'; para 'kstwo.isf' los grados de libertad son el tamaño de la muestra.
+
+    Los valores p dependen del estadístico, que casi nunca se repite, así que no tienen tabla ni caché: los de la
+    distribución normal salen de math.erfc y los demás de scipy.stats, que se importa solo cuando se piden.
+    """
+    CACHE_SIZE = 1024
+    TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'critical_values.json')
+    TABLE_PROBABILITIES = (0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.9, 0.95, 0.975, 0.99, 0.995, 0.999,
+                           0.9995)
+    MAX_TABLE_DOF = 100
+    # Tamaño con el que la prueba de Kolmogorov-Smirnov por intervalos obtiene su valor crítico
+    TABLE_KSTWO_SIZES = (50,)
+    table = None
+
+    @staticmethod
+    def chi2_ppf(probability, dof):
+        """
+        Obtiene el cuantil de la distribución chi-cuadrado.
+
+        Parámetros:
+            probability (float): Probabilidad acumulada.
+            dof (int): Grados de libertad.
+
+        Retorna:
+            float: Valor x tal que P(X <= x) = probability.
+        """
+        return CriticalValues.lookup('chi2.ppf', float(probability), int(dof))
+
+    @staticmethod
+    def chi2_isf(alpha, dof):
+        """
+        Obtiene el valor crítico de la cola superior de la distribución chi-cuadrado.
+
+        Parámetros:
+            alpha (float): Nivel de significancia.
+            dof (int): Grados de libertad.
+
+        Retorna:
+            float: Valor x tal que P(X > x) = alpha.
+        """
+        return CriticalValues.lookup('chi2.isf', float(alpha), int(dof))
+
+    @staticmethod
+    def norm_ppf(probability):
+        """
+        Obtiene el cuantil de la distribución normal estándar.
+
+        Parámetros:
+            probability (float): Probabilidad acumulada.
+
+        Retorna:
+            float: Valor z tal que P(Z <= z) = probability.
+        """
+        return CriticalValues.lookup('norm.ppf', float(probability), None)
+
+    @staticmethod
+    def kstwo_isf(alpha, n):
+        """
+        Obtiene el valor crítico exacto del estadístico D de Kolmogorov-Smirnov de dos colas.
+
+        Parámetros:
+            alpha (float): Nivel de significancia.
+            n (int): Tamaño de la muestra.
+
+        Retorna:
+            float: Valor d tal que P(D > d) = alpha.
+        """
+        return CriticalValues.lookup('kstwo.isf', float(alpha), int(n))
+
+    @staticmethod
+    def chi2_sf(statistic, dof):
+        """
+        Obtiene la probabilidad de la cola superior de la distribución chi-cuadrado.
+
+        Parámetros:
+            statistic (float): Estadístico observado.
+            dof (int): Grados de libertad.
+
+        Retorna:
+            float: P(X >= statistic).
+        """
+        return CriticalValues.probability('chi2.sf', float(statistic), int(dof))
+
+    @staticmethod
+    def chi2_cdf(statistic, dof):
+        """
+        Obtiene la probabilidad acumulada de la distribución chi-cuadrado.
+
+        Parámetros:
+            statistic (float): Estadístico observado.
+            dof (int): Grados de libertad.
+
+        Retorna:
+            float: P(X <= statistic).
+        """
+        return CriticalValues.probability('chi2.cdf', float(statistic), int(dof))
+
+    @staticmethod
+    def norm_sf(statistic):
+        """
+        Obtiene la probabilidad de la cola superior de la distribución normal estándar.
+
+        Parámetros:
+            statistic (float): Estadístico observado.
+
+        Retorna:
+            float: P(Z >= statistic).
+        """
+        return 0.5 * math.erfc(statistic / math.sqrt(2))
+
+    @staticmethod
+    def kstwo_sf(statistic, n):
+        """
+        Obtiene la probabilidad de que el estadístico D de Kolmogorov-Smirnov de dos colas supere un valor.
+
+        Parámetros:
+            statistic (float): Estadístico D observado.
+            n (int): Tamaño de la muestra.
+
+        Retorna:
+            float: P(D >= statistic).
+        """
+        return CriticalValues.probability('kstwo.sf', float(statistic), int(n))
+
+    @staticmethod
+    def probability(function, statistic, dof):
+        """
+        Calcula con scipy.stats la probabilidad de una cola de una distribución.
+
+        Parámetros:
+            function (str): 'chi2.sf', 'chi2.cdf' o 'kstwo.sf'.
+            statistic (float): Estadístico observado.
+            dof (int | None): Grados de libertad, o None para la distribución normal.
+
+        Retorna:
+            float: Probabilidad de la cola.
+
+        Raises:
+            ValueError: Si la función no es conocida.
+        """
+        from scipy.stats import chi2, kstwo
+
+        with Instrumentation.phase(function, 'critical values'):
+            if function == 'chi2.sf':
+                return float(chi2.sf(statistic, dof))
+            if function == 'chi2.cdf':
+                return float(chi2.cdf(statistic, dof))
+            if function == 'kstwo.sf':
+                return float(kstwo.sf(statistic, dof))
+        raise ValueError(f"Función de distribución desconocida: {function}")
+
+    @staticmethod
+    @functools.lru_cache(maxsize=CACHE_SIZE)
+    def lookup(function, probability, dof):
+        """
+        Busca un valor crítico en la tabla precalculada o lo calcula; el resultado queda en la caché LRU.
+
+        Parámetros:
+            function (str): 'chi2.ppf', 'chi2.isf', 'norm.ppf' o 'kstwo.isf'.
+            probability (float): Probabilidad o nivel de significancia.
+            dof (int | None): Grados de libertad, o None para la distribución normal.
+
+        Retorna:
+            float: Valor crítico.
+        """
+        value = CriticalValues.load_table().get((function, probability, dof))
+        if value is None:
+            with Instrumentation.phase(function, 'critical values'):
+                value = CriticalValues.compute(function, probability, dof)
+        return value
+
+    @staticmethod
+    def compute(function, probability, dof):
+        """
+        Calcula un valor crítico con scipy.stats.
+
+        Parámetros:
+            function (str): 'chi2.ppf', 'chi2.isf', 'norm.ppf' o 'kstwo.isf'.
+            probability (float): Probabilidad o nivel de significancia.
+            dof (int | None): Grados de libertad, o None para la distribución normal.
+
+        Retorna:
+            float: Valor crítico.
+
+        Raises:
+            ValueError: Si la función no es conocida.
+        """
+        from scipy.stats import chi2, kstwo, norm
+
+        if function == 'chi2.ppf':
+            return float(chi2.ppf(probability, dof))
+        if function == 'chi2.isf':
+            return float(chi2.isf(probability, dof))
+        if function == 'norm.ppf':
+            return float(norm.ppf(probability))
+        if function == 'kstwo.isf':
+            return float(kstwo.isf(probability, dof))
+        raise ValueError(f"Función de distribución desconocida: {function}")
+
+    @staticmethod
+    def load_table():
+        """
+        Carga la tabla precalculada la primera vez que se necesita.
+
+        Retorna:
+            dict: Valores indexados por (función, probabilidad, grados de libertad); vacío si no hay tabla.
+        """
+        if CriticalValues.table is None:
+            table = {}
+            if CriticalValues.TABLE_PATH and os.path.exists(CriticalValues.TABLE_PATH):
+                with open(CriticalValues.TABLE_PATH, 'r') as file:
+                    for function, probability, dof, value in json.load(file):
+                        table[(function, probability, dof)] = value
+            CriticalValues.table = table
+        return CriticalValues.table
+
+    @staticmethod
+    def build_table():
+        """
+        Calcula la tabla de valores críticos habituales.
+
+        Retorna:
+            list: Filas [función, probabilidad, grados de libertad, valor].
+        """
+        rows = []
+        for probability in CriticalValues.TABLE_PROBABILITIES:
+            rows.append(['norm.ppf', probability, None, CriticalValues.compute('norm.ppf', probability, None)])
+            for dof in range(1, CriticalValues.MAX_TABLE_DOF + 1):
+                for function in ('chi2.ppf', 'chi2.isf'):
+                    rows.append([function, probability, dof, CriticalValues.compute(function, probability, dof)])
+            if probability < 0.5:
+                for n in CriticalValues.TABLE_KSTWO_SIZES:
+                    rows.append(['kstwo.isf', probability, n, CriticalValues.compute('kstwo.isf', probability, n)])
+        return rows
+
+    @staticmethod
+    def write_table(file_path=TABLE_PATH):
+        """
+        Genera la tabla precalculada y la guarda en disco.
+
+        Parámetros:
+            file_path (str): Ruta del archivo JSON.
+        """
+        with open(file_path, 'w') as file:
+            json.dump(CriticalValues.build_table(), file, separators=(',', ':'))
+
+
+if __name__ == '__main__':
+    CriticalValues.write_table()
@@ -0,0 +1,339 @@
+import json
+import os
+import re
+import sys
+import time
+
+import numpy as np
+
+from model.util.Instrumentation import Instrumentation
+from model.util.MathUtils import MathUtils
+from model.util.NormalizedArray import NormalizedArray
+
+
+class DataLoader:
+    """
+    Clase de utilidades para cargar números pseudoaleatorios desde archivos sin pasar por listas de Python.
+
+    Los archivos JSON con la estructura {"numbers": [...]} se leen por bloques y el arreglo "numbers" se
+    convierte directamente a un búfer float64, de modo que la memoria usada se mantiene cerca de 8 bytes
+    por número.
+
+    Los formatos binarios (.npy, volcados crudos little-endian y columnas Parquet/Arrow) se mapean en memoria
+    sin leerlos ni copiarlos. Los enteros se envuelven en un NormalizedArray que los lleva a [0, 1) a medida
+    que las pruebas los recorren.
+    """
+    READ_SIZE = 1 << 22
+    NUMBERS_KEY = re.compile(r'"numbers"\s*:\s*\[')
+    RAW_FORMATS = {'.f64': '<f8', '.f32': '<f4', '.u32': '<u4', '.u64': '<u8'}
+    ARROW_FORMATS = ('.arrow', '.feather', '.ipc')
+    SUPPORTED_EXTENSIONS = ('.json', '.npy', '.parquet') + tuple(RAW_FORMATS) + ARROW_FORMATS
+
+    @staticmethod
+    def load(file_path):
+        """
+        Carga los números de un archivo y mide el rendimiento de la carga.
+
+        Parámetros:
+            file_path (str): Ruta del archivo.
+
+        Retorna:
+            tuple: Arreglo float64 (o NormalizedArray) con los números y un diccionario con la cantidad de números,
+            los bytes del archivo, los segundos empleados y los números por segundo.
+
+        Raises:
+            ValueError: Si el formato del archivo no es compatible.
+        """
+        extension = os.path.splitext(file_path)[1].lower()
+        start = time.perf_counter()
+        with Instrumentation.phase(f'load {extension or "file"}', 'data'):
+            if extension == '.json':
+                numbers = DataLoader.load_json(file_path)
+            elif extension == '.npy':
+                numbers = DataLoader.load_npy(file_path)
+            elif extension in DataLoader.RAW_FORMATS:
+                numbers = DataLoader.load_raw(file_path, DataLoader.RAW_FORMATS[extension])
+            elif extension == '.parquet' or extension in DataLoader.ARROW_FORMATS:
+                numbers = DataLoader.load_arrow(file_path)
+            else:
+                raise ValueError("Unsupported file format")
+        seconds = time.perf_counter() - start
+        stats = {
+            'count': len(numbers),
+            'bytes': os.path.getsize(file_path),
+            'seconds': seconds,
+            'numbers_per_second': len(numbers) / seconds if seconds > 0 else float('inf'),
+        }
+        return numbers, stats
+
+    @staticmethod
+    def load_json(file_path):
+        """
+        Lee el arreglo "numbers" de un archivo JSON por bloques.
+
+        Si el arreglo no es una lista plana de números se recurre a json.load.
+
+        Parámetros:
+            file_path (str): Ruta del archivo JSON.
+
+        Retorna:
+            numpy.ndarray: Arreglo float64 con los números del archivo.
+        """
+        try:
+            return DataLoader.stream_json_numbers(file_path)
+        except ValueError:
+            with open(file_path, 'r') as file:
+                data = json.load(file)
+            return np.asarray(data['numbers'], dtype=np.float64).reshape(-1)
+
+    @staticmethod
+    def load_npy(file_path):
+        """
+        Mapea en memoria un archivo .npy.
+
+        Parámetros:
+            file_path (str): Ruta del archivo .npy.
+
+        Retorna:
+            numpy.ndarray | NormalizedArray: Números del archivo, sin copiarlos.
+        """
+        return DataLoader.as_sample(np.load(file_path, mmap_mode='r'))
+
+    @staticmethod
+    def load_raw(file_path, dtype):
+        """
+        Mapea en memoria un volcado binario crudo sin encabezado.
+
+        Parámetros:
+            file_path (str): Ruta del archivo.
+            dtype (str): Tipo de dato de cada número, por ejemplo '<f8' o '<u4'.
+
+        Retorna:
+            numpy.ndarray | NormalizedArray: Números del archivo, sin copiarlos.
+
+        Raises:
+            ValueError: Si el tamaño del archivo no es múltiplo del tamaño de cada número.
+        """
+        itemsize = np.dtype(dtype).itemsize
+        size = os.path.getsize(file_path)
+        if size % itemsize:
+            raise ValueError(f"El tamaño del archivo no es múltiplo de {itemsize} bytes")
+        if not size:
+            return np.empty(0, dtype=np.float64)
+        return DataLoader.as_sample(np.memmap(file_path, dtype=dtype, mode='r'))
+
+    @staticmethod
+    def load_arrow(file_path):
+        """
+        Lee la columna "numbers" (o la primera columna) de un archivo Parquet o Arrow IPC.
+
+        Los archivos Arrow IPC se mapean en memoria y, si la columna no tiene nulos, se usan sin copiarlos.
+        Requiere el paquete opcional pyarrow.
+
+        Parámetros:
+            file_path (str): Ruta del archivo.
+
+        Retorna:
+            numpy.ndarray | NormalizedArray: Números de la columna.
+
+        Raises:
+            ValueError: Si pyarrow no está instalado.
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ValueError("Se necesita el paquete pyarrow para leer archivos Parquet o Arrow")
+
+        if file_path.lower().endswith('.parquet'):
+            table = pq.read_table(file_path, memory_map=True)
+        else:
+            table = pa.ipc.open_file(pa.memory_map(file_path, 'r')).read_all()
+        column = table.column('numbers') if 'numbers' in table.column_names else table.column(0)
+        column = column.combine_chunks() if column.num_chunks != 1 else column.chunk(0)
+        return DataLoader.as_sample(column.to_numpy(zero_copy_only=False))
+
+    @staticmethod
+    def as_sample(values):
+        """
+        Prepara un arreglo binario para las pruebas sin copiarlo.
+
+        Parámetros:
+            values (numpy.ndarray): Arreglo leído del archivo.
+
+        Retorna:
+            numpy.ndarray | NormalizedArray: El mismo arreglo si ya es float64, o una vista que lo normaliza por porciones.
+        """
+        values = values.reshape(-1)
+        if values.dtype == np.float64:
+            return values
+        return NormalizedArray(values)
+
+    @staticmethod
+    def stream_json_numbers(file_path):
+        """
+        Convierte el arreglo "numbers" de un archivo JSON a float64 sin cargar el archivo completo.
+
+        Los bloques que entrega iter_json_blocks se copian a un búfer que crece a medida que hace falta.
+
+        Parámetros:
+            file_path (str): Ruta del archivo JSON.
+
+        Retorna:
+            numpy.ndarray: Arreglo float64 con los números del archivo.
+
+        Raises:
+            ValueError: Si no se encuentra el arreglo "numbers" o no es una lista plana de números.
+        """
+        file_size = os.path.getsize(file_path)
+        buffer = np.empty(0, dtype=np.float64)
+        count = 0
+        for values, text_length in DataLoader.iter_json_blocks(file_path):
+            if count + len(values) > len(buffer):
+                # La primera estimación usa los caracteres por número del primer bloque
+                if not len(buffer):
+                    estimate = int(file_size / max(text_length, 1) * len(values) * 1.05) + 16
+                else:
+                    estimate = int(len(buffer) * 1.5) + 16
+                buffer.resize(max(estimate, count + len(values)), refcheck=False)
+            buffer[count:count + len(values)] = values
+            count += len(values)
+        buffer.resize(count, refcheck=False)
+        return buffer
+
+    @staticmethod
+    def iter_json_blocks(file_path):
+        """
+        Recorre el arreglo "numbers" de un archivo JSON en bloques de números float64.
+
+        El texto se lee en bloques de READ_SIZE caracteres; cada bloque se corta en la última coma y los números
+        completos se convierten con numpy.fromstring.
+
+        Parámetros:
+            file_path (str): Ruta del archivo JSON.
+
+        Retorna:
+            generator: Tuplas con el bloque float64 y la cantidad de caracteres de los que se obtuvo.
+
+        Raises:
+            ValueError: Si no se encuentra el arreglo "numbers" o no es una lista plana de números.
+        """
+        with open(file_path, 'r') as file:
+            pending = DataLoader.skip_to_numbers(file)
+            finished = False
+            while not finished:
+                end = pending.find(']')
+                if end >= 0:
+                    text, finished = pending[:end], True
+                else:
+                    # Solo se convierten los números completos, hasta la última coma leída
+                    cut = pending.rfind(',')
+                    text, pending = pending[:max(cut, 0)], pending[cut + 1:]
+                    block = file.read(DataLoader.READ_SIZE)
+                    if not block:
+                        raise ValueError("El arreglo 'numbers' no está cerrado")
+                    pending += block
+
+                values = DataLoader.parse_numbers(text)
+                if len(values):
+                    yield values, len(text)
+
+    @staticmethod
+    def iter_chunks(file_path, chunk_size):
+        """
+        Recorre los números de un archivo en bloques float64 de tamaño fijo sin cargarlo completo.
+
+        Parámetros:
+            file_path (str): Ruta del archivo en cualquiera de los formatos admitidos.
+            chunk_size (int): Cantidad de números por bloque; el último puede ser menor.
+
+        Retorna:
+            generator: Bloques float64 en el orden del archivo.
+        """
+        if os.path.splitext(file_path)[1].lower() != '.json':
+            numbers, _ = DataLoader.load(file_path)
+            yield from MathUtils.iter_chunks(numbers, chunk_size)
+            return
+
+        buffer = np.empty(chunk_size, dtype=np.float64)
+        filled = 0
+        for values, _ in DataLoader.iter_json_blocks(file_path):
+            start = 0
+            while start < len(values):
+                taken = min(chunk_size - filled, len(values) - start)
+                buffer[filled:filled + taken] = values[start:start + taken]
+                filled += taken
+                start += taken
+                if filled == chunk_size:
+                    yield buffer.copy()
+                    filled = 0
+        if filled:
+            yield buffer[:filled].copy()
+
+    @staticmethod
+    def skip_to_numbers(file):
+        """
+        Avanza en el archivo hasta el inicio del arreglo "numbers".
+
+        Parámetros:
+            file (io.TextIOBase): Archivo JSON abierto en modo texto.
+
+        Retorna:
+            str: Texto leído que sigue al corchete de apertura del arreglo.
+
+        Raises:
+            ValueError: Si el archivo no contiene la clave "numbers".
+        """
+        text = ''
+        while True:
+            block = file.read(DataLoader.READ_SIZE)
+            if not block:
+                raise ValueError("El archivo no contiene la clave 'numbers'")
+            text += block
+            match = DataLoader.NUMBERS_KEY.search(text)
+            if match:
+                return text[match.end():]
+            # Conserva el final por si la clave quedó partida entre dos bloques
+            text = text[-64:]
+
+    @staticmethod
+    def parse_numbers(text):
+        """
+        Convierte una lista de números separados por comas a un arreglo float64.
+
+        Parámetros:
+            text (str): Números separados por comas.
+
+        Retorna:
+            numpy.ndarray: Arreglo float64 con los números.
+
+        Raises:
+            ValueError: Si el texto contiene algo distinto de números.
+        """
+        if not text.strip():
+            return np.empty(0, dtype=np.float64)
+        values = np.fromstring(text, dtype=np.float64, sep=',')
+        if len(values) != text.count(',') + 1:
+            raise ValueError("El arreglo 'numbers' no es una lista plana de números")
+        return values
+
+    @staticmethod
+    def describe_throughput(stats):
+        """
+        Genera un texto legible con el rendimiento de una carga.
+
+        Parámetros:
+            stats (dict): Estadísticas devueltas por load.
+
+        Retorna:
+            str: Descripción de la cantidad de números cargados y la velocidad de lectura.
+        """
+        megabytes_per_second = stats['bytes'] / stats['seconds'] / 1e6 if stats['seconds'] > 0 else float('inf')
+        return (f"{stats['count']:,} numbers in {stats['seconds']:.3f} s "
+                f"({stats['numbers_per_second'] / 1e6:.2f} M numbers/s, {megabytes_per_second:.1f} MB/s)")
+
+
+if __name__ == '__main__':
+    for path in sys.argv[1:]:
+        _, load_stats = DataLoader.load(path)
+        print(f"{path}: {DataLoader.describe_throughput(load_stats)}")
@@ -0,0 +1,225 @@
+import functools
+import os
+import sys
+
+import numpy as np
+
+from model.util.Instrumentation import Instrumentation
+
+
+class HandTable:
+    """
+    Clase de utilidades con la categoría de cada mano de póker posible, precalculada en una tabla.
+
+    Una mano de digit_length dígitos se representa con el entero que forman sus dígitos, así que hay
+    10 ** digit_length manos posibles y la tabla guarda, para cada una, el índice de su categoría en un uint8: para
+    manos de 5 dígitos ocupa 100 KB. Clasificar un arreglo de manos es entonces una sola indexación. La tabla se
+    construye la primera vez que se necesita y queda en memoria; si directory indica una carpeta, se lee de ahí y se
+    guarda ahí para las ejecuciones siguientes.
+
+    La categoría de una mano depende solo de los tamaños de sus grupos de dígitos iguales. Las probabilidades
+    esperadas se obtienen contando las manos de cada categoría en la misma tabla, así que son exactas para
+    cualquier tamaño de mano.
+    """
+    MIN_DIGIT_LENGTH = 2
+    MAX_DIGIT_LENGTH = 7
+    BLOCK_SIZE = 1 << 18
+    # Nombres de las categorías según los grupos de más de un dígito; las demás se nombran con esos tamaños
+    NAMES = {(): 'Todos diferentes', (2,): 'Un par', (2, 2): 'Dos pares', (3,): 'Tercia', (3, 2): 'Full',
+             (4,): 'Poker', (5,): 'Quintillas'}
+    directory = None
+    tables = {}
+
+    @staticmethod
+    def check_digit_length(digit_length):
+        """
+        Verifica que se pueda construir la tabla de un tamaño de mano.
+
+        Parámetros:
+            digit_length (int): Cantidad de dígitos de cada mano.
+
+        Raises:
+            ValueError: Si el tamaño de mano está fuera de [MIN_DIGIT_LENGTH, MAX_DIGIT_LENGTH].
+        """
+        if not HandTable.MIN_DIGIT_LENGTH <= digit_length <= HandTable.MAX_DIGIT_LENGTH:
+            raise ValueError(f"Las manos de póker deben tener entre {HandTable.MIN_DIGIT_LENGTH} y "
+                             f"{HandTable.MAX_DIGIT_LENGTH} dígitos, no {digit_length}")
+
+    @staticmethod
+    def groupings(digit_length):
+        """
+        Enumera las formas de repartir los dígitos de una mano en grupos de dígitos iguales.
+
+        Parámetros:
+            digit_length (int): Cantidad de dígitos de cada mano.
+
+        Retorna:
+            list: Tamaños de los grupos de más de un dígito de cada categoría, de mayor a menor, en el orden de las
+            categorías: de 'Todos diferentes' a la mano con todos los dígitos iguales.
+        """
+        def partitions(remaining, largest):
+            if remaining == 0:
+                yield ()
+            for size in range(min(remaining, largest), 0, -1):
+                for rest in partitions(remaining - size, size):
+                    yield (size,) + rest
+
+        # Con 10 símbolos posibles no puede haber más de 10 grupos
+        return sorted(tuple(size for size in partition if size > 1)
+                      for partition in partitions(digit_length, digit_length) if len(partition) <= 10)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def categories(digit_length):
+        """
+        Obtiene los nombres de las categorías de un tamaño de mano.
+
+        Parámetros:
+            digit_length (int): Cantidad de dígitos de cada mano.
+
+        Retorna:
+            tuple: Nombres en el orden de los índices de la tabla.
+        """
+        return tuple(HandTable.NAMES.get(grouping, 'Grupos ' + '+'.join(map(str, grouping)))
+                     for grouping in HandTable.groupings(digit_length))
+
+    @staticmethod
+    def table(digit_length):
+        """
+        Obtiene la tabla de un tamaño de mano: de memoria, del directorio configurado o construyéndola.
+
+        Parámetros:
+            digit_length (int): Cantidad de dígitos de cada mano.
+
+        Retorna:
+            numpy.ndarray: Índice uint8 de la categoría de cada mano, indexado por el entero que forman sus dígitos.
+
+        Raises:
+            ValueError: Si el tamaño de mano está fuera de los límites.
+        """
+        table = HandTable.tables.get(digit_length)
+        if table is not None:
+            return table
+        HandTable.check_digit_length(digit_length)
+        file_path = HandTable.file_path(HandTable.directory, digit_length) if HandTable.directory else None
+        if file_path and os.path.exists(file_path):
+            table = HandTable.load(file_path, digit_length)
+        if table is None:
+            table = HandTable.build(digit_length)
+            if file_path:
+                try:
+                    HandTable.save(table, file_path)
+                except OSError:
+                    # Sin poder guardarla, la tabla se vuelve a construir en la próxima ejecución
+                    pass
+        HandTable.tables[digit_length] = table
+        return table
+
+    @staticmethod
+    def build(digit_length):
+        """
+        Clasifica todas las manos posibles de un tamaño.
+
+        Por bloques, cuenta cuántas veces aparece cada dígito en cada mano, ordena esas cantidades y busca la
+        categoría que les corresponde.
+
+        Parámetros:
+            digit_length (int): Cantidad de dígitos de cada mano.
+
+        Retorna:
+            numpy.ndarray: Tabla uint8 con 10 ** digit_length entradas.
+        """
+        # Las cantidades de cada dígito, ordenadas de menor a mayor, se resumen en un código en base digit_length + 1
+        weights = (digit_length + 1) ** np.arange(10, dtype=np.int64)
+        codes = []
+        for grouping in HandTable.groupings(digit_length):
+            sizes = grouping + (1,) * (digit_length - sum(grouping))
+            codes.append(int(np.dot(sorted(sizes + (0,) * (10 - len(sizes))), weights)))
+        order = np.argsort(codes)
+        known_codes = np.array(codes, dtype=np.int64)[order]
+
+        table = np.empty(10 ** digit_length, dtype=np.uint8)
+        with Instrumentation.phase(f'build table {digit_length}', 'poker'):
+            for start in range(0, len(table), HandTable.BLOCK_SIZE):
+                hands = np.arange(start, min(start + HandTable.BLOCK_SIZE, len(table)), dtype=np.int64)
+                rows = np.arange(len(hands))
+                counts = np.zeros((len(hands), 10), dtype=np.int64)
+                for _ in range(digit_length):
+                    counts[rows, hands % 10] += 1
+                    hands //= 10
+                hand_codes = np.sort(counts, axis=1) @ weights
+                table[start:start + len(rows)] = order[np.searchsorted(known_codes, hand_codes)]
+        return table
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def probabilities(digit_length):
+        """
+        Obtiene la probabilidad exacta de cada categoría contando sus manos en la tabla.
+
+        Parámetros:
+            digit_length (int): Cantidad de dígitos de cada mano.
+
+        Retorna:
+            dict: Probabilidad de cada categoría, en el orden de categories; se comparte entre llamadas, así que no
+            debe modificarse.
+        """
+        counts = np.bincount(HandTable.table(digit_length), minlength=len(HandTable.categories(digit_length)))
+        return dict(zip(HandTable.categories(digit_length), (counts / 10 ** digit_length).tolist()))
+
+    @staticmethod
+    def file_path(directory, digit_length):
+        """
+        Obtiene la ruta del archivo de la tabla de un tamaño de mano.
+
+        Parámetros:
+            directory (str): Carpeta de las tablas.
+            digit_length (int): Cantidad de dígitos de cada mano.
+
+        Retorna:
+            str: Ruta del archivo .npy.
+        """
+        return os.path.join(directory, f'poker_hands_{digit_length}.npy')
+
+    @staticmethod
+    def load(file_path, digit_length):
+        """
+        Lee una tabla guardada y comprueba que corresponda al tamaño de mano.
+
+        Parámetros:
+            file_path (str): Ruta del archivo .npy.
+            digit_length (int): Cantidad de dígitos de cada mano.
+
+        Retorna:
+            numpy.ndarray | None: Tabla, o None si el archivo no se puede leer o no es válido.
+        """
+        try:
+            table = np.load(file_path)
+        except (OSError, ValueError):
+            return None
+        if table.dtype != np.uint8 or table.shape != (10 ** digit_length,) or \
+                table.max() >= len(HandTable.categories(digit_length)):
+            return None
+        return table
+
+    @staticmethod
+    def save(table, file_path):
+        """
+        Guarda una tabla en disco.
+
+        Parámetros:
+            table (numpy.ndarray): Tabla de un tamaño de mano.
+            file_path (str): Ruta del archivo .npy.
+        """
+        os.makedirs(os.path.dirname(file_path) or '.', exist_ok=True)
+        temporary_path = file_path + '.tmp'
+        with open(temporary_path, 'wb') as file:
+            np.save(file, table)
+        os.replace(temporary_path, file_path)
+
+
+if __name__ == '__main__':
+    # Guarda las tablas de todos los tamaños de mano en la carpeta indicada
+    HandTable.directory = sys.argv[1] if len(sys.argv) > 1 else '.'
+    for length in range(HandTable.MIN_DIGIT_LENGTH, HandTable.MAX_DIGIT_LENGTH + 1):
+        HandTable.table(length)
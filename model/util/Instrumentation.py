@@ -0,0 +1,221 @@
+import contextlib
+import cProfile
+import io
+import json
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+
+
+class Instrumentation:
+    """
+    Registra el tiempo real, el tiempo de CPU y la variación de memoria de cada fase de una ejecución.
+
+    Las fases se marcan en el código con Instrumentation.phase, que no hace nada si el hilo actual no tiene una
+    instancia activa; así el código del modelo puede marcarse sin recibir la instancia como parámetro. Una instancia
+    se activa para un hilo con activate (o install, para dejarla activa). Las fases pueden anidarse: la de una
+    prueba incluye las de los pasos que la componen.
+
+    La memoria se mide con tracemalloc si está activo y, si no, con la memoria residente del proceso cuando el
+    sistema la informa; el tiempo de CPU es el del proceso, así que incluye el de otros hilos que trabajen a la vez.
+
+    Atributos:
+        records (list): Fases registradas, en el orden en que terminaron.
+        origin (float): Instante de referencia de los registros, según time.perf_counter.
+    """
+    local = threading.local()
+
+    def __init__(self):
+        """
+        Inicializa una instancia de Instrumentation sin registros.
+        """
+        self.records = []
+        self.origin = time.perf_counter()
+
+    @staticmethod
+    def active():
+        """
+        Obtiene la instancia activa en el hilo actual.
+
+        Retorna:
+            Instrumentation | None: Instancia activa, o None si no hay ninguna.
+        """
+        return getattr(Instrumentation.local, 'instrumentation', None)
+
+    def install(self):
+        """
+        Deja esta instancia activa en el hilo actual hasta que se instale otra.
+        """
+        Instrumentation.local.instrumentation = self
+
+    @contextlib.contextmanager
+    def activate(self):
+        """
+        Activa esta instancia en el hilo actual mientras dura el bloque y luego restaura la anterior.
+        """
+        previous = Instrumentation.active()
+        Instrumentation.local.instrumentation = self
+        try:
+            yield self
+        finally:
+            Instrumentation.local.instrumentation = previous
+
+    @staticmethod
+    @contextlib.contextmanager
+    def phase(name, category=''):
+        """
+        Registra una fase en la instancia activa del hilo actual, si hay una.
+
+        Parámetros:
+            name (str): Nombre de la fase.
+            category (str): Grupo de la fase, por ejemplo la prueba a la que pertenece.
+        """
+        instrumentation = Instrumentation.active()
+        if instrumentation is None:
+            yield
+            return
+        depth = getattr(Instrumentation.local, 'depth', 0)
+        Instrumentation.local.depth = depth + 1
+        memory = Instrumentation.current_memory()
+        cpu = time.process_time()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - start
+            cpu = time.process_time() - cpu
+            final_memory = Instrumentation.current_memory()
+            Instrumentation.local.depth = depth
+            instrumentation.records.append({
+                'name': name,
+                'category': category,
+                'start': start - instrumentation.origin,
+                'wall': wall,
+                'cpu': cpu,
+                'memory_delta': final_memory - memory if memory is not None and final_memory is not None else None,
+                'thread': threading.get_ident(),
+                'depth': depth,
+            })
+
+    @staticmethod
+    def current_memory():
+        """
+        Obtiene la memoria usada en este momento.
+
+        Retorna:
+            int | None: Bytes asignados según tracemalloc si está activo, o memoria residente del proceso; None si
+            ninguna de las dos está disponible.
+        """
+        if tracemalloc.is_tracing():
+            return tracemalloc.get_traced_memory()[0]
+        try:
+            with open('/proc/self/statm', 'r') as file:
+                return int(file.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+        except (OSError, ValueError, AttributeError):
+            return None
+
+    def clear(self):
+        """
+        Descarta los registros y reinicia el instante de referencia.
+        """
+        self.records = []
+        self.origin = time.perf_counter()
+
+    def summary(self):
+        """
+        Agrupa los registros por categoría y nombre de fase.
+
+        Retorna:
+            list: Por cada fase, su categoría, nombre, cantidad de llamadas y totales de tiempo real, tiempo de CPU y
+            variación de memoria, de la que más tiempo tomó a la que menos.
+        """
+        phases = {}
+        for record in list(self.records):
+            key = (record['category'], record['name'])
+            phase = phases.setdefault(key, {'category': key[0], 'name': key[1], 'calls': 0, 'wall': 0.0,
+                                            'cpu': 0.0, 'memory_delta': 0})
+            phase['calls'] += 1
+            phase['wall'] += record['wall']
+            phase['cpu'] += record['cpu']
+            if record['memory_delta'] is None or phase['memory_delta'] is None:
+                phase['memory_delta'] = None
+            else:
+                phase['memory_delta'] += record['memory_delta']
+        return sorted(phases.values(), key=lambda phase: phase['wall'], reverse=True)
+
+    def chrome_trace(self):
+        """
+        Convierte los registros al formato de eventos de Chrome, que también abren Perfetto y speedscope.
+
+        Retorna:
+            dict: Traza con un evento completo por fase, en microsegundos.
+        """
+        process_id = os.getpid()
+        events = []
+        for record in list(self.records):
+            events.append({
+                'name': record['name'],
+                'cat': record['category'],
+                'ph': 'X',
+                'ts': record['start'] * 1e6,
+                'dur': record['wall'] * 1e6,
+                'pid': process_id,
+                'tid': record['thread'],
+                'args': {'cpu_ms': record['cpu'] * 1e3, 'memory_delta_bytes': record['memory_delta']},
+            })
+        return {'traceEvents': sorted(events, key=lambda event: event['ts']), 'displayTimeUnit': 'ms'}
+
+    def export_chrome_trace(self, file_path):
+        """
+        Guarda los registros como traza de Chrome.
+
+        Parámetros:
+            file_path (str): Ruta del archivo JSON.
+        """
+        with open(file_path, 'w') as file:
+            json.dump(self.chrome_trace(), file)
+
+    @staticmethod
+    def profile(function, profile_path=None, trace_memory=True, top=15):
+        """
+        Ejecuta una función bajo cProfile y, si se pide, tracemalloc.
+
+        cProfile solo observa el hilo desde el que se llama a este método.
+
+        Parámetros:
+            function (callable): Función sin argumentos a perfilar.
+            profile_path (str, opcional): Ruta donde guardar las estadísticas de cProfile, legibles con pstats o
+                snakeviz.
+            trace_memory (bool): True para registrar también las líneas que más memoria asignaron.
+            top (int): Cantidad de funciones y de líneas del informe.
+
+        Retorna:
+            tuple: Resultado de la función e informe con la ruta de las estadísticas, las funciones con más tiempo
+            acumulado en texto, el pico de memoria asignada y las líneas con más memoria asignada al terminar.
+        """
+        started_tracing = trace_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        profiler = cProfile.Profile()
+        try:
+            result = profiler.runcall(function)
+            snapshot = tracemalloc.take_snapshot() if trace_memory else None
+            peak = tracemalloc.get_traced_memory()[1] if trace_memory else None
+        finally:
+            if started_tracing:
+                tracemalloc.stop()
+
+        if profile_path:
+            profiler.dump_stats(profile_path)
+        text = io.StringIO()
+        pstats.Stats(profiler, stream=text).sort_stats('cumulative').print_stats(top)
+        allocations = []
+        if snapshot is not None:
+            for statistic in snapshot.statistics('lineno')[:top]:
+                frame = statistic.traceback[0]
+                allocations.append({'file': frame.filename, 'line': frame.lineno, 'bytes': statistic.size,
+                                    'blocks': statistic.count})
+        return result, {'profile_path': profile_path, 'functions': text.getvalue(), 'peak_bytes': peak,
+                        'allocations': allocations}
@@ -1,3 +1,6 @@
+import numpy as np
+
+
 class MathUtils:
     """
     Clase de utilidades matemáticas que proporciona métodos estáticos para operaciones matemáticas comunes.
@@ -14,3 +17,43 @@ class MathUtils:
             float: El número truncado a 5 decimales.
         """
         return float(f'{number:.5f}')
+
+    @staticmethod
+    def to_float_array(numbers):
+        """
+        Convierte una secuencia de números en un arreglo contiguo de tipo float64.
+
+        Si la secuencia ya es un arreglo contiguo de float64, como un archivo mapeado en memoria, se reutiliza sin
+        copiarlo. Las muestras perezosas (NormalizedArray, ChunkedSample), que se recorren con iter_chunks, se
+        conservan tal cual para que se conviertan por bloques.
+
+        Parámetros:
+            numbers (list | numpy.ndarray | NormalizedArray | ChunkedSample): Secuencia de números pseudoaleatorios.
+
+        Retorna:
+            numpy.ndarray | NormalizedArray | ChunkedSample: Arreglo unidimensional de tipo float64 o muestra perezosa.
+        """
+        if hasattr(numbers, 'iter_chunks'):
+            return numbers
+        return np.ascontiguousarray(numbers, dtype=np.float64).reshape(-1)
+
+    @staticmethod
+    def iter_chunks(numbers, chunk_size):
+        """
+        Recorre una secuencia de números en bloques consecutivos de tamaño fijo.
+
+        Los bloques de un arreglo son vistas, por lo que recorrerlos no copia los datos. Las muestras perezosas
+        entregan sus propios bloques.
+
+        Parámetros:
+            numbers (numpy.ndarray | NormalizedArray | ChunkedSample): Números pseudoaleatorios.
+            chunk_size (int): Cantidad máxima de números por bloque.
+
+        Retorna:
+            generator: Bloques float64 en el orden original de la secuencia.
+        """
+        if hasattr(numbers, 'iter_chunks'):
+            yield from numbers.iter_chunks(chunk_size)
+            return
+        for start in range(0, len(numbers), chunk_size):
+            yield np.asarray(numbers[start:start + chunk_size], dtype=np.float64)
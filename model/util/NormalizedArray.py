@@ -0,0 +1,91 @@
+import numpy as np
+
+
+class NormalizedArray:
+    """
+    Vista perezosa de un arreglo numérico como números float64 en [0, 1).
+
+    Se usa con arreglos mapeados en memoria: nada se convierte al abrir el archivo, y cada porción se normaliza
+    en el momento en que una prueba la lee. Los enteros sin signo de b bits se escalan por 2^-b; si b supera
+    los 53 bits de la mantisa de float64, se descartan primero los bits menos significativos para que el
+    resultado nunca redondee a 1.0.
+
+    Atributos:
+        raw (numpy.ndarray): Arreglo original, normalmente un numpy.memmap.
+    """
+    def __init__(self, raw):
+        """
+        Inicializa una instancia de NormalizedArray.
+
+        Parámetros:
+            raw (numpy.ndarray): Arreglo unidimensional de enteros o de números de punto flotante.
+        """
+        self.raw = raw.reshape(-1)
+        if np.issubdtype(raw.dtype, np.integer):
+            bits = raw.dtype.itemsize * 8
+            self.unsigned_dtype = np.dtype(raw.dtype.str.replace('i', 'u'))
+            self.shift = max(bits - 53, 0)
+            self.scale = 2.0 ** -(bits - self.shift)
+        else:
+            self.unsigned_dtype = None
+
+    def normalize(self, values):
+        """
+        Convierte una porción del arreglo original a float64.
+
+        Parámetros:
+            values (numpy.ndarray): Porción del arreglo original.
+
+        Retorna:
+            numpy.ndarray: Porción convertida a float64 y, si es entera, escalada a [0, 1).
+        """
+        if self.unsigned_dtype is None:
+            return np.asarray(values, dtype=np.float64)
+        values = values.view(self.unsigned_dtype)
+        if self.shift:
+            values = values >> np.uint64(self.shift)
+        return values.astype(np.float64) * self.scale
+
+    def iter_chunks(self, chunk_size):
+        """
+        Recorre el arreglo en bloques normalizados de tamaño fijo.
+
+        Parámetros:
+            chunk_size (int): Cantidad máxima de números por bloque.
+
+        Retorna:
+            generator: Bloques float64 en el orden original.
+        """
+        for start in range(0, len(self.raw), chunk_size):
+            yield self.normalize(self.raw[start:start + chunk_size])
+
+    def __len__(self):
+        """
+        Retorna:
+            int: Cantidad de números del arreglo.
+        """
+        return len(self.raw)
+
+    def __getitem__(self, index):
+        """
+        Obtiene y normaliza una porción del arreglo.
+
+        Parámetros:
+            index (int | slice): Posición o rango a leer.
+
+        Retorna:
+            float | numpy.ndarray: Número o porción normalizada.
+        """
+        if isinstance(index, slice):
+            return self.normalize(self.raw[index])
+        return float(self.normalize(self.raw[index:index + 1 or None])[0])
+
+    def __array__(self, dtype=None, copy=None):
+        """
+        Materializa el arreglo completo normalizado; solo se usa si algún código necesita todos los datos a la vez.
+
+        Retorna:
+            numpy.ndarray: Arreglo float64 completo.
+        """
+        values = self.normalize(self.raw)
+        return values if dtype is None else values.astype(dtype)
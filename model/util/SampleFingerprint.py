@@ -0,0 +1,112 @@
+import hashlib
+
+import numpy as np
+
+
+class SampleFingerprint:
+    """
+    Huella de una muestra: un resumen blake2b de sus números como float64, en orden.
+
+    La muestra se divide en segmentos de SEGMENT_SIZE números contados desde su inicio; cada segmento completo se
+    resume por separado y la huella resume la lista ordenada de esos resúmenes junto con el segmento final
+    incompleto. Como los segmentos no dependen de los bloques, dos muestras con los mismos números tienen la misma
+    huella sin importar cómo se dividieron en bloques ni de qué formato se leyeron, y las partes de una muestra
+    pueden resumirse en procesos distintos: el acumulador de cada parte se crea con prime, que lee los números del
+    segmento que empezó antes de ella, y luego se une en orden con merge.
+
+    Atributos:
+        start (int): Posición de la muestra en la que empieza la parte de este acumulador.
+        count (int): Cantidad de números recibidos.
+        digests (list): Resumen de cada segmento completo que termina en la parte, en orden.
+        tail (numpy.ndarray): Números del segmento abierto, incluidos los anteriores a la parte tomados con prime.
+    """
+    SEGMENT_SIZE = 1 << 14
+    DIGEST_SIZE = 16
+
+    def __init__(self):
+        """
+        Inicializa una instancia de SampleFingerprint vacía, para una parte que empieza al inicio de la muestra.
+        """
+        self.start = 0
+        self.count = 0
+        self.digests = []
+        self.tail = np.empty(0, dtype=np.float64)
+
+    def prime(self, sample, start):
+        """
+        Toma de la muestra los números del segmento que empezó antes de start, sin contarlos.
+
+        Parámetros:
+            sample (numpy.ndarray | NormalizedArray): Muestra completa.
+            start (int): Posición del primer número de la parte que recorre este acumulador.
+        """
+        self.start = start
+        self.tail = np.array(sample[start - start % self.SEGMENT_SIZE:start], dtype=np.float64)
+
+    def digest(self, segment):
+        """
+        Resume un segmento de números.
+
+        Parámetros:
+            segment (numpy.ndarray): Números float64 del segmento.
+
+        Retorna:
+            bytes: Resumen del segmento.
+        """
+        return hashlib.blake2b(np.ascontiguousarray(segment, dtype=np.float64), digest_size=self.DIGEST_SIZE).digest()
+
+    def update(self, chunk):
+        """
+        Agrega un bloque de números a la huella.
+
+        Parámetros:
+            chunk (numpy.ndarray): Bloque float64 de números.
+        """
+        position = 0
+        if len(self.tail):
+            # Completa primero el segmento abierto
+            position = min(self.SEGMENT_SIZE - len(self.tail), len(chunk))
+            self.tail = np.concatenate((self.tail, chunk[:position]))
+            if len(self.tail) < self.SEGMENT_SIZE:
+                self.count += len(chunk)
+                return
+            self.digests.append(self.digest(self.tail))
+        for segment_start in range(position, len(chunk) - self.SEGMENT_SIZE + 1, self.SEGMENT_SIZE):
+            self.digests.append(self.digest(chunk[segment_start:segment_start + self.SEGMENT_SIZE]))
+            position = segment_start + self.SEGMENT_SIZE
+        self.tail = np.array(chunk[position:], dtype=np.float64)
+        self.count += len(chunk)
+
+    def merge(self, other):
+        """
+        Une la huella de la parte siguiente de la muestra.
+
+        Parámetros:
+            other (SampleFingerprint): Acumulador de la parte que empieza donde termina esta, creado con prime.
+
+        Raises:
+            ValueError: Si la otra parte no empieza donde termina esta.
+        """
+        if not other.count:
+            return
+        if other.start != self.start + self.count:
+            raise ValueError("Las partes de la huella no son consecutivas")
+        # El segmento abierto de esta parte continúa en la otra, que lo tomó completo con prime
+        self.digests.extend(other.digests)
+        self.tail = other.tail
+        self.count += other.count
+
+    @property
+    def hexdigest(self):
+        """
+        Obtiene la huella de los números recibidos.
+
+        Retorna:
+            str: Resumen hexadecimal, precedido por la cantidad de números.
+        """
+        hasher = hashlib.blake2b(digest_size=self.DIGEST_SIZE)
+        for digest in self.digests:
+            hasher.update(digest)
+        hasher.update(self.digest(self.tail))
+        return f'{self.start + self.count}:{hasher.hexdigest()}'
+
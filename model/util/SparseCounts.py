@@ -0,0 +1,102 @@
+import numpy as np
+
+
+class SparseCounts:
+    """
+    Frecuencias de las celdas de una cuadrícula identificadas por un código entero entre 0 y size - 1.
+
+    Si la cuadrícula tiene a lo sumo DENSE_LIMIT celdas, las frecuencias se guardan en un arreglo de todas las
+    celdas y se cuentan con bincount. Si no, solo se guardan las celdas no vacías, como arreglos ordenados de
+    códigos y frecuencias, así que la memoria crece con las celdas ocupadas y no con el tamaño de la cuadrícula.
+
+    Atributos:
+        size (int): Cantidad de celdas de la cuadrícula.
+        dense (numpy.ndarray): Frecuencia de cada celda, o None si se guardan solo las celdas no vacías.
+        cells (numpy.ndarray): Códigos ordenados de las celdas no vacías, si dense es None.
+        values (numpy.ndarray): Frecuencia de cada celda de cells.
+    """
+    DENSE_LIMIT = 1 << 20
+
+    def __init__(self, size):
+        """
+        Inicializa una instancia de SparseCounts sin frecuencias.
+
+        Parámetros:
+            size (int): Cantidad de celdas de la cuadrícula.
+        """
+        self.size = size
+        self.dense = np.zeros(size, dtype=np.int64) if size <= self.DENSE_LIMIT else None
+        self.cells = np.empty(0, dtype=np.int64)
+        self.values = np.empty(0, dtype=np.int64)
+
+    def add(self, codes):
+        """
+        Cuenta una vez cada código de un arreglo.
+
+        Parámetros:
+            codes (numpy.ndarray): Códigos de celda.
+        """
+        if self.dense is not None:
+            self.dense += np.bincount(codes, minlength=self.size)
+        else:
+            cells, values = np.unique(codes, return_counts=True)
+            self.combine(cells, values.astype(np.int64))
+
+    def combine(self, cells, values):
+        """
+        Suma frecuencias a las celdas no vacías y descarta las que quedan en cero.
+
+        Parámetros:
+            cells (numpy.ndarray): Códigos de celda ordenados y sin repetir.
+            values (numpy.ndarray): Frecuencia que se suma a cada celda; puede ser negativa.
+        """
+        # Las celdas ya ocupadas se actualizan en su lugar; solo las nuevas obligan a copiar los arreglos
+        positions = np.searchsorted(self.cells, cells)
+        found = positions < len(self.cells)
+        found[found] = self.cells[positions[found]] == cells[found]
+        self.values[positions[found]] += values[found]
+        if not found.all():
+            new = ~found
+            self.cells = np.insert(self.cells, positions[new], cells[new])
+            self.values = np.insert(self.values, positions[new], values[new])
+        if (values < 0).any():
+            nonzero = self.values != 0
+            self.cells, self.values = self.cells[nonzero], self.values[nonzero]
+
+    def merge(self, other):
+        """
+        Suma las frecuencias de otro conteo de la misma cuadrícula.
+
+        Parámetros:
+            other (SparseCounts): Conteo de otra parte de la muestra.
+        """
+        if self.dense is not None:
+            self.dense += other.dense
+        else:
+            self.combine(other.cells, other.values)
+
+    def subtract(self, other):
+        """
+        Resta las frecuencias de otro conteo de la misma cuadrícula que se había sumado a este.
+
+        Parámetros:
+            other (SparseCounts): Conteo de la parte que se quita.
+        """
+        if self.dense is not None:
+            self.dense -= other.dense
+        else:
+            self.combine(other.cells, -other.values)
+
+    def occupied(self):
+        """
+        Obtiene las frecuencias de las celdas no vacías.
+
+        Retorna:
+            numpy.ndarray: Frecuencias mayores que cero, sin un orden garantizado.
+        """
+        return self.dense[self.dense != 0] if self.dense is not None else self.values
+
+    @property
+    def total(self):
+        """Obtiene la suma de todas las frecuencias."""
+        return int(self.occupied().sum())
@@ -1,4 +1,5 @@
-from model.Constants import Constants
+from model.util.Instrumentation import Instrumentation
+from presenter.TestWorker import TestWorker
 
 
 class Presenter:
@@ -8,6 +9,11 @@ class Presenter:
     Atributos:
         model (Model): Instancia del modelo que contiene la lógica y los datos.
         view (View): Instancia de la vista que interactúa con el usuario.
+        worker (TestWorker): Hilo que ejecuta las pruebas en curso, o None si no hay ninguna.
+        test_functions (list): Funciones del modelo que ejecutan cada prueba, en el orden de la tabla de estado.
+        result_presenters (list): Funciones que presentan los resultados de cada prueba.
+        ks_exact_passed (bool): Resultado de la prueba exacta de Kolmogorov-Smirnov, o None si hubo un error.
+        instrumentation (Instrumentation): Tiempos y memoria de cada fase de la carga y de las pruebas de la sesión.
     """
     def __init__(self, view, model) -> None:
         """
@@ -19,105 +25,426 @@ class Presenter:
         """
         self.model = model
         self.view = view
+        self.worker = None
+        self.ks_exact_passed = None
+        # Activa en el hilo de la interfaz para registrar también la carga de archivos
+        self.instrumentation = Instrumentation()
+        self.instrumentation.install()
+        self.model.set_instrumentation(self.instrumentation)
+        self.test_functions = [self.model.execute_mean_test, self.model.execute_variance_test,
+                               self.execute_ks_tests, self.model.execute_chi_test, self.model.execute_poker_test,
+                               self.model.execute_serial_test, self.model.execute_runs_up_down_test,
+                               self.model.execute_runs_above_below_test, self.model.execute_autocorrelation_test,
+                               self.model.execute_gap_test, self.model.execute_coupon_test]
+        self.result_presenters = [self.show_mean_results, self.show_variance_results, self.show_ks_results,
+                                  self.show_chi_results, self.show_poker_results, self.show_serial_results,
+                                  self.show_runs_up_down_results, self.show_runs_above_below_results,
+                                  self.show_autocorrelation_results, self.show_gap_results,
+                                  self.show_coupon_results]
         self.connect_signals()
 
     def set_data_to_model(self, data):
         """
-        Establece los datos en el modelo.
+        Establece los datos en el modelo en un hilo aparte, sin bloquear la interfaz.
 
         Args:
-            data (list): Lista de números pseudoaleatorios.
+            data (numpy.ndarray): Arreglo de números pseudoaleatorios.
         """
-        self.model.set_pseudo_random_numbers(data)
+        for index in range(len(self.test_functions)):
+            self.view.load_file_tab.update_status(index, "Not Run")
+            self.view.load_file_tab.set_p_value(index, None)
+        self.start_worker([], data)
+
+    def execute_ks_tests(self):
+        """
+        Ejecuta las pruebas de Kolmogorov-Smirnov por intervalos y exacta; se llama desde el trabajador.
+
+        Returns:
+            bool: Resultado de la prueba por intervalos, que es el que se muestra en la tabla de estado.
+        """
+        test_passed = self.model.execute_ks_test()
+        self.ks_exact_passed = self.model.execute_ks_exact_test()
+        return test_passed
+
+    def start_worker(self, test_indices, data=None):
+        """
+        Ejecuta pruebas en un TestWorker y conecta sus señales a la vista.
+
+        Args:
+            test_indices (list): Índices de las pruebas a ejecutar, en orden.
+            data (numpy.ndarray, opcional): Muestra que se establece en el modelo antes de ejecutar las pruebas.
+        """
+        if self.worker is not None:
+            return
+        profile = self.view.diagnostics_tab.profile_check_box.isChecked()
+        self.worker = TestWorker(self.model, [(index, self.test_functions[index]) for index in test_indices], data,
+                                 profile)
+        self.worker.test_started.connect(self.on_test_started)
+        self.worker.progress_changed.connect(self.on_progress_changed)
+        self.worker.test_finished.connect(self.on_test_finished)
+        self.worker.cancelled.connect(self.on_cancelled)
+        self.worker.failed.connect(self.on_failed)
+        self.worker.profiled.connect(self.view.diagnostics_tab.set_profile_report)
+        self.worker.finished.connect(self.on_worker_finished)
+        for index in test_indices:
+            self.view.load_file_tab.update_status(index, "Queued")
+        self.view.set_tests_running(True)
+        self.worker.start()
+
+    def cancel_tests(self):
+        """
+        Pide al trabajador en curso que detenga la ejecución.
+        """
+        if self.worker is not None:
+            self.worker.cancel()
+
+    def on_test_started(self, index):
+        """
+        Marca una prueba como en ejecución.
+
+        Args:
+            index (int): Índice de la prueba.
+        """
+        self.view.load_file_tab.update_status(index, "Running")
+
+    def on_progress_changed(self, index, percent):
+        """
+        Muestra el avance del recorrido de la muestra.
+
+        Args:
+            index (int): Índice de la prueba, o TestWorker.PREPARE_INDEX si se está preparando la muestra.
+            percent (int): Porcentaje recorrido, o -1 si no se conoce.
+        """
+        if index == TestWorker.PREPARE_INDEX:
+            self.view.load_file_tab.set_progress("Preparing sample", percent)
+        else:
+            self.view.load_file_tab.set_progress("Running", percent)
+            if percent >= 0:
+                self.view.load_file_tab.update_status(index, f"Running {percent}%")
+
+    def on_test_finished(self, index, test_passed):
+        """
+        Presenta el resultado de una prueba en la tabla de estado y en su pestaña.
+
+        Args:
+            index (int): Índice de la prueba.
+            test_passed (bool): Resultado de la prueba, o None si hubo un error.
+        """
+        status = "Passed" if test_passed else "Failed"
+        self.view.load_file_tab.update_status(index, status)
+        self.view.load_file_tab.set_p_value(index, self.get_p_value(index) if test_passed is not None else None)
+        self.view.display_result(index, status)
+        self.result_presenters[index]()
+
+    def get_p_value(self, index):
+        """
+        Obtiene el valor p de una prueba ya ejecutada.
+
+        Args:
+            index (int): Índice de la prueba.
+
+        Returns:
+            float: Valor p, o None si no se puede calcular.
+        """
+        try:
+            return self.model.p_value(self.model.TEST_NAMES[index])
+        except Exception as e:
+            print(f"Error al calcular el valor p: {e}")
+            return None
+
+    def change_alpha(self, alpha):
+        """
+        Vuelve a evaluar con un nuevo nivel de significancia las pruebas ya ejecutadas, sin recorrer la muestra.
+
+        Args:
+            alpha (float): Nivel de significancia elegido.
+        """
+        if self.worker is not None:
+            return
+        try:
+            verdicts = self.model.set_alpha(alpha)
+        except Exception as e:
+            print(f"Error al cambiar el nivel de significancia: {e}")
+            return
+        self.ks_exact_passed = verdicts.get('ks_exact')
+        for index, test_name in enumerate(self.model.TEST_NAMES):
+            if test_name in verdicts:
+                self.on_test_finished(index, verdicts[test_name])
+        self.ks_exact_passed = None
+
+    def on_cancelled(self):
+        """
+        Marca como canceladas las pruebas que no llegaron a terminar.
+        """
+        for index in range(len(self.test_functions)):
+            status = self.view.load_file_tab.get_status(index)
+            if status == "Queued" or status.startswith("Running"):
+                self.view.load_file_tab.update_status(index, "Cancelled")
+
+    def on_failed(self, message):
+        """
+        Informa un error al preparar la muestra.
+
+        Args:
+            message (str): Mensaje del error.
+        """
+        print(f"Error al preparar la muestra: {message}")
+
+    def on_worker_finished(self):
+        """
+        Libera el trabajador y vuelve a habilitar los botones de la interfaz.
+        """
+        self.worker.deleteLater()
+        self.worker = None
+        self.ks_exact_passed = None
+        self.view.set_tests_running(False)
+        self.view.diagnostics_tab.set_phases(self.instrumentation.summary())
+
+    def export_trace(self, file_path):
+        """
+        Guarda las fases registradas como traza de Chrome, que también abren Perfetto y speedscope.
+
+        Args:
+            file_path (str): Ruta del archivo JSON.
+        """
+        try:
+            self.instrumentation.export_chrome_trace(file_path)
+        except Exception as e:
+            print(f"Error al exportar la traza: {e}")
+
+    def clear_diagnostics(self):
+        """
+        Descarta las fases registradas y vacía la pestaña de diagnóstico.
+        """
+        self.instrumentation.clear()
+        self.view.diagnostics_tab.set_phases([])
 
     def presenter_mean_test(self):
         """
-        Ejecuta y presenta los resultados de la prueba de media.
+        Ejecuta la prueba de media en segundo plano.
+        """
+        self.start_worker([0])
+
+    def presenter_variance_test(self):
+        """
+        Ejecuta la prueba de varianza en segundo plano.
+        """
+        self.start_worker([1])
+
+    def presenter_ks_test(self):
+        """
+        Ejecuta la prueba de Kolmogorov-Smirnov en segundo plano.
+        """
+        self.start_worker([2])
+
+    def presenter_chi_test(self):
+        """
+        Ejecuta la prueba de Chi-cuadrado en segundo plano.
+        """
+        self.start_worker([3])
+
+    def presenter_poker_test(self):
+        """
+        Ejecuta la prueba de Poker en segundo plano.
+        """
+        self.start_worker([4])
+
+    def presenter_serial_test(self):
+        """
+        Ejecuta la prueba serial en segundo plano.
+        """
+        self.start_worker([5])
+
+    def presenter_runs_up_down_test(self):
+        """
+        Ejecuta la prueba de corridas arriba y abajo en segundo plano.
+        """
+        self.start_worker([6])
+
+    def presenter_runs_above_below_test(self):
+        """
+        Ejecuta la prueba de corridas arriba y abajo de la media en segundo plano.
+        """
+        self.start_worker([7])
+
+    def presenter_autocorrelation_test(self):
+        """
+        Ejecuta la prueba de autocorrelación en segundo plano.
+        """
+        self.start_worker([8])
+
+    def presenter_gap_test(self):
+        """
+        Ejecuta la prueba de huecos en segundo plano.
+        """
+        self.start_worker([9])
+
+    def presenter_coupon_test(self):
+        """
+        Ejecuta la prueba del coleccionista de cupones en segundo plano.
+        """
+        self.start_worker([10])
+
+    def show_mean_results(self):
+        """
+        Presenta los resultados de la prueba de media.
         """
         try:
-            test_passed = self.model.execute_mean_test()
-            status = "Passed" if test_passed else "Failed"
-            self.view.display_result(0, status)
-            data = [str(Constants.ALPHA), str(self.model.mean_test.r), str(self.model.mean_test.half_alpha),
+            data = [str(self.model.mean_test.alpha), str(self.model.mean_test.r), str(self.model.mean_test.half_alpha),
                     str(self.model.mean_test.zeta), str(self.model.mean_test.lower_limit),
                     str(self.model.mean_test.higher_limit)]
-            self.view.mean_tab.set_test_results(data)
+            self.view.set_test_results(0, data)
         except Exception as e:
-            print(f"Error al ejecutar la prueba de media: {e}")
+            print(f"Error al mostrar la prueba de media: {e}")
 
-    def presenter_variance_test(self):
+    def show_variance_results(self):
         """
-        Ejecuta y presenta los resultados de la prueba de varianza.
+        Presenta los resultados de la prueba de varianza.
         """
         try:
-            test_passed = self.model.execute_variance_test()
-            status = "Passed" if test_passed else "Failed"
-            self.view.display_result(1, status)
             data = [str(self.model.variance_test.mean), str(self.model.variance_test.variance),
                     str(self.model.variance_test.one_half_alpha), str(self.model.variance_test.half_alpha),
                     str(self.model.variance_test.complete_chi_invert), str(self.model.variance_test.half_chi_invert),
                     str(self.model.variance_test.lower_limit), str(self.model.variance_test.upper_limit)]
-            self.view.variance_tab.set_test_results(data)
+            self.view.set_test_results(1, data)
         except Exception as e:
-            print(f"Error al ejecutar la prueba de varianza: {e}")
+            print(f"Error al mostrar la prueba de varianza: {e}")
 
-    def presenter_ks_test(self):
+    def show_ks_results(self):
         """
-        Ejecuta y presenta los resultados de la prueba de Kolmogorov-Smirnov.
+        Presenta los resultados de la prueba de Kolmogorov-Smirnov.
         """
         try:
-            test_passed = self.model.execute_ks_test()
-            status = "Passed" if test_passed else "Failed"
-            self.view.display_result(2, status)
-            data = [str(self.model.ks_test.max_difference), str(Constants.DMAXP)]
-            self.view.ks_tab.set_test_results(data)
+            data = [str(self.model.ks_test.max_difference), str(self.model.ks_test.critical_difference),
+                    str(self.model.ks_test.d_statistic),
+                    str(self.model.ks_test.critical_value), str(self.model.ks_test.p_value),
+                    "Passed" if self.ks_exact_passed else "Failed"]
+            self.view.set_test_results(2, data)
         except Exception as e:
-            print(f"Error al ejecutar la prueba de ks: {e}")
+            print(f"Error al mostrar la prueba de ks: {e}")
 
-    def presenter_chi_test(self):
+    def show_chi_results(self):
         """
-        Ejecuta y presenta los resultados de la prueba de Chi-cuadrado.
+        Presenta los resultados de la prueba de Chi-cuadrado.
         """
         try:
-            test_passed = self.model.execute_chi_test()
-            status = "Passed" if test_passed else "Failed"
-            self.view.display_result(3, status)
             data = [str(self.model.chi_test.total_error), str(self.model.chi_test.chi_invert)]
-            self.view.chi_tab.set_test_results(data)
+            self.view.set_test_results(3, data)
         except Exception as e:
-            print(f"Error al ejecutar la prueba de chi: {e}")
+            print(f"Error al mostrar la prueba de chi: {e}")
 
-    def presenter_poker_test(self):
+    def show_poker_results(self):
         """
-        Ejecuta y presenta los resultados de la prueba de Poker.
+        Presenta los resultados de la prueba de Poker.
         """
-        test_passed = self.model.execute_poker_test()
-        status = "Passed" if test_passed else "Failed"
-        self.view.display_result(4, status)
         data = list(self.model.poker_test.category_counts.values())
         data.append(self.model.poker_test.chi_squared)
         data.append(self.model.poker_test.x_square)
-        self.view.poker_tab.set_test_results(data)
+        self.view.set_test_results(4, data)
+
+    def show_serial_results(self):
+        """
+        Presenta los resultados de la prueba serial.
+        """
+        try:
+            data = [str(self.model.serial_test.tuples), str(self.model.serial_test.occupied_cells),
+                    str(self.model.serial_test.degrees_of_freedom), str(self.model.serial_test.chi_squared),
+                    str(self.model.serial_test.chi_invert)]
+            self.view.set_test_results(5, data)
+        except Exception as e:
+            print(f"Error al mostrar la prueba serial: {e}")
+
+    def show_runs_up_down_results(self):
+        """
+        Presenta los resultados de la prueba de corridas arriba y abajo.
+        """
+        try:
+            test = self.model.runs_up_down_test
+            data = [str(test.n), str(test.runs), str(test.expected_runs), str(test.variance), str(test.z),
+                    str(test.zeta)]
+            self.view.set_test_results(6, data)
+        except Exception as e:
+            print(f"Error al mostrar la prueba de corridas arriba y abajo: {e}")
+
+    def show_runs_above_below_results(self):
+        """
+        Presenta los resultados de la prueba de corridas arriba y abajo de la media.
+        """
+        try:
+            test = self.model.runs_above_below_test
+            data = [str(test.below), str(test.above), str(test.runs), str(test.expected_runs), str(test.variance),
+                    str(test.z), str(test.zeta)]
+            self.view.set_test_results(7, data)
+        except Exception as e:
+            print(f"Error al mostrar la prueba de corridas arriba y abajo de la media: {e}")
+
+    def show_autocorrelation_results(self):
+        """
+        Presenta los resultados de la prueba de autocorrelación.
+        """
+        try:
+            test = self.model.autocorrelation_test
+            data = [str(test.max_lag), str(float(abs(test.correlations).max())), str(test.chi_squared),
+                    str(test.chi_invert)]
+            self.view.set_test_results(8, data)
+        except Exception as e:
+            print(f"Error al mostrar la prueba de autocorrelación: {e}")
+
+    def show_gap_results(self):
+        """
+        Presenta los resultados de la prueba de huecos.
+        """
+        try:
+            test = self.model.gap_test
+            data = [f"[{test.lower}, {test.upper})", str(test.gaps), str(test.max_gap), str(test.chi_squared),
+                    str(test.chi_invert)]
+            self.view.set_test_results(9, data)
+        except Exception as e:
+            print(f"Error al mostrar la prueba de huecos: {e}")
+
+    def show_coupon_results(self):
+        """
+        Presenta los resultados de la prueba del coleccionista de cupones.
+        """
+        try:
+            test = self.model.coupon_test
+            data = [str(test.coupons), str(test.segments), str(test.max_length), str(test.chi_squared),
+                    str(test.chi_invert)]
+            self.view.set_test_results(10, data)
+        except Exception as e:
+            print(f"Error al mostrar la prueba del coleccionista de cupones: {e}")
 
     def run_all_test(self):
         """
-        Ejecuta todas las pruebas estadísticas y presenta sus resultados.
+        Ejecuta todas las pruebas estadísticas en segundo plano y presenta sus resultados.
         """
-        test_functions = [self.model.execute_mean_test, self.model.execute_variance_test, self.model.execute_ks_test,
-                          self.model.execute_chi_test, self.model.execute_poker_test]
-        self.view.run_all_tests(test_functions)
+        self.start_worker(range(len(self.test_functions)))
 
     def connect_signals(self):
         """
         Conecta las señales entre la vista y el presentador.
         """
-        self.view.mean_tab.run_tests_button.clicked.connect(self.presenter_mean_test)
-        self.view.variance_tab.run_tests_button.clicked.connect(self.presenter_variance_test)
-        self.view.ks_tab.run_tests_button.clicked.connect(self.presenter_ks_test)
-        self.view.chi_tab.run_tests_button.clicked.connect(self.presenter_chi_test)
-        self.view.poker_tab.run_tests_button.clicked.connect(self.presenter_poker_test)
+        self.view.tab_created.connect(self.connect_tab_signals)
         self.view.load_file_tab.load_file_signal.connect(self.set_data_to_model)
         self.view.load_file_tab.run_all_tests_button.clicked.connect(self.run_all_test)
+        self.view.load_file_tab.cancel_tests_button.clicked.connect(self.cancel_tests)
+        self.view.load_file_tab.alpha_changed_signal.connect(self.change_alpha)
+        self.view.diagnostics_tab.export_trace_signal.connect(self.export_trace)
+        self.view.diagnostics_tab.clear_signal.connect(self.clear_diagnostics)
+
+    def connect_tab_signals(self, tab_num, tab):
+        """
+        Conecta el botón de una pestaña de prueba cuando la vista la construye.
+
+        Args:
+            tab_num (int): Número de la prueba.
+            tab (BaseTestTab): Pestaña construida.
+        """
+        run_functions = [self.presenter_mean_test, self.presenter_variance_test, self.presenter_ks_test,
+                         self.presenter_chi_test, self.presenter_poker_test, self.presenter_serial_test,
+                         self.presenter_runs_up_down_test, self.presenter_runs_above_below_test,
+                         self.presenter_autocorrelation_test, self.presenter_gap_test, self.presenter_coupon_test]
+        tab.run_tests_button.clicked.connect(run_functions[tab_num])
 
     def run(self):
         """
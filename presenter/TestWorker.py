@@ -0,0 +1,130 @@
+import os
+import tempfile
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from model.util.Instrumentation import Instrumentation
+
+
+class TestCancelled(BaseException):
+    """
+    Excepción con la que TestWorker interrumpe un recorrido de la muestra cuando se cancela la ejecución.
+
+    Hereda de BaseException para que los bloques except Exception de las pruebas no la confundan con un error.
+    """
+
+
+class TestWorker(QThread):
+    """
+    Hilo que prepara la muestra y ejecuta pruebas sin bloquear el bucle de eventos de Qt.
+
+    Los resultados y el avance se comunican con señales, que Qt entrega en el hilo de la interfaz. La cancelación se
+    revisa entre pruebas y después de cada bloque de la muestra.
+
+    Atributos:
+        test_started (pyqtSignal): Señal emitida con el índice de la prueba que empieza.
+        progress_changed (pyqtSignal): Señal emitida con el índice de la prueba (PREPARE_INDEX al preparar la
+            muestra) y el porcentaje recorrido, o -1 si el tamaño de la muestra todavía no se conoce.
+        test_finished (pyqtSignal): Señal emitida con el índice de la prueba y su resultado.
+        cancelled (pyqtSignal): Señal emitida si la ejecución se cancela.
+        failed (pyqtSignal): Señal emitida con el mensaje de error si la muestra no puede prepararse.
+        profiled (pyqtSignal): Señal emitida con el informe de Instrumentation.profile si se pidió perfilar.
+    """
+    PREPARE_INDEX = -1
+
+    test_started = pyqtSignal(int)
+    progress_changed = pyqtSignal(int, int)
+    test_finished = pyqtSignal(int, object)
+    cancelled = pyqtSignal()
+    failed = pyqtSignal(str)
+    profiled = pyqtSignal(object)
+
+    def __init__(self, model, tests, data=None, profile=False, parent=None):
+        """
+        Inicializa una instancia de TestWorker.
+
+        Args:
+            model (Tests): Modelo con las pruebas.
+            tests (list): Pares (índice, función) con las pruebas a ejecutar, en orden.
+            data (numpy.ndarray, opcional): Muestra que se establece en el modelo antes de ejecutar las pruebas.
+            profile (bool): True para ejecutar bajo cProfile y tracemalloc y emitir el informe con profiled.
+            parent (QObject, opcional): Objeto padre.
+        """
+        super().__init__(parent)
+        self.model = model
+        self.tests = tests
+        self.data = data
+        self.profile = profile
+        self.current_index = self.PREPARE_INDEX
+        self.last_percent = None
+
+    def run(self):
+        """
+        Prepara la muestra, si se recibió una, y ejecuta las pruebas en el hilo del trabajador.
+        """
+        self.model.set_progress(self.report_progress)
+        try:
+            if self.profile:
+                profile_path = os.path.join(tempfile.gettempdir(), f'pseudo_number_tests_{os.getpid()}.prof')
+                _, report = Instrumentation.profile(self.run_tests, profile_path)
+                self.profiled.emit(report)
+            else:
+                self.run_tests()
+        except TestCancelled:
+            self.cancelled.emit()
+        except Exception as e:
+            self.failed.emit(str(e))
+        finally:
+            self.model.set_progress(None)
+
+    def run_tests(self):
+        """
+        Prepara la muestra y ejecuta las pruebas.
+
+        Raises:
+            TestCancelled: Si se pidió cancelar la ejecución.
+        """
+        if self.data is not None:
+            self.model.set_pseudo_random_numbers(self.data)
+        for index, test_function in self.tests:
+            self.check_cancelled()
+            self.current_index = index
+            self.last_percent = None
+            self.test_started.emit(index)
+            result = test_function()
+            self.check_cancelled()
+            self.test_finished.emit(index, result)
+
+    def cancel(self):
+        """
+        Pide que la ejecución se detenga en el próximo bloque o entre dos pruebas.
+        """
+        self.requestInterruption()
+
+    def check_cancelled(self):
+        """
+        Interrumpe la ejecución si se pidió cancelarla.
+
+        Raises:
+            TestCancelled: Si se pidió cancelar la ejecución.
+        """
+        if self.isInterruptionRequested():
+            raise TestCancelled()
+
+    def report_progress(self, processed, total):
+        """
+        Informa el avance del recorrido actual; el modelo la llama después de cada bloque.
+
+        Args:
+            processed (int): Números recorridos.
+            total (int): Números de la muestra, o None si todavía no se conoce.
+
+        Raises:
+            TestCancelled: Si se pidió cancelar la ejecución.
+        """
+        self.check_cancelled()
+        percent = int(processed * 100 / total) if total else -1
+        # Solo se emite cuando cambia el porcentaje para no saturar la cola de eventos
+        if percent != self.last_percent:
+            self.last_percent = percent
+            self.progress_changed.emit(self.current_index, percent)
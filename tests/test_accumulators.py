@@ -0,0 +1,264 @@
+import copy
+import pickle
+
+import numpy as np
+import pytest
+
+from model.AutocorrelationTest import AutocorrelationTest
+from model.ChiTest import ChiTest
+from model.CouponTest import CouponTest
+from model.GapTest import GapTest
+from model.KsTest import KsTest
+from model.MeanTest import MeanTest
+from model.PokerTest import PokerTest
+from model.RunsAboveBelowTest import RunsAboveBelowTest
+from model.RunsUpDownTest import RunsUpDownTest
+from model.SerialTest import SerialTest
+from model.Tests import Tests
+from model.VarianceTest import VarianceTest
+from model.accumulators.AutocorrelationAccumulator import AutocorrelationAccumulator
+from model.accumulators.CouponAccumulator import CouponAccumulator
+from model.accumulators.GapAccumulator import GapAccumulator
+from model.accumulators.HistogramAccumulator import HistogramAccumulator
+from model.accumulators.MomentsAccumulator import MomentsAccumulator
+from model.accumulators.RunsAccumulator import RunsAccumulator
+from model.accumulators.SerialAccumulator import SerialAccumulator
+from model.util.SampleFingerprint import SampleFingerprint
+
+# Fábricas de acumuladores vacíos, con las configuraciones que usan las pruebas y algunas menos comunes
+ACCUMULATORS = {
+    'moments': MomentsAccumulator,
+    'histogram_uniform': lambda: HistogramAccumulator.uniform(10),
+    'histogram_linear': lambda: HistogramAccumulator.linear(0.05, 0.09, 10),
+    'histogram_edges': lambda: HistogramAccumulator.by_edges([0.1, 0.25, 0.5, 0.9, 1.0]),
+    'poker': lambda: PokerTest().create_hand_counter(),
+    'poker_three_digits': lambda: PokerTest().create_hand_counter(3),
+    'serial': lambda: SerialAccumulator(10, 2),
+    'serial_three': lambda: SerialAccumulator(10, 3),
+    'serial_overlapping': lambda: SerialAccumulator(10, 3, overlapping=True),
+    'serial_sparse': lambda: SerialAccumulator(64, 4, overlapping=True),
+    'runs': RunsAccumulator,
+    'autocorrelation': lambda: AutocorrelationAccumulator(10),
+    'gap': lambda: GapAccumulator(0.0, 0.5, 10),
+    'gap_narrow': lambda: GapAccumulator(0.3, 0.35, 6),
+    'coupon': lambda: CouponAccumulator(5, 20),
+}
+# Números de cada bloque al dividir la muestra; incluye bloques vacíos y de un número
+CHUNK_SIZES = (1, 2, 3, 7, 0, 1000, 4096)
+SIZE = 20000
+# Atributos que resta subtract; el resto describe la frontera con los números vecinos, que no se recupera
+COUNTERS = ('count', 'total', 'sum_of_squares', 'counts', 'total_hands', 'signs', 'sign_changes', 'above',
+            'side_changes', 'sums', 'pairs')
+
+
+@pytest.fixture(scope='module')
+def numbers():
+    return np.random.default_rng(3).random(SIZE)
+
+
+def feed(accumulator, numbers, chunk_size=None):
+    """Alimenta un acumulador con numbers, en un solo bloque o en bloques de tamaños que se repiten."""
+    if chunk_size is None:
+        accumulator.update(numbers)
+        return accumulator
+    position = 0
+    sizes = CHUNK_SIZES[CHUNK_SIZES.index(chunk_size):] + CHUNK_SIZES
+    while position < len(numbers):
+        for size in sizes:
+            accumulator.update(numbers[position:position + size])
+            position += size
+    return accumulator
+
+
+def state(value, path=()):
+    """
+    Aplana el estado de un acumulador en un diccionario de arreglos y valores simples indexados por su ruta de
+    atributos y claves.
+    """
+    if isinstance(value, type):
+        return {path: value.__name__}
+    if isinstance(value, list):
+        value = np.asarray(value)
+    if isinstance(value, np.ndarray):
+        return {path: value}
+    if isinstance(value, tuple):
+        value = dict(enumerate(value))
+    elif hasattr(value, '__dict__'):
+        value = vars(value)
+    if not isinstance(value, dict):
+        return {path: value}
+    flat = {}
+    for key, item in value.items():
+        flat.update(state(item, path + (key,)))
+    return flat
+
+
+def assert_same_state(actual, expected, approximate=False, attributes=None):
+    """
+    Compara el estado de dos acumuladores, o solo el de sus atributos en attributes; con approximate, los números
+    pueden diferir por el redondeo.
+    """
+    actual, expected = state(actual), state(expected)
+    if attributes is not None:
+        actual = {path: value for path, value in actual.items() if path[:1] and path[0] in attributes}
+        expected = {path: value for path, value in expected.items() if path[:1] and path[0] in attributes}
+        assert actual
+    assert actual.keys() == expected.keys()
+    for path, value in actual.items():
+        if isinstance(value, np.ndarray) or isinstance(expected[path], np.ndarray):
+            if approximate:
+                np.testing.assert_allclose(value, expected[path], rtol=1e-9, atol=1e-9, err_msg=str(path))
+            else:
+                np.testing.assert_array_equal(value, expected[path], err_msg=str(path))
+        elif approximate:
+            assert value == pytest.approx(expected[path], rel=1e-9, abs=1e-9, nan_ok=True), path
+        else:
+            assert value == expected[path] or value != value and expected[path] != expected[path], path
+
+
+def split_parts(factory, numbers, bounds, primed):
+    """
+    Resume cada parte de numbers entre dos límites consecutivos en un acumulador aparte.
+
+    Con primed, cada parte toma lo que necesita de la anterior con prime, como en ParallelRunner; si no, con
+    continue_from, como en SlidingWindow. Los acumuladores que no tienen esos métodos empiezan vacíos.
+    """
+    parts = []
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        part = factory()
+        if primed and hasattr(part, 'prime'):
+            part.prime(numbers, start)
+        elif not primed and parts and hasattr(part, 'continue_from'):
+            part.continue_from(parts[-1])
+        parts.append(feed(part, numbers[start:stop]))
+    return parts
+
+
+def merge_all(parts):
+    merged = copy.deepcopy(parts[0])
+    for part in parts[1:]:
+        merged.merge(copy.deepcopy(part))
+    return merged
+
+
+@pytest.mark.parametrize('name', sorted(ACCUMULATORS))
+@pytest.mark.parametrize('chunk_size', CHUNK_SIZES)
+def test_chunked_update_matches_a_single_update(numbers, name, chunk_size):
+    factory = ACCUMULATORS[name]
+    single = feed(factory(), numbers)
+    chunked = feed(factory(), numbers, chunk_size)
+    assert_same_state(chunked, single, approximate=name == 'moments' or name == 'autocorrelation')
+
+
+@pytest.mark.parametrize('name', sorted(ACCUMULATORS))
+@pytest.mark.parametrize('bounds', [(0, 1, SIZE), (0, 5000, 5001, 12345, SIZE), (0, 3, 6, 9, 10, SIZE)])
+@pytest.mark.parametrize('primed', [True, False], ids=['prime', 'continue_from'])
+def test_merged_parts_match_the_whole_sample(numbers, name, bounds, primed):
+    factory = ACCUMULATORS[name]
+    if primed and name == 'coupon':
+        pytest.skip('Los segmentos de cupones dependen de toda la parte anterior; ver CouponAccumulator.SEQUENTIAL')
+    merged = merge_all(split_parts(factory, numbers, bounds, primed))
+    whole = feed(factory(), numbers)
+    assert_same_state(merged, whole, approximate=name == 'moments' or name == 'autocorrelation')
+
+
+@pytest.mark.parametrize('name', sorted(ACCUMULATORS))
+def test_subtracting_the_oldest_parts_leaves_the_newest(numbers, name):
+    factory = ACCUMULATORS[name]
+    parts = split_parts(factory, numbers, (0, 4000, 4001, 9000, 15000, SIZE), primed=False)
+    window = factory()
+    for part in parts:
+        window.merge(copy.deepcopy(part))
+    window.subtract(parts[0])
+    window.subtract(parts[1])
+    assert_same_state(window, merge_all(parts[2:]), approximate=True, attributes=COUNTERS)
+
+
+@pytest.mark.parametrize('name', sorted(ACCUMULATORS))
+def test_merge_then_subtract_restores_the_state(numbers, name):
+    factory = ACCUMULATORS[name]
+    first, second = split_parts(factory, numbers, (0, 7000, SIZE), primed=False)
+    restored = copy.deepcopy(first)
+    restored.merge(copy.deepcopy(second))
+    restored.subtract(second)
+    assert_same_state(restored, first, approximate=True, attributes=COUNTERS)
+
+
+@pytest.mark.parametrize('chunk_size', CHUNK_SIZES)
+def test_fingerprint_does_not_depend_on_the_blocks(numbers, chunk_size):
+    numbers = np.concatenate((numbers, numbers, numbers))
+    single = feed(SampleFingerprint(), numbers).hexdigest
+    assert feed(SampleFingerprint(), numbers, chunk_size).hexdigest == single
+    assert feed(SampleFingerprint(), numbers[:-1]).hexdigest != single
+
+
+@pytest.mark.parametrize('bounds', [(0, 1, 3 * SIZE), (0, SampleFingerprint.SEGMENT_SIZE, 3 * SIZE),
+                                    (0, 5000, 5001, 40000, 3 * SIZE)])
+def test_fingerprint_parts_merge_to_the_whole_sample(numbers, bounds):
+    numbers = np.concatenate((numbers, numbers, numbers))
+    merged = merge_all(split_parts(SampleFingerprint, numbers, bounds, primed=True))
+    assert merged.hexdigest == feed(SampleFingerprint(), numbers).hexdigest
+
+
+def test_fingerprint_rejects_parts_out_of_order(numbers):
+    first, second, third = split_parts(SampleFingerprint, numbers, (0, 100, 200, 300), primed=True)
+    with pytest.raises(ValueError):
+        first.merge(third)
+
+
+TEST_FACTORIES = {
+    'mean': MeanTest,
+    'variance': VarianceTest,
+    'ks': lambda: KsTest(10),
+    'chi': lambda: ChiTest(10, ChiTest.FIXED_DOMAIN),
+    'poker': PokerTest,
+    'serial': SerialTest,
+    'runs_up_down': RunsUpDownTest,
+    'runs_above_below': RunsAboveBelowTest,
+    'autocorrelation': AutocorrelationTest,
+    'gap': GapTest,
+    'coupon': CouponTest,
+}
+
+
+@pytest.mark.parametrize('name', sorted(TEST_FACTORIES))
+def test_test_accumulator_matches_the_test_on_the_whole_sample(numbers, name):
+    test = TEST_FACTORIES[name]()
+    if name == 'chi':
+        accumulator, other = test.create_accumulator(0.0, 1.0), test.create_accumulator(0.0, 1.0)
+    else:
+        accumulator, other = test.create_accumulator(), test.create_accumulator()
+    feed(accumulator, numbers[:8000])
+    for part_name, part in other.parts.items():
+        if hasattr(part, 'continue_from'):
+            part.continue_from(accumulator.parts[part_name])
+    accumulator.merge(pickle.loads(pickle.dumps(feed(other, numbers[8000:], 1000))))
+    passed = accumulator.finalize()
+
+    expected = TEST_FACTORIES[name]()
+    expected.set_pseudo_random_numbers(numbers)
+    execute_name = accumulator.execute_name
+    assert getattr(expected, execute_name)() == passed
+    for attribute in ('r', 'variance', 'max_difference', 'total_error', 'chi_squared', 'z'):
+        if hasattr(expected, attribute):
+            assert getattr(accumulator.test, attribute) == pytest.approx(getattr(expected, attribute))
+
+
+def test_finalize_leaves_the_owning_battery_unchanged(numbers):
+    tests = Tests()
+    tests.set_pseudo_random_numbers(numbers)
+    expected = {test_name: (getattr(tests, f'execute_{test_name}_test')(), tests.describe_test(test_name))
+                for test_name in Tests.TEST_NAMES}
+    part = numbers[:100]
+    accumulators = tests.create_accumulators(float(part.min()), float(part.max()))
+    fresh = Tests()
+    fresh.set_pseudo_random_numbers(part)
+    for test_name, accumulator in accumulators.items():
+        accumulator.update(part)
+        assert accumulator.finalize() == getattr(fresh, f'execute_{test_name}_test')()
+        assert accumulator.test is not getattr(tests, Tests.TEST_METHODS[test_name][0])
+
+    tests.clear_statistics()
+    for test_name, (passed, description) in expected.items():
+        assert getattr(tests, f'execute_{test_name}_test')() == passed
+        assert tests.describe_test(test_name) == pytest.approx(description)
@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from benchmarks.baseline import baseline_chi, baseline_ks, baseline_mean, baseline_poker, baseline_variance
+from model.Tests import Tests
+
+
+def poker_numbers(rng, size, symbols):
+    """
+    Genera números con 5 decimales tomados de los primeros symbols dígitos, seguidos de un resto que no cambia su
+    texto, así que la versión original lee las mismas manos. Descarta los menores que 10 ** -4, que se escriben en
+    notación científica.
+    """
+    hands = rng.integers(0, symbols, (size, 5)) @ 10 ** np.arange(4, -1, -1)
+    numbers = (hands + rng.uniform(0.1, 0.9, size)) / 10 ** 5
+    return numbers[numbers >= 1e-4]
+
+
+SAMPLES = {
+    'uniform': lambda rng: rng.random(5000),
+    'small': lambda rng: rng.random(37),
+    'squared': lambda rng: rng.random(5000) ** 2,
+    'shifted': lambda rng: 0.2 + 0.6 * rng.random(3000),
+    'edges': lambda rng: np.concatenate(([0.0, 0.5, 0.1, 0.9], rng.random(996))),
+}
+
+
+@pytest.fixture(params=sorted(SAMPLES))
+def numbers(request):
+    return SAMPLES[request.param](np.random.default_rng(7))
+
+
+def run_tests(numbers):
+    tests = Tests()
+    tests.set_pseudo_random_numbers(numbers)
+    return tests
+
+
+def test_mean_matches_baseline(numbers):
+    tests = run_tests(numbers)
+    passed, r, lower_limit, higher_limit = baseline_mean(numbers.tolist())
+    assert tests.execute_mean_test() == passed
+    assert tests.describe_test('mean') == pytest.approx((r, lower_limit, higher_limit), rel=1e-12)
+
+
+def test_variance_matches_baseline(numbers):
+    tests = run_tests(numbers)
+    passed, variance, upper_limit, lower_limit = baseline_variance(numbers)
+    assert tests.execute_variance_test() == passed
+    assert tests.describe_test('variance') == pytest.approx((variance, upper_limit, lower_limit), abs=1e-5)
+
+
+def test_ks_matches_baseline(numbers):
+    tests = run_tests(numbers)
+    passed, frequencies, max_difference = baseline_ks(numbers.tolist())
+    assert tests.execute_ks_test() == passed
+    assert list(tests.ks_test.frequencies) == frequencies
+    assert tests.ks_test.max_difference == pytest.approx(max_difference)
+
+
+def test_chi_matches_baseline(numbers):
+    tests = run_tests(numbers)
+    passed, frequencies, total_error = baseline_chi(numbers.tolist())
+    assert tests.execute_chi_test() == passed
+    assert list(tests.chi_test.frequencies) == frequencies
+    assert tests.chi_test.total_error == pytest.approx(total_error)
+
+
+@pytest.mark.parametrize('size, symbols', [(5000, 10), (20000, 10), (300, 10), (5000, 8)])
+def test_poker_matches_baseline(size, symbols):
+    numbers = poker_numbers(np.random.default_rng(size + symbols), size, symbols)
+    tests = run_tests(numbers)
+    passed, category_counts, chi_squared = baseline_poker(numbers.tolist())
+    assert tests.execute_poker_test() == passed
+    assert tests.poker_test.category_counts == category_counts
+    assert tests.poker_test.chi_squared == pytest.approx(chi_squared)
@@ -0,0 +1,134 @@
+import csv
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+
+import model.BatchRunner
+from model.BatchRunner import BatchRunner
+
+TEST_NAMES = ['mean', 'variance', 'chi', 'runs_up_down']
+# Columnas que no dependen de cuánto tardó cada archivo
+COMPARED_FIELDS = [field for field in BatchRunner(TEST_NAMES).row_fields() if field != 'seconds']
+
+
+class CountingExecutor(ProcessPoolExecutor):
+    """Grupo de procesos que registra la mayor cantidad de tareas enviadas y sin terminar a la vez."""
+    outstanding = 0
+    most_outstanding = 0
+
+    def submit(self, *args, **kwargs):
+        future = super().submit(*args, **kwargs)
+        CountingExecutor.outstanding += 1
+        CountingExecutor.most_outstanding = max(CountingExecutor.most_outstanding, CountingExecutor.outstanding)
+        future.add_done_callback(CountingExecutor.finish)
+        return future
+
+    @staticmethod
+    def finish(future):
+        CountingExecutor.outstanding -= 1
+
+
+@pytest.fixture(scope='module')
+def files(tmp_path_factory):
+    directory = tmp_path_factory.mktemp('batch')
+    rng = np.random.default_rng(16)
+    paths = []
+    for index in range(7):
+        # Algunas muestras sesgadas, para que haya archivos que fallan
+        numbers = rng.random(3000) ** (1.3 if index % 3 == 0 else 1.0)
+        paths.append(str(directory / f'sample_{index}.npy'))
+        np.save(paths[-1], numbers)
+    paths.append(str(directory / 'missing.npy'))
+    return sorted(paths)
+
+
+@pytest.fixture(scope='module')
+def expected(files, tmp_path_factory):
+    rows_path = str(tmp_path_factory.mktemp('expected') / 'rows.csv')
+    report = BatchRunner(TEST_NAMES, workers=2).run(files, rows_path)
+    return report, by_file(BatchRunner.read_rows(rows_path))
+
+
+def by_file(rows):
+    return {row['file']: [row[field] for field in COMPARED_FIELDS] for row in rows}
+
+
+def without_seconds(report):
+    return {key: value for key, value in report.items() if key != 'seconds'}
+
+
+def interrupt_after(rows):
+    def progress(row, finished, total):
+        if finished == rows:
+            raise KeyboardInterrupt
+    return progress
+
+
+def test_report_counts_every_file(files, expected):
+    report, rows = expected
+    assert rows.keys() == set(files)
+    assert (report['files'], report['errors'], report['numbers']) == (len(files), 1, 3000 * (len(files) - 1))
+    assert report['passed'] + report['failed'] + report['errors'] == len(files)
+    assert report['passed'] and report['failed']
+    for counts in report['tests'].values():
+        assert counts['passed'] + counts['failed'] == len(files) - 1
+        assert counts['pass_rate'] == pytest.approx(counts['passed'] / (len(files) - 1))
+
+
+def test_resume_completes_an_interrupted_run(files, expected, tmp_path):
+    rows_path = str(tmp_path / 'rows.csv')
+    runner = BatchRunner(TEST_NAMES, workers=1)
+    with pytest.raises(KeyboardInterrupt):
+        runner.run(files, rows_path, progress=interrupt_after(3))
+    assert len(BatchRunner.read_rows(rows_path)) == 3
+
+    finished = []
+    report = runner.run(files, rows_path, resume=True, progress=lambda row, *_: finished.append(row['file']))
+    assert len(finished) == len(files) - 3
+    assert without_seconds(report) == without_seconds(expected[0])
+    assert by_file(BatchRunner.read_rows(rows_path)) == expected[1]
+
+
+def test_resume_redoes_a_row_cut_off_while_it_was_written(files, expected, tmp_path):
+    rows_path = str(tmp_path / 'rows.csv')
+    runner = BatchRunner(TEST_NAMES, workers=1)
+    with pytest.raises(KeyboardInterrupt):
+        runner.run(files, rows_path, progress=interrupt_after(4))
+    with open(rows_path, 'r', newline='') as file:
+        content = file.read()
+    last_row = content.rstrip('\r\n').rsplit('\r\n', 1)[1]
+    cut_file = next(csv.reader([last_row]))[0]
+    # La última fila queda a medias, primero en el último estadístico y después en la columna del archivo
+    for end in (len(content) - 5, len(content) - len(last_row) + 8):
+        with open(rows_path, 'w', newline='') as file:
+            file.write(content[:end])
+        assert cut_file not in {row['file'] for row in BatchRunner.read_rows(rows_path)}
+
+        finished = []
+        report = runner.run(files, rows_path, resume=True, progress=lambda row, *_: finished.append(row['file']))
+        assert cut_file in finished
+        assert len(finished) == len(files) - 3
+        assert without_seconds(report) == without_seconds(expected[0])
+        rows = BatchRunner.read_rows(rows_path)
+        assert len(rows) == len(files)
+        assert by_file(rows) == expected[1]
+    assert not os.path.exists(f'{rows_path}.tmp')
+
+
+def test_resume_rejects_rows_written_with_other_tests(files, tmp_path):
+    rows_path = str(tmp_path / 'rows.csv')
+    with pytest.raises(KeyboardInterrupt):
+        BatchRunner(['mean'], workers=1).run(files, rows_path, progress=interrupt_after(1))
+    with pytest.raises(ValueError):
+        BatchRunner(TEST_NAMES, workers=1).run(files, rows_path, resume=True)
+
+
+def test_submitted_files_are_bounded_by_the_workers(files, expected, tmp_path, monkeypatch):
+    monkeypatch.setattr(model.BatchRunner, 'ProcessPoolExecutor', CountingExecutor)
+    CountingExecutor.most_outstanding = 0
+    runner = BatchRunner(TEST_NAMES, workers=1)
+    report = runner.run(files, str(tmp_path / 'rows.csv'))
+    assert CountingExecutor.most_outstanding == runner.workers * BatchRunner.TASKS_PER_WORKER
+    assert without_seconds(report) == without_seconds(expected[0])
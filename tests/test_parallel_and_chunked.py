@@ -0,0 +1,99 @@
+import numpy as np
+import pytest
+
+from model.ParallelRunner import ParallelRunner
+from model.Tests import Tests
+from model.util.DataLoader import DataLoader
+from model.util.NormalizedArray import NormalizedArray
+
+SIZE = 150000
+
+
+def run_all(tests):
+    """Ejecuta todas las pruebas y devuelve el veredicto, el estadístico, los límites y el valor p de cada una."""
+    results = {}
+    for test_name in Tests.TEST_NAMES:
+        passed = getattr(tests, f'execute_{test_name}_test')()
+        results[test_name] = (passed, tests.describe_test(test_name), tests.p_value(test_name))
+    return results
+
+
+def assert_same_results(actual, expected):
+    assert actual.keys() == expected.keys()
+    for test_name, (passed, description, p_value) in expected.items():
+        assert actual[test_name][0] == passed, test_name
+        assert actual[test_name][1] == pytest.approx(description, rel=1e-9, abs=1e-12), test_name
+        assert actual[test_name][2] == pytest.approx(p_value, rel=1e-6, abs=1e-12), test_name
+
+
+def in_memory(numbers):
+    tests = Tests()
+    tests.set_pseudo_random_numbers(np.array(numbers, dtype=np.float64))
+    return tests.fingerprint, run_all(tests)
+
+
+@pytest.fixture(scope='module')
+def numbers():
+    # Un leve sesgo hace que algunas pruebas fallen y los veredictos también se comparen
+    return np.random.default_rng(25).random(SIZE) ** 1.02
+
+
+@pytest.fixture(scope='module')
+def expected(numbers):
+    return in_memory(numbers)
+
+
+@pytest.fixture(scope='module')
+def files(numbers, tmp_path_factory):
+    directory = tmp_path_factory.mktemp('samples')
+    np.save(directory / 'sample.npy', numbers)
+    numbers.astype('<f8').tofile(directory / 'sample.f64')
+    return directory
+
+
+def test_parallel_runner_matches_the_in_memory_result(numbers, expected):
+    tests = Tests()
+    tests.pseudo_random_numbers = numbers
+    tests.use_summary(ParallelRunner(tests, 2, chunk_size=10000).summarize())
+    assert tests.fingerprint == expected[0]
+    assert_same_results(run_all(tests), expected[1])
+
+
+def test_parallel_summary_of_a_mapped_file_matches_the_in_memory_result(files, expected):
+    tests = Tests(workers=3)
+    tests.PARALLEL_THRESHOLD = 1000
+    tests.set_pseudo_random_numbers(DataLoader.load(str(files / 'sample.npy'))[0])
+    assert tests.fingerprint == expected[0]
+    assert_same_results(run_all(tests), expected[1])
+
+
+def test_parallel_summary_of_normalized_integers_matches_the_in_memory_result(tmp_path):
+    raw = np.random.default_rng(31).integers(0, 1 << 32, SIZE, dtype=np.uint64).astype('<u4')
+    raw.tofile(tmp_path / 'sample.u32')
+    sample, _ = DataLoader.load(str(tmp_path / 'sample.u32'))
+    assert isinstance(sample, NormalizedArray)
+    fingerprint, results = in_memory(sample[0:len(sample)])
+
+    tests = Tests(workers=2)
+    tests.PARALLEL_THRESHOLD = 1000
+    tests.set_pseudo_random_numbers(sample)
+    assert tests.fingerprint == fingerprint
+    assert_same_results(run_all(tests), results)
+
+
+@pytest.mark.parametrize('file_name', ['sample.npy', 'sample.f64'])
+@pytest.mark.parametrize('chunk_size', [4096, 100000, 1 << 20])
+def test_chunked_file_matches_the_in_memory_result(files, expected, file_name, chunk_size):
+    tests = Tests()
+    tests.set_chunked_file(str(files / file_name), chunk_size)
+    assert tests.fingerprint == expected[0]
+    assert_same_results(run_all(tests), expected[1])
+
+
+def test_mapped_file_reuses_the_statistics_of_the_same_chunked_file(files, expected):
+    tests = Tests()
+    tests.set_chunked_file(str(files / 'sample.f64'), 4096)
+    run_all(tests)
+    tests.set_pseudo_random_numbers(DataLoader.load(str(files / 'sample.npy'))[0])
+    assert all(tests.is_computed(test_name) for test_name in Tests.TEST_NAMES)
+    assert_same_results(run_all(tests), expected[1])
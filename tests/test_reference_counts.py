@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+from benchmarks.baseline import (reference_autocorrelation, reference_coupon, reference_gap,
+                                 reference_runs_above_below, reference_runs_up_down, reference_serial)
+from model.AutocorrelationTest import AutocorrelationTest
+from model.CouponTest import CouponTest
+from model.GapTest import GapTest
+from model.RunsAboveBelowTest import RunsAboveBelowTest
+from model.RunsUpDownTest import RunsUpDownTest
+from model.SerialTest import SerialTest
+
+SIZE = 3000
+
+
+@pytest.fixture(scope='module', params=[0, 1, 2])
+def numbers(request):
+    """Muestras uniformes con números en los límites de los intervalos y, en una de ellas, repetidos."""
+    rng = np.random.default_rng(request.param)
+    values = rng.random(SIZE)
+    positions = rng.choice(SIZE, SIZE // 10, replace=False)
+    values[positions] = rng.integers(0, 20, len(positions)) / 20
+    if request.param == 2:
+        values = np.repeat(values[:SIZE // 3], 3)
+    return values
+
+
+def run(test, numbers):
+    test.set_pseudo_random_numbers(numbers)
+    test.execute_test()
+    return test
+
+
+@pytest.mark.parametrize('bins, dimensions, overlapping', [(10, 2, False), (10, 3, False), (4, 2, True),
+                                                           (10, 3, True), (6, 4, True)])
+def test_serial_matches_counting_every_tuple(numbers, bins, dimensions, overlapping):
+    test = run(SerialTest(bins, dimensions, overlapping), numbers)
+    _, counts, statistic, degrees_of_freedom = reference_serial(numbers.tolist(), bins, dimensions, overlapping)
+    assert test.tuples == sum(counts.values())
+    assert test.occupied_cells == len(counts)
+    assert test.degrees_of_freedom == degrees_of_freedom
+    assert test.chi_squared == pytest.approx(statistic, rel=1e-9, abs=1e-9)
+
+
+def test_runs_up_down_matches_counting_every_run(numbers):
+    test = run(RunsUpDownTest(), numbers)
+    _, runs, z = reference_runs_up_down(numbers.tolist())
+    assert (test.n, test.runs) == (len(numbers), runs)
+    assert test.z == pytest.approx(z)
+
+
+def test_runs_above_below_matches_counting_every_run(numbers):
+    test = run(RunsAboveBelowTest(), numbers)
+    _, above, runs, z = reference_runs_above_below(numbers.tolist())
+    assert (test.n, test.above, test.below, test.runs) == (len(numbers), above, len(numbers) - above, runs)
+    assert test.z == pytest.approx(z)
+
+
+@pytest.mark.parametrize('max_lag', [1, 3, 10, 40])
+def test_autocorrelation_matches_every_lagged_product(numbers, max_lag):
+    test = run(AutocorrelationTest(max_lag), numbers)
+    _, correlations, statistic = reference_autocorrelation(numbers.tolist(), max_lag)
+    assert test.correlations == pytest.approx(correlations, rel=1e-9, abs=1e-12)
+    assert test.chi_squared == pytest.approx(statistic, rel=1e-9)
+
+
+@pytest.mark.parametrize('lower, upper, max_gap', [(0.0, 0.5, 5), (0.3, 0.35, 10), (0.5, 1.0, 1), (0.25, 0.75, 8)])
+def test_gap_matches_measuring_every_gap(numbers, lower, upper, max_gap):
+    test = run(GapTest(lower, upper, max_gap), numbers)
+    _, observed, expected, statistic = reference_gap(numbers.tolist(), lower, upper, max_gap)
+    assert test.observed_counts.tolist() == observed
+    assert test.expected_counts == pytest.approx(expected)
+    assert test.chi_squared == pytest.approx(statistic)
+
+
+@pytest.mark.parametrize('coupons, max_length', [(5, 20), (3, 8), (2, 3), (10, 40)])
+def test_coupon_matches_collecting_every_segment(numbers, coupons, max_length):
+    test = run(CouponTest(coupons, max_length), numbers)
+    _, observed, expected, statistic = reference_coupon(numbers.tolist(), coupons, max_length)
+    assert test.observed_counts.tolist() == observed
+    assert test.expected_counts == pytest.approx(expected, rel=1e-9, abs=1e-9)
+    assert test.chi_squared == pytest.approx(statistic, rel=1e-6)
@@ -0,0 +1,115 @@
+import numpy as np
+import pytest
+from scipy.stats import chi2
+
+from model.ChiTest import ChiTest
+from model.Tests import Tests
+
+ALPHAS = (0.2, 0.05, 0.01, 0.001)
+# Pruebas cuyo veredicto es exactamente p_value > alpha; los límites de varianza y KS se redondean
+EXACT_LIMITS = ('mean', 'chi', 'poker', 'serial', 'runs_up_down', 'runs_above_below', 'autocorrelation', 'gap',
+                'coupon')
+
+
+@pytest.fixture(scope='module')
+def numbers():
+    # Un leve sesgo reparte los valores p entre los niveles
+    return np.random.default_rng(25).random(40000) ** 1.01
+
+
+def run_all(tests):
+    return {test_name: (getattr(tests, f'execute_{test_name}_test')(), tests.describe_test(test_name))
+            for test_name in Tests.TEST_NAMES}
+
+
+def fresh_results(numbers, alpha):
+    tests = Tests()
+    tests.alpha = alpha
+    tests.set_pseudo_random_numbers(numbers)
+    return run_all(tests)
+
+
+def forbid_execution(monkeypatch, tests):
+    """Hace fallar cualquier cálculo de un estadístico, para comprobar que solo se evalúan umbrales."""
+    def fail():
+        raise AssertionError("Se recorrió la muestra")
+    for attribute, execute_method, _ in Tests.TEST_METHODS.values():
+        monkeypatch.setattr(getattr(tests, attribute), execute_method, fail)
+
+
+def test_set_alpha_reevaluates_without_reading_the_sample(numbers, monkeypatch):
+    tests = Tests()
+    tests.set_pseudo_random_numbers(numbers)
+    run_all(tests)
+    forbid_execution(monkeypatch, tests)
+    for alpha in ALPHAS:
+        expected = fresh_results(numbers, alpha)
+        verdicts = tests.set_alpha(alpha)
+        assert verdicts == {test_name: bool(passed) for test_name, (passed, _) in expected.items()}
+        assert run_all(tests) == pytest.approx(expected)
+
+
+def test_set_alpha_rejects_levels_outside_zero_and_one():
+    tests = Tests()
+    for alpha in (0, 1, -0.1, 1.5):
+        with pytest.raises(ValueError):
+            tests.set_alpha(alpha)
+
+
+def test_evaluate_levels_matches_a_run_at_each_level(numbers):
+    tests = Tests()
+    tests.set_pseudo_random_numbers(numbers)
+    before = run_all(tests)
+    expected = {alpha: fresh_results(numbers, alpha) for alpha in ALPHAS}
+    for test_name in Tests.TEST_NAMES:
+        levels = tests.evaluate_levels(test_name, ALPHAS)
+        assert [level['alpha'] for level in levels] == list(ALPHAS)
+        for level in levels:
+            passed, (_, lower_limit, upper_limit) = expected[level['alpha']][test_name]
+            assert level['passed'] == passed
+            assert (level['lower_limit'], level['upper_limit']) == pytest.approx((lower_limit, upper_limit))
+        # La prueba queda evaluada con el nivel de la instancia
+        assert tests.describe_test(test_name) == pytest.approx(before[test_name][1])
+
+
+def test_p_value_agrees_with_the_verdicts(numbers):
+    tests = Tests()
+    tests.set_pseudo_random_numbers(numbers)
+    run_all(tests)
+    verdicts = {alpha: tests.set_alpha(alpha) for alpha in ALPHAS}
+    p_values = {test_name: tests.p_value(test_name) for test_name in Tests.TEST_NAMES}
+    assert all(0 <= p_value <= 1 for p_value in p_values.values())
+    assert {p_value > 0.05 for p_value in p_values.values()} == {True, False}
+    for test_name in EXACT_LIMITS:
+        for alpha in ALPHAS:
+            assert verdicts[alpha][test_name] == (p_values[test_name] > alpha), (test_name, alpha)
+    assert p_values['chi'] == pytest.approx(chi2.sf(tests.chi_test.total_error, 9))
+
+
+def test_changed_parameters_are_not_restored_from_the_cache(numbers):
+    tests = Tests()
+    tests.set_pseudo_random_numbers(numbers)
+    ks_passed = tests.execute_ks_test()
+    ks_statistic = tests.describe_test('ks')
+    tests.execute_chi_test()
+    chi_statistic = tests.describe_test('chi')
+
+    tests.ks_test.intervals_amount = 20
+    assert not tests.is_computed('ks')
+    tests.execute_ks_test()
+    assert tests.ks_test.intervals_amount == 20
+    assert len(tests.ks_test.frequencies) == 20
+    tests.ks_test.intervals_amount = 10
+    assert tests.is_computed('ks')
+    assert tests.execute_ks_test() == ks_passed
+    assert tests.describe_test('ks') == ks_statistic
+
+    tests.chi_test.domain = ChiTest.FIXED_DOMAIN
+    tests.execute_chi_test()
+    assert tests.chi_test.domain == ChiTest.FIXED_DOMAIN
+    expected = Tests()
+    expected.chi_test.domain = ChiTest.FIXED_DOMAIN
+    expected.set_pseudo_random_numbers(numbers)
+    expected.execute_chi_test()
+    assert tests.describe_test('chi') == pytest.approx(expected.describe_test('chi'))
+    assert tests.describe_test('chi') != pytest.approx(chi_statistic)
@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from model.SlidingWindow import SlidingWindow
+from model.Tests import Tests
+
+WINDOW_SIZE = 20000
+STRIDE = 5000
+
+
+def make_tests(overlapping=False):
+    """Crea una batería con la prueba serial por defecto o, con overlapping, de tríos solapados."""
+    tests = Tests()
+    if overlapping:
+        tests.serial_test.overlapping = True
+        tests.serial_test.dimensions = 3
+    return tests
+
+
+def evaluate_numbers(numbers, overlapping=False):
+    """Evalúa las pruebas con acumuladores de ventana alimentados solo con numbers."""
+    tests = make_tests(overlapping)
+    parts = tests.create_running_parts()
+    for part in parts.values():
+        part.update(numbers)
+    return tests.evaluate_parts(parts)
+
+
+def evaluate_windows(numbers, window_size, stride, chunk_size, overlapping=False):
+    window = SlidingWindow(make_tests(overlapping), window_size, stride)
+    results = []
+    for start in range(0, len(numbers), chunk_size):
+        results.extend(window.update(numbers[start:start + chunk_size]))
+    return window, results
+
+
+def assert_matches_fresh_runs(numbers, results, omitted=(), overlapping=False):
+    assert results
+    for result in results:
+        fresh = evaluate_numbers(numbers[result['start']:result['stop']], overlapping)
+        assert result['tests'].keys() == {test_name for test_name in Tests.TEST_NAMES if test_name not in omitted}
+        for test_name, test_result in result['tests'].items():
+            assert test_result['statistic'] == pytest.approx(fresh[test_name]['statistic']), (result['window'],
+                                                                                            test_name)
+            assert test_result['passed'] == fresh[test_name]['passed']
+
+
+@pytest.fixture(scope='module')
+def numbers():
+    # Números repetidos en bloques de tres, para que algunas pruebas fallen y los veredictos también se comparen
+    return np.repeat(np.random.default_rng(14).random(20000), 3)
+
+
+@pytest.fixture(scope='module')
+def windows(numbers):
+    return list(Tests().iter_windows(numbers, WINDOW_SIZE, STRIDE))
+
+
+def test_window_count_and_bounds(numbers, windows):
+    assert [(result['start'], result['stop']) for result in windows] == \
+        [(start, start + WINDOW_SIZE) for start in range(0, len(numbers) - WINDOW_SIZE + 1, STRIDE)]
+
+
+def test_overlapping_windows_match_a_fresh_run_on_each_window(numbers, windows):
+    assert {test['passed'] for result in windows for test in result['tests'].values()} == {True, False}
+    assert_matches_fresh_runs(numbers, windows, omitted=('gap', 'coupon'))
+
+
+def test_overlapping_serial_tuples_match_a_fresh_run_on_each_window(numbers):
+    window, results = evaluate_windows(numbers[:30000], 6000, 1500, 4096, overlapping=True)
+    assert_matches_fresh_runs(numbers, results, window.omitted, overlapping=True)
+
+
+@pytest.mark.parametrize('chunk_size', [1000, 7777, 60000])
+def test_tumbling_windows_evaluate_every_test_on_each_window(numbers, chunk_size):
+    window, results = evaluate_windows(numbers, 7000, None, chunk_size)
+    assert window.omitted == ()
+    assert_matches_fresh_runs(numbers, results)
+
+
+@pytest.mark.parametrize('window_size, stride, overlapping, omitted', [
+    (30, 15, False, ('serial', 'gap', 'coupon')),
+    (40, 20, False, ('gap', 'coupon')),
+    (30, 15, True, ('gap', 'coupon')),
+    (30, 5, True, ('autocorrelation', 'gap', 'coupon')),
+    (12, 1, True, ('serial', 'runs_up_down', 'autocorrelation', 'gap', 'coupon')),
+])
+def test_short_or_misaligned_strides_omit_the_tests_that_would_carry_over(window_size, stride, overlapping, omitted):
+    assert SlidingWindow(make_tests(overlapping), window_size, stride).omitted == omitted
@@ -0,0 +1,40 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from model.StreamIngestor import StreamIngestor
+from model.Tests import Tests
+
+
+class FailingPart:
+    """Acumulador que falla al recibir el primer bloque."""
+    def update(self, chunk):
+        raise RuntimeError("fallo al resumir")
+
+
+@pytest.fixture
+def numbers_file(tmp_path):
+    path = tmp_path / 'numbers.f64'
+    np.random.default_rng(15).random(1 << 18).tofile(path)
+    return str(path)
+
+
+def test_file_source_is_summarized(numbers_file):
+    ingestor = StreamIngestor(Tests(), '<f8')
+    asyncio.run(ingestor.run(numbers_file))
+    snapshot = ingestor.snapshot()
+    assert snapshot['count'] == 1 << 18
+    assert snapshot['tests']['mean']['statistic'] == pytest.approx(np.fromfile(numbers_file).mean())
+
+
+def test_consumer_failure_stops_reading(numbers_file):
+    ingestor = StreamIngestor(Tests(), '<f8', queue_size=2)
+    ingestor.parts['failing'] = FailingPart()
+
+    async def run():
+        # Sin vigilar al consumidor, la lectura se quedaba esperando a que la cola llena se vaciara
+        await asyncio.wait_for(ingestor.run(numbers_file), timeout=10)
+
+    with pytest.raises(RuntimeError, match="fallo al resumir"):
+        asyncio.run(run())
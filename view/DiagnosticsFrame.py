@@ -0,0 +1,108 @@
+from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTableWidget, QTableWidgetItem, \
+    QCheckBox, QFileDialog, QPlainTextEdit, QLabel
+
+
+class DiagnosticsFrame(QWidget):
+    """
+    Pestaña que muestra cuánto tiempo y memoria tomó cada fase de las pruebas ejecutadas.
+
+    Atributos:
+        export_trace_signal (pyqtSignal): Señal emitida con la ruta elegida para guardar la traza de Chrome.
+        clear_signal (pyqtSignal): Señal emitida para descartar las fases registradas.
+        profile_check_box (QCheckBox): Casilla que pide perfilar la próxima ejecución con cProfile y tracemalloc.
+    """
+    COLUMNS = ["Category", "Phase", "Calls", "Wall (ms)", "CPU (ms)", "Memory Δ (MB)"]
+
+    export_trace_signal = pyqtSignal(str)
+    clear_signal = pyqtSignal()
+
+    def __init__(self):
+        """
+        Inicializa una instancia de DiagnosticsFrame.
+        """
+        super().__init__()
+        self.phases_table = None
+        self.export_trace_button = None
+        self.clear_button = None
+        self.profile_check_box = None
+        self.profile_text = None
+        self.create_diagnostics_tab()
+
+    def create_diagnostics_tab(self):
+        """
+        Crea la tabla de fases, los botones y el área del informe de perfilado.
+        """
+        layout = QVBoxLayout()
+        self.setLayout(layout)
+
+        self.phases_table = QTableWidget(0, len(self.COLUMNS))
+        self.phases_table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.phases_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        layout.addWidget(self.phases_table)
+
+        button_layout = QHBoxLayout()
+
+        self.export_trace_button = QPushButton("Export Trace")
+        self.export_trace_button.clicked.connect(self.export_trace)
+        button_layout.addWidget(self.export_trace_button)
+
+        self.clear_button = QPushButton("Clear")
+        self.clear_button.clicked.connect(self.clear_signal)
+        button_layout.addWidget(self.clear_button)
+
+        self.profile_check_box = QCheckBox("Profile next run (cProfile + tracemalloc)")
+        button_layout.addWidget(self.profile_check_box)
+
+        layout.addLayout(button_layout)
+
+        layout.addWidget(QLabel("Profile"))
+        self.profile_text = QPlainTextEdit()
+        self.profile_text.setReadOnly(True)
+        self.profile_text.setStyleSheet("font-family: monospace; font-size: 11px;")
+        layout.addWidget(self.profile_text)
+
+    def export_trace(self):
+        """
+        Pide la ruta del archivo de la traza y la envía al presentador.
+        """
+        file_name, _ = QFileDialog.getSaveFileName(self, "Export Trace", "trace.json", "Chrome Trace (*.json)")
+        if file_name:
+            self.export_trace_signal.emit(file_name)
+
+    def set_phases(self, phases):
+        """
+        Muestra las fases registradas.
+
+        Args:
+            phases (list): Fases agrupadas, como las devuelve Instrumentation.summary.
+        """
+        self.phases_table.setRowCount(len(phases))
+        for row, phase in enumerate(phases):
+            memory = "" if phase['memory_delta'] is None else f"{phase['memory_delta'] / 2 ** 20:.2f}"
+            values = [phase['category'], phase['name'], str(phase['calls']), f"{phase['wall'] * 1e3:.2f}",
+                      f"{phase['cpu'] * 1e3:.2f}", memory]
+            for column, value in enumerate(values):
+                self.phases_table.setItem(row, column, QTableWidgetItem(value))
+        self.phases_table.resizeColumnsToContents()
+
+    def set_profile_report(self, report):
+        """
+        Muestra el informe de la ejecución perfilada.
+
+        Args:
+            report (dict): Informe devuelto por Instrumentation.profile.
+        """
+        lines = []
+        if report['profile_path']:
+            lines.append(f"cProfile stats saved to {report['profile_path']}")
+        lines.append(report['functions'])
+        if report['peak_bytes'] is not None:
+            lines.append(f"Peak traced memory: {report['peak_bytes'] / 2 ** 20:.2f} MB")
+        if report['allocations']:
+            lines.append("Largest allocations alive at the end:")
+            for allocation in report['allocations']:
+                lines.append(f"{allocation['bytes'] / 2 ** 20:10.2f} MB {allocation['blocks']:8d} blocks  "
+                             f"{allocation['file']}:{allocation['line']}")
+        self.profile_text.setPlainText("\n".join(lines))
+        self.profile_check_box.setChecked(False)
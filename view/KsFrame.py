@@ -13,7 +13,7 @@ class KsTab(BaseTestTab):
 
         Define los nombres de las pruebas y los resultados iniciales para la prueba de Kolmogorov-Smirnov.
         """
-        test_names = ["DMax", "DMaxP"]
+        test_names = ["DMax", "DMaxP", "D exact", "D critical", "p-value", "Exact test"]
         self.test_results = self.initialize_test_results(len(test_names))
         super().__init__(test_names, self.test_results)
 
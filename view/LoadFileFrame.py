@@ -1,28 +1,26 @@
 from PyQt6.QtCore import pyqtSignal
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QPushButton, QFileDialog, QTableWidget, QTableWidgetItem, QHBoxLayout, \
-    QSpacerItem, QSizePolicy
+    QSpacerItem, QSizePolicy, QLabel, QProgressBar, QComboBox
+
+from model.Constants import Constants
+from model.util.DataLoader import DataLoader
 
 
 def load_data(file_path):
     """
-    Carga datos desde un archivo JSON.
+    Carga datos desde un archivo JSON, .npy, binario crudo o Parquet/Arrow.
 
     Args:
-        file_path (str): Ruta del archivo JSON.
+        file_path (str): Ruta del archivo.
 
     Returns:
-        list: Lista de números cargados del archivo.
+        numpy.ndarray | NormalizedArray: Números cargados del archivo.
 
     Raises:
         ValueError: Si el formato del archivo no es compatible.
     """
-    import json
-    if file_path.endswith('.json'):
-        with open(file_path, 'r') as file:
-            data = json.load(file)
-        return data['numbers']
-    else:
-        raise ValueError("Unsupported file format")
+    numbers, _ = DataLoader.load(file_path)
+    return numbers
 
 
 class LoadFileFrame(QWidget):
@@ -30,11 +28,13 @@ class LoadFileFrame(QWidget):
     Widget para cargar archivos y visualizar el estado de las pruebas.
 
     Atributos:
-        load_file_signal (pyqtSignal): Señal emitida cuando se carga un archivo con éxito.
+        load_file_signal (pyqtSignal): Señal emitida con el arreglo de números cuando se carga un archivo con éxito.
         run_tests_signal (pyqtSignal): Señal emitida para ejecutar todas las pruebas.
+        alpha_changed_signal (pyqtSignal): Señal emitida con el nuevo nivel de significancia elegido.
     """
-    load_file_signal = pyqtSignal(list)
+    load_file_signal = pyqtSignal(object)
     run_tests_signal = pyqtSignal()
+    alpha_changed_signal = pyqtSignal(float)
 
     def __init__(self):
         """
@@ -46,6 +46,10 @@ class LoadFileFrame(QWidget):
         self.file_data_table = None
         self.load_file_button = None
         self.file_data = None
+        self.load_stats_label = None
+        self.cancel_tests_button = None
+        self.progress_bar = None
+        self.alpha_combo_box = None
         self.create_load_file_tab()
 
     def create_load_file_tab(self):
@@ -68,15 +72,38 @@ class LoadFileFrame(QWidget):
         self.run_all_tests_button.clicked.connect(self.run_tests_signal)
         button_layout.addWidget(self.run_all_tests_button)
 
+        self.cancel_tests_button = QPushButton("Cancel")
+        self.cancel_tests_button.setEnabled(False)
+        button_layout.addWidget(self.cancel_tests_button)
+
+        button_layout.addWidget(QLabel("Alpha"))
+        self.alpha_combo_box = QComboBox()
+        for alpha in Constants.ALPHAS:
+            self.alpha_combo_box.addItem(str(alpha), alpha)
+        self.alpha_combo_box.currentIndexChanged.connect(
+            lambda index: self.alpha_changed_signal.emit(self.alpha_combo_box.itemData(index)))
+        button_layout.addWidget(self.alpha_combo_box)
+
         layout.addLayout(button_layout)
 
-        self.tests_status_table = QTableWidget(5, 2)
-        self.tests_status_table.setHorizontalHeaderLabels(["Test Name", "Status"])
+        self.load_stats_label = QLabel()
+        self.load_stats_label.setStyleSheet("font-size: 12px;")
+        layout.addWidget(self.load_stats_label)
+
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setVisible(False)
+        layout.addWidget(self.progress_bar)
+
+        test_names = ["Mean Test", "Variance Test", "Ks Test", "Chi Test", "Poker Test", "Serial Test",
+                      "Runs Up/Down Test", "Runs Above/Below Test", "Autocorrelation Test", "Gap Test",
+                      "Coupon Collector Test"]
+        self.tests_status_table = QTableWidget(len(test_names), 3)
+        self.tests_status_table.setHorizontalHeaderLabels(["Test Name", "Status", "P-value"])
 
-        test_names = ["Mean Test", "Variance Test", "Ks Test", "Chi Test", "Poker Test"]
         for i, test_name in enumerate(test_names):
             self.tests_status_table.setItem(i, 0, QTableWidgetItem(test_name))
             self.tests_status_table.setItem(i, 1, QTableWidgetItem("Not Run"))
+            self.tests_status_table.setItem(i, 2, QTableWidgetItem(""))
 
         # Deshabilita la edición y la selección para toda la tabla
         self.tests_status_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
@@ -94,10 +121,13 @@ class LoadFileFrame(QWidget):
         """
         Abre un cuadro de diálogo para seleccionar y cargar un archivo, y actualiza la tabla de datos.
         """
-        file_name, _ = QFileDialog.getOpenFileName(self, "Open File", "", "JSON Files (*.json)")
+        file_name, _ = QFileDialog.getOpenFileName(
+            self, "Open File", "",
+            "Number Files (*.json *.npy *.f64 *.f32 *.u32 *.u64 *.parquet *.arrow *.feather *.ipc);;JSON Files (*.json)")
         if file_name:
             try:
-                self.file_data = load_data(file_name)
+                self.file_data, load_stats = DataLoader.load(file_name)
+                self.load_stats_label.setText(DataLoader.describe_throughput(load_stats))
                 self.update_file_data_table()
                 self.load_file_signal.emit(self.file_data)
             except Exception as e:
@@ -110,7 +140,7 @@ class LoadFileFrame(QWidget):
         try:
             self.file_data_table.clear()
 
-            if not self.file_data:  # If there's no data, there's nothing to update
+            if self.file_data is None or not len(self.file_data):  # If there's no data, there's nothing to update
                 return
 
             # Limit the number of data to display to 100
@@ -135,4 +165,57 @@ class LoadFileFrame(QWidget):
             test_index (int): Índice de la prueba cuyo estado se va a actualizar.
             status (str): Nuevo estado de la prueba, por ejemplo "Passed" o "Failed".
         """
-        self.tests_status_table.setItem(test_index, 1, QTableWidgetItem(status))
\ No newline at end of file
+        self.tests_status_table.setItem(test_index, 1, QTableWidgetItem(status))
+
+    def set_p_value(self, test_index, p_value):
+        """
+        Muestra el valor p de una prueba en la tabla de estado de las pruebas.
+
+        Args:
+            test_index (int): Índice de la prueba.
+            p_value (float): Valor p de la prueba, o None para dejar la celda vacía.
+        """
+        self.tests_status_table.setItem(test_index, 2, QTableWidgetItem("" if p_value is None else f"{p_value:.4g}"))
+
+    def get_status(self, test_index):
+        """
+        Obtiene el estado de una prueba en la tabla de estado de las pruebas.
+
+        Args:
+            test_index (int): Índice de la prueba.
+
+        Returns:
+            str: Estado de la prueba.
+        """
+        return self.tests_status_table.item(test_index, 1).text()
+
+    def set_progress(self, text, percent):
+        """
+        Muestra el avance del recorrido de la muestra en la barra de progreso.
+
+        Args:
+            text (str): Descripción de la tarea en curso.
+            percent (int): Porcentaje recorrido, o -1 si no se conoce el tamaño de la muestra.
+        """
+        if percent < 0:
+            # Un rango vacío muestra la barra en modo indeterminado
+            self.progress_bar.setRange(0, 0)
+        else:
+            self.progress_bar.setRange(0, 100)
+            self.progress_bar.setValue(percent)
+        self.progress_bar.setFormat(f"{text} %p%")
+        self.progress_bar.setVisible(True)
+
+    def set_tests_running(self, running):
+        """
+        Habilita o deshabilita los botones mientras hay pruebas en curso.
+
+        Args:
+            running (bool): True si hay pruebas en ejecución.
+        """
+        self.load_file_button.setEnabled(not running)
+        self.run_all_tests_button.setEnabled(not running)
+        self.cancel_tests_button.setEnabled(running)
+        self.alpha_combo_box.setEnabled(not running)
+        if not running:
+            self.progress_bar.setVisible(False)
@@ -1,11 +1,19 @@
+from PyQt6.QtCore import pyqtSignal
 from PyQt6.QtGui import QIcon
 from PyQt6.QtWidgets import QMainWindow, QTabWidget, QWidget, QVBoxLayout
 
+from view.AutocorrelationFrame import AutocorrelationTab
 from view.ChiFrame import ChiTab
+from view.CouponFrame import CouponTab
+from view.DiagnosticsFrame import DiagnosticsFrame
+from view.GapFrame import GapTab
 from view.KsFrame import KsTab
 from view.LoadFileFrame import LoadFileFrame
 from view.MeanFrame import MeanTab
 from view.PokerFrame import PokerTab
+from view.RunsAboveBelowFrame import RunsAboveBelowTab
+from view.RunsUpDownFrame import RunsUpDownTab
+from view.SerialFrame import SerialTab
 from view.VarianceFrame import VarianceTab
 
 
@@ -13,8 +21,22 @@ class MainFrame(QMainWindow):
     """
     Clase que representa la ventana principal de la aplicación.
 
-    Contiene pestañas para cargar archivos, realizar pruebas estadísticas y mostrar los resultados.
+    Contiene pestañas para cargar archivos, realizar pruebas estadísticas y mostrar los resultados. Las pestañas de
+    las pruebas se construyen la primera vez que se muestran; los resultados que llegan antes se guardan y se
+    aplican al construirlas.
+
+    Atributos:
+        tab_created (pyqtSignal): Señal emitida con el índice y la pestaña de una prueba cuando se construye.
+        test_tabs (list): Pestañas de las pruebas ya construidas, o None para las que todavía no se muestran.
+        diagnostics_tab (DiagnosticsFrame): Pestaña con los tiempos y la memoria de cada fase de las pruebas.
     """
+    TEST_TABS = ((MeanTab, "Mean Test"), (VarianceTab, "Variance Test"), (KsTab, "KS Test"), (ChiTab, "Chi Test"),
+                 (PokerTab, "Poker Test"), (SerialTab, "Serial Test"), (RunsUpDownTab, "Runs Up/Down Test"),
+                 (RunsAboveBelowTab, "Runs Above/Below Test"), (AutocorrelationTab, "Autocorrelation Test"),
+                 (GapTab, "Gap Test"), (CouponTab, "Coupon Collector Test"))
+
+    tab_created = pyqtSignal(int, object)
+
     def __init__(self):
         """
         Inicializa una instancia de MainFrame.
@@ -22,13 +44,70 @@ class MainFrame(QMainWindow):
         super().__init__()
         self.selected_file = None
         self.load_file_tab = LoadFileFrame()
-        self.variance_tab = VarianceTab()
-        self.mean_tab = MeanTab()
-        self.ks_tab = KsTab()
-        self.chi_tab = ChiTab()
-        self.poker_tab = PokerTab()
+        self.diagnostics_tab = DiagnosticsFrame()
+        self.tab_widget = None
+        self.test_tabs = [None] * len(self.TEST_TABS)
+        self.tab_containers = []
+        self.pending_labels = {}
+        self.pending_results = {}
+        self.tests_running = False
         self.setup_ui()
 
+    @property
+    def mean_tab(self):
+        """Obtiene la pestaña de la prueba de media, construyéndola si hace falta."""
+        return self.create_test_tab(0)
+
+    @property
+    def variance_tab(self):
+        """Obtiene la pestaña de la prueba de varianza, construyéndola si hace falta."""
+        return self.create_test_tab(1)
+
+    @property
+    def ks_tab(self):
+        """Obtiene la pestaña de la prueba de Kolmogorov-Smirnov, construyéndola si hace falta."""
+        return self.create_test_tab(2)
+
+    @property
+    def chi_tab(self):
+        """Obtiene la pestaña de la prueba de chi-cuadrado, construyéndola si hace falta."""
+        return self.create_test_tab(3)
+
+    @property
+    def poker_tab(self):
+        """Obtiene la pestaña de la prueba de póker, construyéndola si hace falta."""
+        return self.create_test_tab(4)
+
+    @property
+    def serial_tab(self):
+        """Obtiene la pestaña de la prueba serial, construyéndola si hace falta."""
+        return self.create_test_tab(5)
+
+    @property
+    def runs_up_down_tab(self):
+        """Obtiene la pestaña de la prueba de corridas arriba y abajo, construyéndola si hace falta."""
+        return self.create_test_tab(6)
+
+    @property
+    def runs_above_below_tab(self):
+        """Obtiene la pestaña de la prueba de corridas respecto a la media, construyéndola si hace falta."""
+        return self.create_test_tab(7)
+
+    @property
+    def autocorrelation_tab(self):
+        """Obtiene la pestaña de la prueba de autocorrelación, construyéndola si hace falta."""
+        return self.create_test_tab(8)
+
+    @property
+    def gap_tab(self):
+        """Obtiene la pestaña de la prueba de huecos, construyéndola si hace falta."""
+        return self.create_test_tab(9)
+
+    @property
+    def coupon_tab(self):
+        """Obtiene la pestaña de la prueba del coleccionista de cupones, construyéndola si hace falta."""
+        return self.create_test_tab(10)
+
     def setup_ui(self):
         """
         Configura la interfaz de usuario de la ventana principal.
@@ -47,16 +126,52 @@ class MainFrame(QMainWindow):
         central_widget.setLayout(main_layout)
 
         # Crea un QTabWidget para contener las pestañas
-        tab_widget = QTabWidget()
-        main_layout.addWidget(tab_widget)
+        self.tab_widget = QTabWidget()
+        main_layout.addWidget(self.tab_widget)
+
+        # Añade las pestañas al QTabWidget; las de las pruebas empiezan vacías
+        self.tab_widget.addTab(self.load_file_tab, "Load File")
+        for _, title in self.TEST_TABS:
+            container = QWidget()
+            container.setLayout(QVBoxLayout())
+            container.layout().setContentsMargins(0, 0, 0, 0)
+            self.tab_containers.append(container)
+            self.tab_widget.addTab(container, title)
+        self.tab_widget.addTab(self.diagnostics_tab, "Diagnostics")
+        self.tab_widget.currentChanged.connect(self.on_current_tab_changed)
 
-        # Añade las pestañas al QTabWidget
-        tab_widget.addTab(self.load_file_tab, "Load File")
-        tab_widget.addTab(self.mean_tab, "Mean Test")
-        tab_widget.addTab(self.variance_tab, "Variance Test")
-        tab_widget.addTab(self.ks_tab, "KS Test")
-        tab_widget.addTab(self.chi_tab, "Chi Test")
-        tab_widget.addTab(self.poker_tab, "Poker Test")
+    def on_current_tab_changed(self, index):
+        """
+        Construye la pestaña de una prueba la primera vez que se muestra.
+
+        Args:
+            index (int): Índice de la pestaña mostrada en el QTabWidget.
+        """
+        if 0 < index <= len(self.TEST_TABS):
+            self.create_test_tab(index - 1)
+
+    def create_test_tab(self, tab_num):
+        """
+        Obtiene la pestaña de una prueba, construyéndola y aplicando los resultados pendientes si aún no existe.
+
+        Args:
+            tab_num (int): Número de la prueba, en el orden de TEST_TABS.
+
+        Returns:
+            BaseTestTab: Pestaña de la prueba.
+        """
+        if self.test_tabs[tab_num] is None:
+            tab_class, _ = self.TEST_TABS[tab_num]
+            tab = tab_class()
+            self.tab_containers[tab_num].layout().addWidget(tab)
+            self.test_tabs[tab_num] = tab
+            tab.run_tests_button.setEnabled(not self.tests_running)
+            if tab_num in self.pending_labels:
+                tab.set_result_label(self.pending_labels.pop(tab_num))
+            if tab_num in self.pending_results:
+                tab.set_test_results(self.pending_results.pop(tab_num))
+            self.tab_created.emit(tab_num, tab)
+        return self.test_tabs[tab_num]
 
     def display_result(self, tab_num, test_result):
         """
@@ -66,28 +181,35 @@ class MainFrame(QMainWindow):
             tab_num (int): Número de la pestaña en la que se mostrará el resultado.
             test_result (str): Resultado de la prueba a mostrar.
         """
-        if tab_num == 0:
-            self.mean_tab.set_result_label(test_result)
-        elif tab_num == 1:
-            self.variance_tab.set_result_label(test_result)
-        elif tab_num == 2:
-            self.ks_tab.set_result_label(test_result)
-        elif tab_num == 3:
-            self.chi_tab.set_result_label(test_result)
-        elif tab_num == 4:
-            self.poker_tab.set_result_label(test_result)
-        else:
+        if not 0 <= tab_num < len(self.test_tabs):
             print("Pestaña no válida")
+        elif self.test_tabs[tab_num] is None:
+            self.pending_labels[tab_num] = test_result
+        else:
+            self.test_tabs[tab_num].set_result_label(test_result)
+
+    def set_test_results(self, tab_num, test_results):
+        """
+        Muestra los valores calculados por una prueba en la pestaña correspondiente.
+
+        Args:
+            tab_num (int): Número de la pestaña.
+            test_results (list): Valores calculados por la prueba.
+        """
+        if self.test_tabs[tab_num] is None:
+            self.pending_results[tab_num] = test_results
+        else:
+            self.test_tabs[tab_num].set_test_results(test_results)
 
-    def run_all_tests(self, test_functions):
+    def set_tests_running(self, running):
         """
-        Ejecuta todas las pruebas estadísticas y actualiza los resultados en la interfaz de usuario.
+        Habilita o deshabilita los botones que cargan archivos y ejecutan pruebas mientras hay pruebas en curso.
 
         Args:
-            test_functions (list): Lista de funciones de prueba a ejecutar.
+            running (bool): True si hay pruebas en ejecución.
         """
-        test_functions = test_functions
-        for i, test_function in enumerate(test_functions):
-            test_passed = test_function()
-            status = "Passed" if test_passed else "Failed"
-            self.load_file_tab.update_status(i, status)
+        self.tests_running = running
+        for tab in self.test_tabs:
+            if tab is not None:
+                tab.run_tests_button.setEnabled(not running)
+        self.load_file_tab.set_tests_running(running)
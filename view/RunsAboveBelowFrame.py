@@ -0,0 +1,30 @@
+from view.BaseTestTab import BaseTestTab
+
+
+class RunsAboveBelowTab(BaseTestTab):
+    """
+    Clase que representa la pestaña de la prueba de corridas arriba y abajo de la media en la interfaz gráfica.
+
+    Hereda de BaseTestTab y se especializa para mostrar los resultados específicos de la prueba de
+    corridas arriba y abajo de la media.
+    """
+    def __init__(self):
+        """
+        Inicializa una instancia de RunsAboveBelowTab.
+
+        Define los nombres de las pruebas y los resultados iniciales para la prueba de
+        corridas arriba y abajo de la media.
+        """
+        test_names = ["Debajo de 0.5", "Encima de 0.5", "Corridas", "Media", "Varianza", "Z", "Z crítico"]
+        self.test_results = self.initialize_test_results(len(test_names))
+        super().__init__(test_names, self.test_results)
+
+    def set_test_results(self, test_results):
+        """
+        Establece los resultados de la prueba de corridas arriba y abajo de la media y actualiza la interfaz gráfica.
+
+        Args:
+            test_results (list): Lista de resultados de la prueba de corridas arriba y abajo de la media.
+        """
+        self.test_results = test_results
+        super().set_test_results(test_results)
@@ -0,0 +1,28 @@
+from view.BaseTestTab import BaseTestTab
+
+
+class SerialTab(BaseTestTab):
+    """
+    Clase que representa la pestaña de la prueba serial en la interfaz gráfica.
+
+    Hereda de BaseTestTab y se especializa para mostrar los resultados específicos de la prueba serial.
+    """
+    def __init__(self):
+        """
+        Inicializa una instancia de SerialTab.
+
+        Define los nombres de las pruebas y los resultados iniciales para la prueba serial.
+        """
+        test_names = ["Tuplas", "Celdas no vacías", "Grados de libertad", "Ψ^2", "Chi inverso"]
+        self.test_results = self.initialize_test_results(len(test_names))
+        super().__init__(test_names, self.test_results)
+
+    def set_test_results(self, test_results):
+        """
+        Establece los resultados de la prueba serial y actualiza la interfaz gráfica.
+
+        Args:
+            test_results (list): Lista de resultados de la prueba serial.
+        """
+        self.test_results = test_results
+        super().set_test_results(test_results)